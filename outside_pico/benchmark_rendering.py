@@ -0,0 +1,372 @@
+"""
+Benchmark of rendering in src.epaper on host CPython with stand-ins of MicroPython modules (outside_pico/simulator).
+Every scenario is checked against golden 1-bit frames stored in outside_pico/golden_frames, so optimizations cannot
+silently change pixels. Results are written to a JSON file which can be compared with results of another commit.
+
+Run from the repository root:
+    python3 outside_pico/benchmark_rendering.py --output results.json [--compare previous_results.json]
+Golden frames are regenerated (after an intended change of the rendered content) with --update-golden.
+NOTE: text drawn with the built-in font uses placeholder glyphs of the framebuf stand-in.
+"""
+import argparse
+import gzip
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+OUTSIDE_PICO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(OUTSIDE_PICO)
+
+from simulator.clock import VirtualClock
+from simulator.epd_model import EPaperModel
+from simulator.simulation import install_modules, uninstall_modules, EPD_SPI
+
+GOLDEN_FRAMES_DIRECTORY = os.path.join(OUTSIDE_PICO, 'golden_frames')
+REPEATS = 5
+
+DISPLAY_WIDTH = 128
+DISPLAY_HEIGHT = 296
+MAP_PREVIEW_SIZE = 128 * 128 // 8
+
+
+class Recorder:
+    """
+    Collects durations of measured calls and frames produced by a single run of a scenario
+    """
+
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock
+        self.durations: list[int] = []
+        # (width, height, frame) of captured frames
+        self.frames: list[tuple[int, int, bytes]] = []
+
+    def measure(self, function: callable, *args):
+        start = time.perf_counter_ns()
+        result = function(*args)
+        self.durations.append((time.perf_counter_ns() - start) // 1000)
+        return result
+
+    def capture(self, frame: bytes, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+        self.frames.append((width, height, bytes(frame)))
+
+    def capture_display(self, epaper, display: EPaperModel):
+        """
+        Lets the display finish its refresh, transmits pending frame and captures content of the display RAM
+        """
+        self.clock.advance(EPaperModel.FULL_REFRESH_US)
+        epaper.update()
+        self.clock.advance(EPaperModel.FULL_REFRESH_US)
+        self.capture(display.ram)
+
+
+def map_preview(seed: int):
+    return bytes(((index + seed) * 37 >> 3) & 0xff for index in range(MAP_PREVIEW_SIZE))
+
+
+def ride_progress(minutes: int):
+    return {
+        'rideDuration': minutes * 60000.,
+        'timeInMotion': minutes * 52000.,
+        'traveledDistance': minutes * 0.37,
+        'altitudeChange': {
+            'up': minutes * 2.4,
+            'down': minutes * 2.1
+        }
+    }
+
+
+def gps_statistics(step: int):
+    return {
+        'altitude': 200 + 30 * math.sin(step / 5),
+        'slope': 5 * math.cos(step / 5),
+        'heading': step * 10 % 360,
+        'turnDistance': max(0., 300 - step * 20 % 400),
+        'turnAngle': math.pi / 2
+    }
+
+
+def new_epaper(recorder: Recorder):
+    from src.epaper.epaper import Epaper
+    from src.epaper.epd_2in9 import EPD_2in9
+
+    display = EPaperModel(recorder.clock, EPD_SPI, EPD_2in9.DC_PIN, EPD_2in9.CS_PIN, EPD_2in9.BUSY_PIN)
+    return Epaper(), display
+
+
+# Scenarios
+
+def font_draw(recorder: Recorder):
+    import framebuf
+    from src.epaper.font import Font
+    from src.epaper.images import Images
+
+    digits = Font(Images.DIGITS_104PX)
+    common = Font(Images.COMMON_24PX)
+
+    for font, texts, height, offset_y in (
+            (digits, [f'{speed}' for speed in range(0, 61)], 104, 88),
+            (common, [f'{temperature}°C' for temperature in range(-10, 36, 3)], 24, 24)
+    ):
+        buffer = bytearray([0xff] * (DISPLAY_WIDTH * height // 8))
+        frame_buffer = framebuf.FrameBuffer(buffer, DISPLAY_WIDTH, height, framebuf.MONO_HLSB)
+        for text in texts:
+            frame_buffer.fill(1)
+            recorder.measure(font.draw, text, frame_buffer, DISPLAY_WIDTH, height, 0, offset_y)
+            recorder.capture(buffer, DISPLAY_WIDTH, height)
+
+
+def draw_text(recorder: Recorder):
+    epaper, display = new_epaper(recorder)
+    recorder.measure(epaper.draw_logo)
+    recorder.capture_display(epaper, display)
+
+    top = epaper.height // 2 - 64 + 32
+    for text in (
+            'Cyclocomputer',
+            'Cyclocomputer\nMade by Aktyn',
+            'Cyclocomputer\nMade by Aktyn\n\nWaiting for\nphone connection\nor speed results',
+            'Cyclocomputer\nMade by Aktyn',
+            'Cyclocomputer\nMade by Aktyn\n\nWaiting for\nphone connection\nor speed results'
+    ):
+        recorder.measure(epaper.draw_text, text, top)
+        recorder.capture_display(epaper, display)
+
+
+def draw_static_area(recorder: Recorder):
+    epaper, display = new_epaper(recorder)
+    recorder.measure(epaper.draw_static_area, 21.4, 0., 0., '-', 1., False, True)
+    recorder.capture_display(epaper, display)
+
+    for step in range(1, 25):
+        recorder.measure(
+            epaper.draw_static_area,
+            21.4 + step * 0.4, step * 35. % 360, 2. + step * 0.3, 'Simulated City' if step < 12 else 'Warsaw',
+            1. - step * 0.04, step % 6 == 0, step % 8 == 0
+        )
+        recorder.capture_display(epaper, display)
+
+    for level in range(100, -1, -5):
+        recorder.measure(epaper.draw_battery, level / 100, False)
+        recorder.capture_display(epaper, display)
+
+
+def speed_sweep(recorder: Recorder):
+    epaper, display = new_epaper(recorder)
+    epaper.draw_static_area(21.4, 90., 3.5, 'Simulated City', 0.8, False, True)
+    map_image = map_preview(0)
+    speeds = [step / 2 for step in range(0, 121)] + [step / 2 for step in range(120, -1, -3)]
+    for step, speed in enumerate(speeds):
+        recorder.measure(
+            epaper.draw_real_time_data, speed, ride_progress(0), gps_statistics(step // 10), map_image, 90., True
+        )
+        recorder.capture_display(epaper, display)
+
+
+def ride_progress_screen(recorder: Recorder):
+    epaper, display = new_epaper(recorder)
+    epaper.draw_static_area(21.4, 90., 3.5, 'Simulated City', 0.8, False, True)
+    map_image = map_preview(0)
+    for minutes in range(1, 61):
+        # Bike stops every few minutes, ride progress is displayed instead of the speed
+        speed = 0. if minutes % 4 == 0 else 18. + minutes % 7
+        recorder.measure(
+            epaper.draw_real_time_data, speed, ride_progress(minutes), gps_statistics(minutes), map_image, 90., True
+        )
+        recorder.capture_display(epaper, display)
+
+
+def map_updates(recorder: Recorder):
+    epaper, display = new_epaper(recorder)
+    epaper.draw_static_area(21.4, 90., 3.5, 'Simulated City', 0.8, False, True)
+    for step in range(40):
+        # Connection is lost for a while, bluetooth off image replaces the map
+        connected = not 20 <= step < 24
+        recorder.measure(
+            epaper.draw_real_time_data, 25., ride_progress(0), gps_statistics(0), map_preview(step), 135., connected
+        )
+        recorder.capture_display(epaper, display)
+
+
+def buffer_reversal(recorder: Recorder):
+    from src.epaper.common import reverse_bits, reverse_bytes, rotate_180, reverse_bytearray
+
+    epaper, display = new_epaper(recorder)
+    epaper.draw_static_area(21.4, 90., 3.5, 'Simulated City', 0.8, False, True)
+    epaper.draw_real_time_data(25., ride_progress(0), gps_statistics(0), map_preview(0), 90., True)
+    recorder.capture_display(epaper, display)
+    frame = bytearray(display.ram)
+
+    for _ in range(10):
+        recorder.capture(recorder.measure(reverse_bytearray, frame))
+        recorder.measure(rotate_180, frame)
+        recorder.capture(frame)
+        recorder.measure(rotate_180, frame, 0, len(frame) // 2)
+        recorder.capture(frame)
+        recorder.measure(reverse_bits, frame)
+        recorder.capture(frame)
+        recorder.measure(reverse_bytes, frame)
+        recorder.capture(frame)
+
+
+SCENARIOS = {
+    'font_draw': font_draw,
+    'draw_text': draw_text,
+    'draw_static_area': draw_static_area,
+    'speed_sweep': speed_sweep,
+    'ride_progress_screen': ride_progress_screen,
+    'map_updates': map_updates,
+    'buffer_reversal': buffer_reversal,
+}
+
+
+# Golden frames are stored as gzipped sequences of binary PBM images (in buffer orientation)
+
+def write_frames(path: str, frames: list[tuple[int, int, bytes]]):
+    with gzip.open(path, 'wb') as file:
+        for width, height, frame in frames:
+            # PBM uses 1 for black pixels
+            file.write(f'P4\n{width} {height}\n'.encode('ascii') + bytes(0xff ^ value for value in frame))
+
+
+def read_frames(path: str):
+    with gzip.open(path, 'rb') as file:
+        data = file.read()
+
+    frames: list[tuple[int, int, bytes]] = []
+    offset = 0
+    while offset < len(data):
+        magic, size, rest = data[offset:].split(b'\n', 2)
+        if magic != b'P4':
+            raise ValueError(f"Invalid golden frames file: {path}")
+        width, height = (int(value) for value in size.split())
+        frame_size = (width + 7) // 8 * height
+        frames.append((width, height, bytes(0xff ^ value for value in rest[:frame_size])))
+        offset = len(data) - len(rest) + frame_size
+    return frames
+
+
+def check_golden_frames(name: str, frames: list[tuple[int, int, bytes]], update: bool, output_directory: str):
+    path = os.path.join(GOLDEN_FRAMES_DIRECTORY, f'{name}.pbm.gz')
+    if update:
+        write_frames(path, frames)
+        return 'updated'
+    if not os.path.exists(path):
+        return 'missing'
+
+    golden_frames = read_frames(path)
+    if golden_frames == frames:
+        return 'match'
+
+    actual_path = os.path.join(output_directory, f'{name}.actual.pbm.gz')
+    write_frames(actual_path, frames)
+    if len(golden_frames) != len(frames):
+        print(f"{name}: expected {len(golden_frames)} frames, got {len(frames)}; frames saved to {actual_path}")
+        return 'mismatch'
+    for index, ((_, _, golden_frame), (_, _, frame)) in enumerate(zip(golden_frames, frames)):
+        if golden_frame != frame:
+            pixels = sum(bin(a ^ b).count('1') for a, b in zip(golden_frame, frame))
+            print(f"{name}: frame {index} differs from the golden one in {pixels} pixels; saved to {actual_path}")
+            break
+    return 'mismatch'
+
+
+def run_scenario(scenario: callable, repeats: int):
+    """
+    :return: durations (in microseconds) of measured calls of every repeat and frames of the first one
+    """
+    durations: list[list[int]] = []
+    frames: list[tuple[int, int, bytes]] = []
+    for repeat in range(repeats):
+        clock = VirtualClock()
+        installed_modules = install_modules(clock)
+        try:
+            recorder = Recorder(clock)
+            scenario(recorder)
+        finally:
+            uninstall_modules(installed_modules)
+        durations.append(recorder.durations)
+        if repeat == 0:
+            frames = recorder.frames
+    return durations, frames
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=OUTSIDE_PICO, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks rendering of src.epaper and checks golden frames")
+    parser.add_argument('--output', type=str, default='benchmark_rendering.json', help="path of JSON results")
+    parser.add_argument('--compare', type=str, default=None, help="path of JSON results to compare with")
+    parser.add_argument('--repeats', type=int, default=REPEATS, help="number of runs of every scenario")
+    parser.add_argument('--scenario', type=str, action='append', choices=list(SCENARIOS.keys()),
+                        help="scenario to run (all by default)")
+    parser.add_argument('--update-golden', action='store_true', help="store produced frames as golden ones")
+    arguments = parser.parse_args()
+
+    output_directory = os.path.dirname(os.path.abspath(arguments.output))
+    os.makedirs(GOLDEN_FRAMES_DIRECTORY, exist_ok=True)
+    # Printing of the project is silenced, only results of the benchmark are printed
+    stdout = sys.stdout
+
+    results = {
+        'commit': current_commit(),
+        'python': platform.python_version(),
+        'repeats': arguments.repeats,
+        'scenarios': {}
+    }
+    for name in arguments.scenario or SCENARIOS.keys():
+        with open(os.devnull, 'w') as devnull:
+            sys.stdout = devnull
+            try:
+                durations, frames = run_scenario(SCENARIOS[name], arguments.repeats)
+            finally:
+                sys.stdout = stdout
+
+        totals = [sum(repeat_durations) for repeat_durations in durations]
+        calls = [duration for repeat_durations in durations for duration in repeat_durations]
+        results['scenarios'][name] = {
+            'calls': len(durations[0]),
+            'frames': len(frames),
+            'best_total_us': min(totals),
+            'mean_total_us': round(sum(totals) / len(totals)),
+            'mean_call_us': round(sum(calls) / len(calls)),
+            'max_call_us': max(calls),
+            'golden': check_golden_frames(name, frames, arguments.update_golden, output_directory)
+        }
+        result = results['scenarios'][name]
+        print(
+            f"{name}: calls: {result['calls']}; best total: {result['best_total_us']}us; "
+            f"mean call: {result['mean_call_us']}us; max call: {result['max_call_us']}us; golden: {result['golden']}"
+        )
+
+    with open(arguments.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Results saved to {arguments.output}")
+
+    if arguments.compare is not None:
+        with open(arguments.compare) as file:
+            previous = json.load(file)
+        print(f"Compared with {previous.get('commit')}:")
+        for name, result in results['scenarios'].items():
+            if name not in previous['scenarios']:
+                continue
+            previous_total = previous['scenarios'][name]['best_total_us']
+            ratio = previous_total / result['best_total_us'] if result['best_total_us'] > 0 else float('inf')
+            print(f"{name}: {previous_total}us -> {result['best_total_us']}us; speedup: {round(ratio, 2)}x")
+
+    if any(result['golden'] in ('mismatch', 'missing') for result in results['scenarios'].values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
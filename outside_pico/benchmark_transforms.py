@@ -0,0 +1,152 @@
+"""
+Benchmark of bulk buffer transforms from src.epaper.common against the previous per-byte implementations.
+Run from the repository root with `python3 outside_pico/benchmark_transforms.py` (host fallback)
+or with `mpremote run outside_pico/benchmark_transforms.py` on the device with src directory uploaded (viper kernels).
+"""
+import sys
+import time
+
+sys.path.append('.')
+
+from src.epaper.common import bits_order_reverse_lut, bits_count_lut, reverse_bits, reverse_bytes, rotate_180, \
+    reverse_bytearray, xor_diff, copy_region, count_toggled_pixels, VIPER_KERNELS
+
+BUFFER_SIZE = 4096
+WIDTH = 128
+REPEATS = 20
+
+if hasattr(time, 'ticks_us'):
+    def now_us():
+        return time.ticks_us()
+
+
+    def elapsed_us(start):
+        return time.ticks_diff(time.ticks_us(), start)
+else:
+    def now_us():
+        return time.perf_counter_ns() // 1000
+
+
+    def elapsed_us(start):
+        return now_us() - start
+
+
+def legacy_reverse_bytearray(array: bytearray):
+    _reversed = bytearray(len(array))
+    for i in range(len(array)):
+        _reversed[i] = bits_order_reverse_lut[array[len(array) - i - 1]]
+    return _reversed
+
+
+def legacy_reverse_part_of_buffer(buffer: bytearray, start: int, end: int):
+    size = (end - start) // 2
+    for i in range(size):
+        swap_index = end - 1 - i
+        swap = buffer[start + i]
+        buffer[start + i] = bits_order_reverse_lut[buffer[swap_index]]
+        buffer[swap_index] = bits_order_reverse_lut[swap]
+
+
+def legacy_reverse_bits(buffer: bytearray):
+    for i in range(len(buffer)):
+        buffer[i] = bits_order_reverse_lut[buffer[i]]
+
+
+def legacy_reverse_bytes(buffer: bytearray):
+    for i in range(len(buffer) // 2):
+        swap = buffer[i]
+        buffer[i] = buffer[len(buffer) - 1 - i]
+        buffer[len(buffer) - 1 - i] = swap
+
+
+def legacy_xor_diff(buffer: bytearray, previous_buffer: bytearray):
+    return bytearray([buffer[i] ^ previous_buffer[i] for i in range(len(buffer))])
+
+
+def legacy_count_toggled_pixels(buffer: bytearray, previous_buffer: bytearray):
+    count = 0
+    for i in range(len(buffer)):
+        count += bits_count_lut[buffer[i] ^ previous_buffer[i]]
+    return count
+
+
+def legacy_copy_region(source: bytearray, target: bytearray, x: int, y: int, width: int, height: int):
+    for row in range(height):
+        for column in range(width // 8):
+            index = (y + row) * (WIDTH // 8) + x // 8 + column
+            target[index] = source[index]
+
+
+def pseudo_random_buffer(seed: int):
+    buffer = bytearray(BUFFER_SIZE)
+    value = seed
+    for i in range(BUFFER_SIZE):
+        value = (value * 1103515245 + 12345) & 0x7fffffff
+        buffer[i] = (value >> 16) & 0xff
+    return buffer
+
+
+def measure(function, *args):
+    start = now_us()
+    result = None
+    for _ in range(REPEATS):
+        result = function(*args)
+    return elapsed_us(start) / REPEATS, result
+
+
+def main():
+    a = pseudo_random_buffer(1)
+    b = pseudo_random_buffer(2)
+    rows = BUFFER_SIZE // (WIDTH // 8)
+
+    # Results of both implementations are compared before timing
+    rotated = bytearray(a)
+    rotate_180(rotated)
+    assert rotated == legacy_reverse_bytearray(a)
+    legacy_rotated = bytearray(a)
+    legacy_reverse_part_of_buffer(legacy_rotated, 0, BUFFER_SIZE)
+    assert rotated == legacy_rotated
+    bits_reversed = bytearray(a)
+    reverse_bits(bits_reversed)
+    legacy_bits_reversed = bytearray(a)
+    legacy_reverse_bits(legacy_bits_reversed)
+    assert bits_reversed == legacy_bits_reversed
+    bytes_reversed = bytearray(a)
+    reverse_bytes(bytes_reversed)
+    legacy_bytes_reversed = bytearray(a)
+    legacy_reverse_bytes(legacy_bytes_reversed)
+    assert bytes_reversed == legacy_bytes_reversed
+    assert xor_diff(a, b, 0, BUFFER_SIZE) == legacy_xor_diff(a, b)
+    assert count_toggled_pixels(a, b, 0, BUFFER_SIZE) == legacy_count_toggled_pixels(a, b)
+    copied = bytearray(b)
+    copy_region(a, WIDTH, 32, 16, copied, WIDTH, 32, 16, 64, rows - 32)
+    legacy_copied = bytearray(b)
+    legacy_copy_region(a, legacy_copied, 32, 16, 64, rows - 32)
+    assert copied == legacy_copied
+
+    xor_target = bytearray(BUFFER_SIZE)
+    work = bytearray(a)
+    cases = [
+        ('rotate_180', (legacy_reverse_part_of_buffer, work, 0, BUFFER_SIZE), (rotate_180, work)),
+        ('reverse_bytearray', (legacy_reverse_bytearray, a), (reverse_bytearray, a)),
+        ('reverse_bits', (legacy_reverse_bits, work), (reverse_bits, work)),
+        ('reverse_bytes', (legacy_reverse_bytes, work), (reverse_bytes, work)),
+        ('xor_diff', (legacy_xor_diff, a, b), (xor_diff, a, b, 0, BUFFER_SIZE, 0, xor_target)),
+        ('count_toggled_pixels', (legacy_count_toggled_pixels, a, b), (count_toggled_pixels, a, b, 0, BUFFER_SIZE)),
+        (
+            'copy_region',
+            (legacy_copy_region, a, work, 32, 16, 64, rows - 32),
+            (copy_region, a, WIDTH, 32, 16, work, WIDTH, 32, 16, 64, rows - 32)
+        ),
+    ]
+
+    print(f"Buffer size: {BUFFER_SIZE}B; repeats: {REPEATS}; viper kernels: {VIPER_KERNELS}")
+    for name, legacy, bulk in cases:
+        legacy_time, _ = measure(*legacy)
+        bulk_time, _ = measure(*bulk)
+        speedup = legacy_time / bulk_time if bulk_time > 0 else float('inf')
+        print(f"{name}: legacy: {round(legacy_time)}us; bulk: {round(bulk_time)}us; speedup: {round(speedup, 1)}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Compiles BMP images and glyph definitions of outside_pico into binary assets of src/epaper/assets, ready to be sent
+to the display or blitted without any transformation at runtime.
+
+Images are stored in display orientation (rotated by 180 degrees). Fonts are stored as a header, a table of fixed-width
+glyph records and bitmaps of glyphs already rotated the way they are drawn (see src/epaper/font.py).
+
+Assets are rebuilt only when content hashes of their sources (or of this compiler) change.
+Run: python3 outside_pico/compile_assets.py [--force]
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+
+from bmp_reader import BMPReader
+
+OUTSIDE_PICO = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIRECTORY = os.path.join(os.path.dirname(OUTSIDE_PICO), 'src', 'epaper', 'assets')
+MANIFEST_PATH = os.path.join(OUTSIDE_PICO, 'assets_manifest.json')
+
+# NOTE: formats must match Font class of src/epaper/font.py
+FONT_HEADER_FORMAT = '<HB'  # glyphs count, font size
+GLYPH_FORMAT = '<HBBbbBI'  # code point, width, height, x offset, y offset, x advance, bitmap offset in file
+
+# (asset name, kind, source files)
+ASSETS = [
+    ('author_logo', 'image', ('logo.bmp',)),
+    ('bluetooth_off', 'image', ('bluetooth_off.bmp',)),
+    ('common_24px', 'font', ('common_24px.bmp', 'common_24px.json')),
+    ('digits_104px', 'font', ('digits_104px.bmp', 'digits_104px.json')),
+]
+
+
+def rgb2d_to_mono_hlsb(rgb_array: list[list[list[int]]], width: int, height: int):
+    # Make sure width * height is a multiple of 8
+    padding = 0
+    if (width * height) % 8 > 0:
+        padding = 8 - ((width * height) % 8)
+    mono_hlsb = bytearray((width * height + padding) // 8)
+
+    for y in range(height):
+        for x in range(width):
+            color = round(rgb_array[x][y][0] / 255.0)  # 1 for white and 0 for black
+            # NOTE: sources are drawn transposed, so pixels are packed column by column
+            index = y + x * height
+            mono_hlsb[index // 8] |= color << (7 - index % 8)
+
+    return mono_hlsb
+
+
+def rotate_mono_hlsb_180(mono_hlsb: bytearray):
+    # Reversing order of bytes and order of bits within each byte rotates full width image by 180 degrees
+    return bytearray(int(f"{byte:08b}"[::-1], 2) for byte in reversed(mono_hlsb))
+
+
+def read_bitmap(path: str):
+    """
+    :return: MONO_HLSB pixels, width and height of the image
+    """
+    image = BMPReader(path)
+    return rgb2d_to_mono_hlsb(image.get_pixels(), image.width, image.height), image.width, image.height
+
+
+def compile_image(bitmap_path: str):
+    mono_hlsb, _, _ = read_bitmap(bitmap_path)
+    return bytes(rotate_mono_hlsb_180(mono_hlsb))
+
+
+def compile_font(bitmap_path: str, glyphs_path: str):
+    atlas, atlas_width, _ = read_bitmap(bitmap_path)
+    with open(glyphs_path, encoding='utf-8') as file:
+        definition = json.load(file)
+    glyphs: dict[str, dict[str, int]] = definition['glyphs']
+
+    def atlas_pixel(x: int, y: int):
+        index = y * atlas_width + x
+        return (atlas[index // 8] >> (7 - index % 8)) & 1
+
+    table_offset = struct.calcsize(FONT_HEADER_FORMAT)
+    bitmap_offset = table_offset + len(glyphs) * struct.calcsize(GLYPH_FORMAT)
+    table = bytearray()
+    bitmaps = bytearray()
+    for char, glyph in glyphs.items():
+        width, height = glyph['width'], glyph['height']
+        bytes_per_row = (width + 7) // 8
+        # Glyph is rotated by 180 degrees; bits beyond glyph width are white
+        bitmap = bytearray([0xff] * (bytes_per_row * height))
+        for y in range(height):
+            for x in range(width):
+                if atlas_pixel(glyph['x'] + x, glyph['y'] + y) == 0:
+                    target_x, target_y = width - 1 - x, height - 1 - y
+                    bitmap[target_y * bytes_per_row + target_x // 8] &= ~(0x80 >> (target_x % 8)) & 0xff
+
+        table += struct.pack(
+            GLYPH_FORMAT, ord(char), width, height, glyph['xoffset'], glyph['yoffset'], glyph['xadvance'],
+            bitmap_offset + len(bitmaps)
+        )
+        bitmaps += bitmap
+
+    return struct.pack(FONT_HEADER_FORMAT, len(glyphs), definition['size']) + table + bitmaps
+
+
+def hash_inputs(kind: str, sources: tuple[str, ...]):
+    inputs = hashlib.sha256()
+    # Changes of the compiler itself invalidate all assets
+    with open(os.path.abspath(__file__), 'rb') as file:
+        inputs.update(file.read())
+    inputs.update(kind.encode('ascii'))
+    for source in sources:
+        with open(os.path.join(OUTSIDE_PICO, source), 'rb') as file:
+            inputs.update(hashlib.sha256(file.read()).digest())
+    return inputs.hexdigest()
+
+
+def hash_file(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiles images and fonts into binary assets of the project")
+    parser.add_argument('--force', action='store_true', help="rebuild all assets regardless of content hashes")
+    arguments = parser.parse_args()
+
+    manifest: dict[str, dict[str, str]] = {}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as file:
+            manifest = json.load(file)
+    os.makedirs(ASSETS_DIRECTORY, exist_ok=True)
+
+    for name, kind, sources in ASSETS:
+        output_path = os.path.join(ASSETS_DIRECTORY, f'{name}.bin')
+        inputs_hash = hash_inputs(kind, sources)
+        entry = manifest.get(name, {})
+        if not arguments.force and entry.get('inputs') == inputs_hash and entry.get('output') == hash_file(output_path):
+            print(f"{name}: up to date")
+            continue
+
+        paths = [os.path.join(OUTSIDE_PICO, source) for source in sources]
+        data = compile_image(*paths) if kind == 'image' else compile_font(*paths)
+        with open(output_path, 'wb') as file:
+            file.write(data)
+        manifest[name] = {'inputs': inputs_hash, 'output': hashlib.sha256(data).hexdigest()}
+        print(f"{name}: compiled {len(data)}B from {', '.join(sources)}")
+
+    with open(MANIFEST_PATH, 'w') as file:
+        json.dump(manifest, file, indent=2)
+        file.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Replays traces of wheel sensor pulses through the speed estimator of the project (src/speed_estimator.py) and through
+the previous estimate from the last two pulses, reporting how stable the displayed speed is, how far it is from the
+real speed and whether it rises while the real speed falls.
+
+Traces are text files with a pulse per line: time in microseconds and, optionally, real speed in km/h. They are recorded
+by the simulator (python3 -m simulator --wheel-glitches 0.02 --pulse-trace trace.txt) or generated by this script.
+
+Run from the repository root:
+    python3 outside_pico/replay_pulse_traces.py trace.txt [trace.txt ...]
+    python3 outside_pico/replay_pulse_traces.py --generate 1800 --glitches 0.02
+    python3 outside_pico/replay_pulse_traces.py --speed-changes
+"""
+import argparse
+import os
+import sys
+
+OUTSIDE_PICO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(OUTSIDE_PICO)
+
+from simulator import machine
+from simulator.clock import VirtualClock
+from simulator.devices import WheelSensor
+from simulator.simulation import install_modules, uninstall_modules, synthetic_ride_profile, WHEEL_SENSOR_PIN
+
+# Difference from the real speed in km/h counted as a spike
+SPIKE_THRESHOLD = 5.
+# Speedometer is updated this often by Core
+SPEEDOMETER_UPDATE_PERIOD_US = 2000
+# Speed changes replayed with --speed-changes: name, initial and final speed in km/h (changing linearly for 3 seconds)
+SPEED_CHANGES = (('braking', 25., 0.), ('slowing down', 25., 8.))
+
+
+class TwoPulseEstimator:
+    """
+    Speed computed from the interval between the last two pulses (estimate used before SpeedEstimator)
+    """
+
+    def __init__(self, circumference: float):
+        self.__circumference = circumference
+        self.__last_timestamp = None
+        self.speed = 0.
+
+    def add_pulse(self, timestamp: int):
+        if self.__last_timestamp is not None and timestamp > self.__last_timestamp:
+            self.speed = self.__circumference / (timestamp - self.__last_timestamp) * ((1e6 * 3600) / 100000)
+        self.__last_timestamp = timestamp
+        return True
+
+
+def read_trace(path: str):
+    """
+    :return: list of (time in microseconds, real speed in km/h or None)
+    """
+    trace: list[tuple[int, float]] = []
+    with open(path) as file:
+        for line in file:
+            line = line.split('#', 1)[0].split()
+            if len(line) == 0:
+                continue
+            trace.append((int(line[0]), float(line[1]) if len(line) > 1 else None))
+    return trace
+
+
+def speed_change_profile(initial_speed: float, final_speed: float, start=20., duration=3.):
+    """
+    :return: speed profile (function of time in seconds returning km/h) of a linear speed change after riding steadily
+    """
+
+    def speed(seconds: float):
+        progress = min(1., max(0., (seconds - start) / duration))
+        return initial_speed + (final_speed - initial_speed) * progress
+
+    return speed
+
+
+def generate_trace(speed_profile: callable, duration: float, circumference: float, glitch_rate: float, seed: int):
+    clock = VirtualClock()
+    wheel = WheelSensor(
+        clock, WHEEL_SENSOR_PIN, speed_profile, circumference=circumference, glitch_rate=glitch_rate, seed=seed
+    )
+    clock.sleep_us(duration * 1e6)
+    return wheel.trace
+
+
+def replay(trace: list[tuple[int, float]], estimator):
+    """
+    :return: statistics of speed displayed (rounded) after every pulse
+    """
+    from src.wheel_capture import WheelPulseCapture
+
+    displayed = None
+    display_changes = 0
+    largest_step = 0
+    errors: list[float] = []
+    # Pulses after which displayed speed went up although the real speed went down
+    rises_while_slowing = 0
+    previous_real_speed = None
+    last_timestamp = None
+    for timestamp, real_speed in trace:
+        # Contact bounces are filtered out by the capture
+        if last_timestamp is not None and timestamp - last_timestamp < WheelPulseCapture.LOCKOUT_US:
+            continue
+        last_timestamp = timestamp
+
+        estimator.add_pulse(timestamp)
+        speed = round(estimator.speed)
+        if displayed is not None and speed != displayed:
+            display_changes += 1
+            largest_step = max(largest_step, abs(speed - displayed))
+            if speed > displayed and real_speed is not None and previous_real_speed is not None and \
+                    real_speed < previous_real_speed:
+                rises_while_slowing += 1
+        displayed = speed
+        previous_real_speed = real_speed
+        if real_speed is not None and real_speed > 0:
+            errors.append(abs(estimator.speed - real_speed))
+
+    return {
+        'display_changes': display_changes,
+        'largest_step': largest_step,
+        'mean_error': sum(errors) / len(errors) if len(errors) > 0 else None,
+        'max_error': max(errors) if len(errors) > 0 else None,
+        'spikes': sum(1 for error in errors if error > SPIKE_THRESHOLD),
+        'rises_while_slowing': rises_while_slowing,
+    }
+
+
+def replay_on_device(trace: list[tuple[int, float]], clock: VirtualClock, circumference: float):
+    """
+    Replays pulses on the sensor pin of Speedometer updated as often as by Core, so its decay of speed between pulses is
+    included
+    :param clock: clock of installed modules
+    :return: statistics of speed displayed (rounded) after every update
+    """
+    from src.speedometer import Speedometer
+
+    speedometer = Speedometer(circumference)
+    start_us = clock.now_us
+    # Real speed at the last pulse
+    real_speed: list[float | None] = [None]
+
+    def pulse(speed: float):
+        real_speed[0] = speed
+        machine.board.pins[WHEEL_SENSOR_PIN].trigger_irq(rising=False)
+
+    for timestamp, speed in trace:
+        clock.call_at(start_us + timestamp, lambda speed=speed: pulse(speed))
+
+    displayed = 0
+    display_changes = 0
+    largest_step = 0
+    rises_while_slowing = 0
+    # Real speed when the displayed speed changed the last time
+    displayed_real_speed = None
+    end_us = start_us + (trace[-1][0] if len(trace) > 0 else 0) + SPEEDOMETER_UPDATE_PERIOD_US
+    while clock.now_us < end_us:
+        clock.sleep_us(SPEEDOMETER_UPDATE_PERIOD_US)
+        speedometer.update()
+        speed = round(speedometer.current_speed)
+        if speed == displayed:
+            continue
+        display_changes += 1
+        largest_step = max(largest_step, abs(speed - displayed))
+        if speed > displayed and real_speed[0] is not None and displayed_real_speed is not None and \
+                real_speed[0] < displayed_real_speed:
+            rises_while_slowing += 1
+        displayed = speed
+        displayed_real_speed = real_speed[0]
+
+    return {
+        'display_changes': display_changes,
+        'largest_step': largest_step,
+        'mean_error': None,
+        'rises_while_slowing': rises_while_slowing,
+    }
+
+
+def format_statistics(name: str, statistics: dict[str, any]):
+    line = f"  {name}: display changes: {statistics['display_changes']}; largest step: {statistics['largest_step']}km/h"
+    if statistics['mean_error'] is not None:
+        line += (
+            f"; mean error: {round(statistics['mean_error'], 2)}km/h; max error: {round(statistics['max_error'], 1)}km/h"
+            f"; spikes: {statistics['spikes']}"
+        )
+    return line + f"; rises while slowing: {statistics['rises_while_slowing']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays traces of wheel sensor pulses through speed estimators")
+    parser.add_argument('traces', nargs='*', help="trace files")
+    parser.add_argument('--circumference', type=float, default=223., help="wheel circumference in cm")
+    parser.add_argument('--generate', type=float, default=None,
+                        help="replay also a trace of synthetic ride of given duration in seconds")
+    parser.add_argument('--glitches', type=float, default=0.02,
+                        help="probability of a sensor glitch on a magnet pass of the generated trace")
+    parser.add_argument('--seed', type=int, default=0, help="seed of glitches of the generated trace")
+    parser.add_argument('--speed-changes', action='store_true',
+                        help="replay also traces of braking and slowing down (without glitches) and fail if "
+                             "displayed speed rises during them")
+    arguments = parser.parse_args()
+
+    clock = VirtualClock()
+    installed_modules = install_modules(clock)
+    try:
+        traces: list[tuple[str, list[tuple[int, float]]]] = [(path, read_trace(path)) for path in arguments.traces]
+        if arguments.generate is not None:
+            trace = generate_trace(
+                synthetic_ride_profile(arguments.generate), arguments.generate, arguments.circumference,
+                arguments.glitches, arguments.seed
+            )
+            traces.append((f"synthetic ride ({arguments.generate}s, glitch rate {arguments.glitches})", trace))
+        speed_change_traces: list[str] = []
+        if arguments.speed_changes:
+            for name, initial_speed, final_speed in SPEED_CHANGES:
+                name = f"{name} ({round(initial_speed)}km/h to {round(final_speed)}km/h)"
+                speed_change_traces.append(name)
+                traces.append((name, generate_trace(
+                    speed_change_profile(initial_speed, final_speed), 40., arguments.circumference, 0., arguments.seed
+                )))
+        if len(traces) == 0:
+            parser.error("no trace given")
+
+        from src.speed_estimator import SpeedEstimator
+
+        failed = False
+        for name, trace in traces:
+            print(f"{name}: {len(trace)} pulses")
+            print(format_statistics('two pulses', replay(trace, TwoPulseEstimator(arguments.circumference))))
+            statistics = replay(trace, SpeedEstimator(arguments.circumference))
+            print(format_statistics('windowed', statistics))
+            device_statistics = replay_on_device(trace, clock, arguments.circumference)
+            print(format_statistics('windowed with decay', device_statistics))
+            if name in speed_change_traces and \
+                    statistics['rises_while_slowing'] + device_statistics['rises_while_slowing'] > 0:
+                print("  displayed speed rose while the real speed fell")
+                failed = True
+    finally:
+        uninstall_modules(installed_modules)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
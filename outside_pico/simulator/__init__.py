@@ -0,0 +1,9 @@
+"""
+Host-side simulator of the cyclocomputer.
+
+It runs unmodified Core of the project on CPython with stand-ins for MicroPython modules (machine, framebuf, utime and
+_thread) and simulated devices: wheel sensor, Pico-BLE module with connected phone, UPS module and e-paper display.
+Simulated time advances only when the project sleeps, so an hour-long ride is replayed in seconds.
+
+Usage (from outside_pico directory): python3 -m simulator --duration 3600
+"""
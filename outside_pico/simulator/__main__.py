@@ -0,0 +1,47 @@
+import argparse
+
+from simulator.simulation import Simulation, synthetic_ride_profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays a ride on the host with simulated time and peripherals")
+    parser.add_argument('--duration', type=float, default=3600, help="simulated time in seconds")
+    parser.add_argument('--cruise-speed', type=float, default=25., help="average speed of the synthetic ride in km/h")
+    parser.add_argument('--min-sleep-us', type=int, default=2000,
+                        help="shortest simulated sleep in microseconds (duration of a loop iteration on the device)")
+    parser.add_argument('--cpu-scale', type=float, default=0.,
+                        help="host execution time multiplier added to the simulated time")
+    parser.add_argument('--profile-cpu', action='store_true', help="report CPU hot spots of simulated threads")
+    parser.add_argument('--no-phone', action='store_true', help="phone never connects to the device")
+    parser.add_argument('--wheel-glitches', type=float, default=0.,
+                        help="probability of a glitch of the wheel sensor on a magnet pass")
+    parser.add_argument('--pulse-trace', type=str, default=None,
+                        help="path of the recorded trace of wheel sensor pulses (see replay_pulse_traces.py)")
+    parser.add_argument('--frame', type=str, default=None, help="path of PBM image with the last displayed frame")
+    arguments = parser.parse_args()
+
+    simulation = Simulation(
+        arguments.duration,
+        speed_profile=synthetic_ride_profile(arguments.duration, cruise_speed=arguments.cruise_speed),
+        min_sleep_us=arguments.min_sleep_us,
+        cpu_scale=arguments.cpu_scale,
+        profile_cpu=arguments.profile_cpu,
+        phone_connected=not arguments.no_phone,
+        wheel_glitch_rate=arguments.wheel_glitches
+    ).run()
+
+    print(simulation.report())
+    if arguments.frame is not None:
+        with open(arguments.frame, 'wb') as file:
+            file.write(simulation.epd.to_pbm())
+        print(f"Last displayed frame saved to {arguments.frame}")
+    if arguments.pulse_trace is not None:
+        with open(arguments.pulse_trace, 'w') as file:
+            file.write("# time in microseconds, speed in km/h\n")
+            for timestamp, speed in simulation.wheel.trace:
+                file.write(f"{timestamp} {round(speed, 3)}\n")
+        print(f"Trace of {len(simulation.wheel.trace)} wheel pulses saved to {arguments.pulse_trace}")
+
+
+if __name__ == '__main__':
+    main()
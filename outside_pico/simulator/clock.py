@@ -0,0 +1,172 @@
+import heapq
+import threading
+import time
+import traceback
+
+
+class VirtualClock:
+    """
+    Simulated time of the device. Time advances only when simulated threads sleep (or devices spend time, e.g. on SPI
+    transfers), so simulation runs as fast as the host executes the code.
+
+    Simulated threads are real host threads, but only one of them runs at a time. Sleeping thread yields to the thread
+    with the earliest wake up time. Scheduled events (like interrupts of pin changes) are executed in order as time
+    passes.
+    """
+
+    def __init__(self, min_sleep_us=2000, cpu_scale=0.):
+        """
+        :param min_sleep_us: shorter sleeps are extended to it; it stands for the duration of loop iterations on the
+        device (loops sleeping for 1us would otherwise make simulation extremely slow)
+        :param cpu_scale: host execution time multiplied by it is added to the simulated time (0 ignores execution time)
+        """
+        self.now_us = 0
+        self.__min_sleep_us = min_sleep_us
+        self.__cpu_scale = cpu_scale
+
+        self.__deadline_us = None
+        self.__interrupted_threads: set[int] = set()
+
+        self.__events: list[tuple[int, int, callable]] = []
+        self.__order = 0
+
+        # Every simulated thread blocks on its own lock until another thread hands over execution to it
+        self.__locks: dict[int, threading.Lock] = {threading.get_ident(): threading.Lock()}
+        self.__locks[threading.get_ident()].acquire()
+        # Waiting threads: thread id -> (wake up time, order)
+        self.__waiting: dict[int, tuple[int, int]] = {}
+        self.__threads_count = 1
+        self.__all_exited = threading.Event()
+        self.__resume_time = time.perf_counter()
+
+    # Functions of MicroPython time module
+
+    def ticks_us(self):
+        return self.now_us
+
+    def ticks_ms(self):
+        return self.now_us // 1000
+
+    def ticks_cpu(self):
+        return self.now_us
+
+    @staticmethod
+    def ticks_diff(ticks1: int, ticks2: int):
+        return ticks1 - ticks2
+
+    @staticmethod
+    def ticks_add(ticks: int, delta: int):
+        return ticks + delta
+
+    def sleep(self, seconds: float):
+        self.sleep_us(seconds * 1e6)
+
+    def sleep_ms(self, milliseconds: float):
+        self.sleep_us(milliseconds * 1000)
+
+    def sleep_us(self, microseconds: float):
+        self.__account_cpu_time()
+        me = threading.get_ident()
+        if self.__deadline_us is not None and self.now_us >= self.__deadline_us and \
+                me not in self.__interrupted_threads:
+            # Every thread is interrupted once (the way loops of the project are stopped with Ctrl+C)
+            self.__interrupted_threads.add(me)
+            raise KeyboardInterrupt
+
+        self.__order += 1
+        self.__waiting[me] = (self.now_us + max(int(microseconds), self.__min_sleep_us), self.__order)
+        if self.__switch() != me:
+            self.__locks[me].acquire()
+        self.__resume_time = time.perf_counter()
+
+    # Simulation control
+
+    def advance(self, microseconds: float):
+        """
+        Spends time in the current thread without yielding (e.g. blocking SPI transfer)
+        """
+        self.now_us += int(microseconds)
+
+    def call_at(self, time_us: int, callback: callable):
+        """
+        Schedules callback (e.g. an interrupt handler) to be executed when simulated time reaches given time
+        """
+        self.__order += 1
+        heapq.heappush(self.__events, (max(time_us, self.now_us), self.__order, callback))
+
+    def stop_at(self, time_us: int):
+        """
+        Sleeping threads get KeyboardInterrupt (once per thread) after given time
+        """
+        self.__deadline_us = time_us
+
+    def start_thread(self, function: callable, args: tuple):
+        """
+        Starts simulated thread. It waits for its turn until the current thread sleeps.
+        """
+        registered = threading.Event()
+
+        def run():
+            me = threading.get_ident()
+            self.__locks[me] = threading.Lock()
+            self.__locks[me].acquire()
+            self.__order += 1
+            self.__waiting[me] = (self.now_us, self.__order)
+            self.__threads_count += 1
+            registered.set()
+            self.__locks[me].acquire()
+            self.__resume_time = time.perf_counter()
+            try:
+                function(*args)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.exit_thread()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        registered.wait()
+        return thread.ident
+
+    def exit_thread(self):
+        """
+        Removes the current thread from the scheduling and lets the next one run
+        """
+        self.__account_cpu_time()
+        del self.__locks[threading.get_ident()]
+        self.__threads_count -= 1
+        if self.__threads_count == 0:
+            self.__all_exited.set()
+        else:
+            self.__switch()
+
+    def join_threads(self):
+        """
+        Called by the main thread after it has finished. Other threads run until they exit.
+        """
+        self.exit_thread()
+        self.__all_exited.wait()
+        self.__all_exited.clear()
+        self.__threads_count = 1
+        self.__locks[threading.get_ident()] = threading.Lock()
+        self.__locks[threading.get_ident()].acquire()
+
+    def __account_cpu_time(self):
+        if self.__cpu_scale > 0:
+            self.now_us += int((time.perf_counter() - self.__resume_time) * 1e6 * self.__cpu_scale)
+
+    def __switch(self):
+        """
+        Executes events due before the earliest wake up time and hands over execution to the thread waking up first
+        :return: id of that thread
+        """
+        thread, (wake_time, _) = min(self.__waiting.items(), key=lambda item: item[1])
+        while len(self.__events) > 0 and self.__events[0][0] <= wake_time:
+            event_time, _, callback = heapq.heappop(self.__events)
+            self.now_us = max(self.now_us, event_time)
+            callback()
+        del self.__waiting[thread]
+        self.now_us = max(self.now_us, wake_time)
+        if thread != threading.get_ident():
+            self.__locks[thread].release()
+        return thread
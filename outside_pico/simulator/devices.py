@@ -0,0 +1,242 @@
+import binascii
+import random
+import struct
+
+from simulator.clock import VirtualClock
+from simulator.machine import board
+
+
+class WheelSensor:
+    """
+    Magnetic sensor pulling its pin down while the magnet on the wheel passes by.
+    Magnet passes follow scripted speed profile. Optionally the sensor glitches: the magnet triggers it twice,
+    it is triggered without the magnet (e.g. by interference) or it misses the magnet.
+    """
+    # Shortest time the magnet keeps the sensor active
+    MIN_PULSE_US = 2000
+    # Wheel rotation is integrated with this step, so speed changes within a single revolution are followed
+    STEP_US = 100000
+    GLITCHES = ('double', 'spurious', 'missed')
+
+    def __init__(
+            self, clock: VirtualClock, pin_id: int, speed_profile: callable, circumference=223., glitch_rate=0.,
+            seed=0
+    ):
+        """
+        :param speed_profile: function returning speed in km/h for given simulated time in seconds
+        :param circumference: wheel circumference in cm
+        :param glitch_rate: probability of a glitch on a magnet pass
+        """
+        self.__clock = clock
+        self.__pin_id = pin_id
+        self.__speed_profile = speed_profile
+        self.__circumference = circumference
+        self.__glitch_rate = glitch_rate
+        self.__random = random.Random(seed)
+        self.__level = 1
+        self.__revolution = 0.  # Part of the revolution made since the last magnet pass
+
+        self.passes = 0
+        self.glitches = 0
+        # (time in microseconds, speed in km/h) of every activation of the sensor
+        self.trace: list[tuple[int, float]] = []
+        board.pin_inputs[pin_id] = lambda: self.__level
+        clock.call_at(0, self.__rotate)
+
+    @property
+    def distance(self):
+        """
+        Distance traveled in kilometers
+        """
+        return self.passes * self.__circumference / 100000
+
+    def __rotate(self):
+        speed = self.__speed_profile(self.__clock.now_us / 1e6)
+        if speed > 0:
+            # Speed in km/h divided by 36000 gives centimeters per microsecond
+            interval = self.__circumference * 36000 / speed
+            remaining = (1. - self.__revolution) * interval
+            if remaining <= WheelSensor.STEP_US:
+                self.__clock.call_at(self.__clock.now_us + int(remaining), lambda: self.__on_magnet_arrival(interval))
+                return
+            self.__revolution += WheelSensor.STEP_US / interval
+        self.__clock.call_at(self.__clock.now_us + WheelSensor.STEP_US, self.__rotate)
+
+    def __on_magnet_arrival(self, interval: float):
+        self.passes += 1
+        self.__revolution = 0.
+        pulse = max(WheelSensor.MIN_PULSE_US, int(interval / 20))
+
+        glitch = None
+        if self.__glitch_rate > 0 and self.__random.random() < self.__glitch_rate:
+            glitch = self.__random.choice(WheelSensor.GLITCHES)
+            self.glitches += 1
+
+        if glitch != 'missed':
+            self.__activate(pulse)
+        if glitch == 'double':
+            self.__clock.call_at(
+                self.__clock.now_us + pulse + self.__random.randint(WheelSensor.MIN_PULSE_US, 60000),
+                lambda: self.__activate(WheelSensor.MIN_PULSE_US)
+            )
+        elif glitch == 'spurious':
+            self.__clock.call_at(
+                self.__clock.now_us + int(interval * self.__random.uniform(0.1, 0.9)),
+                lambda: self.__activate(WheelSensor.MIN_PULSE_US)
+            )
+        self.__rotate()
+
+    def __activate(self, duration_us: int):
+        if self.__level == 0:
+            return
+        self.trace.append((self.__clock.now_us, self.__speed_profile(self.__clock.now_us / 1e6)))
+        self.__set_level(0)
+        self.__clock.call_at(self.__clock.now_us + duration_us, lambda: self.__set_level(1))
+
+    def __set_level(self, level: int):
+        self.__level = level
+        pin = board.pins.get(self.__pin_id)
+        if pin is not None:
+            pin.trigger_irq(rising=level == 1)
+
+
+class Phone:
+    """
+    Mobile app connected through Pico-BLE module. It acts as the UART device of the module and drives its connection
+    status pin.
+    """
+    STAMP = bytes('mgdlnkczmr', 'ascii')
+    # Bytes sent by the phone arrive at the pace of UART at 115200 baud (10 bits per byte) in chunks of this size
+    UART_CHUNK_SIZE = 32
+    UART_BYTE_US = 1e6 * 10 / 115200
+
+    # Responses of the module to AT commands sent by the project
+    AT_RESPONSES = {
+        b'AT+QT': b'QT+05\r\n',
+        b'AT+QL': b'QL+00\r\n',
+        b'AT+TM': b'TM+BLE-Cyclocomputer\r\n',
+        b'AT+TD': b'TD+Cyclocomputer\r\n',
+        b'AT+TN': b'TB+112233445566\r\n',
+        b'AT+T4': b'T4+01\r\n',
+        b'AT+T5': b'T5+01\r\n',
+    }
+
+    def __init__(self, clock: VirtualClock, uart_id: int, connection_pin_id: int):
+        self.__clock = clock
+        self.connected = False
+        self.__incoming = bytearray()  # Bytes sent by the phone and not read by the device yet
+        self.__transfer_end_us = 0
+        self.__handlers: dict[int, callable] = {}
+
+        # (time in microseconds, message, data) of messages received from the device
+        self.received_messages: list[tuple[int, int, bytes]] = []
+        self.sent_bytes = 0
+
+        board.uart_devices[uart_id] = self
+        board.pin_inputs[connection_pin_id] = lambda: 1 if self.connected else 0
+
+    # UART side
+
+    def any(self):
+        return len(self.__incoming)
+
+    def read(self, size: int = None):
+        if len(self.__incoming) == 0:
+            return None
+        size = len(self.__incoming) if size is None else min(size, len(self.__incoming))
+        data = bytes(self.__incoming[:size])
+        del self.__incoming[:size]
+        return data
+
+    def write(self, data: bytes):
+        if data.startswith(b'AT+'):
+            self.__incoming += Phone.AT_RESPONSES.get(data[:5], b'OK\r\n')
+            return len(data)
+
+        frame = binascii.a2b_base64(data)
+        if frame[:len(Phone.STAMP)] == Phone.STAMP:
+            message = frame[len(Phone.STAMP)]
+            size = struct.unpack('<I', frame[len(Phone.STAMP) + 1:len(Phone.STAMP) + 5])[0]
+            payload = frame[len(Phone.STAMP) + 5:len(Phone.STAMP) + 5 + size]
+            self.received_messages.append((self.__clock.now_us, message, payload))
+            if message in self.__handlers:
+                self.__handlers[message](payload)
+        return len(data)
+
+    # Phone side
+
+    def connect(self, at_seconds: float = None):
+        self.__at(at_seconds, lambda: setattr(self, 'connected', True))
+
+    def disconnect(self, at_seconds: float = None):
+        self.__at(at_seconds, lambda: setattr(self, 'connected', False))
+
+    def send(self, message: int, data: bytes, at_seconds: float = None):
+        """
+        Sends message to the device (immediately or at given simulated time)
+        """
+        data = Phone.STAMP + struct.pack('<BI', message, len(data)) + data
+
+        def deliver():
+            # Transfer ends after previously sent bytes
+            start_us = max(self.__clock.now_us, self.__transfer_end_us)
+            for offset in range(0, len(data), Phone.UART_CHUNK_SIZE):
+                chunk = data[offset:offset + Phone.UART_CHUNK_SIZE]
+                start_us += len(chunk) * Phone.UART_BYTE_US
+                self.__clock.call_at(int(start_us), lambda chunk=chunk: self.__incoming.extend(chunk))
+            self.__transfer_end_us = start_us
+            self.sent_bytes += len(data)
+
+        self.__at(at_seconds, deliver)
+
+    def on_message(self, message: int, handler: callable):
+        """
+        :param handler: called with data of each message of given type received from the device
+        """
+        self.__handlers[message] = handler
+
+    def __at(self, at_seconds: float, action: callable):
+        if at_seconds is None:
+            action()
+        else:
+            self.__clock.call_at(int(at_seconds * 1e6), action)
+
+
+class INA219Model:
+    """
+    Current and bus voltage sensor of the UPS module following scripted battery profile
+    """
+    _REG_BUSVOLTAGE = 0x02
+    _REG_CURRENT = 0x04
+
+    def __init__(self, clock: VirtualClock, address: int, voltage_profile: callable, current_profile: callable):
+        """
+        :param voltage_profile: function returning bus voltage in volts for given simulated time in seconds
+        :param current_profile: function returning current in mA (positive while charging) for given time in seconds
+        """
+        self.__clock = clock
+        self.__voltage_profile = voltage_profile
+        self.__current_profile = current_profile
+        self.__registers: dict[int, int] = {}
+        board.i2c_devices[address] = self
+
+    def write_register(self, register: int, data: bytes):
+        self.__registers[register] = (data[0] << 8) | data[1]
+
+    def read_register(self, register: int, size: int):
+        seconds = self.__clock.now_us / 1e6
+        if register == INA219Model._REG_BUSVOLTAGE:
+            value = int(self.__voltage_profile(seconds) / 0.004) << 3
+        elif register == INA219Model._REG_CURRENT:
+            value = int(self.__current_profile(seconds)) & 0xffff
+        else:
+            value = self.__registers.get(register, 0)
+        return bytes([(value >> 8) & 0xff, value & 0xff])[:size]
+
+
+def temperature_sensor_reading(celsius: float):
+    """
+    :return: 16 bit ADC reading of RP2040 temperature sensor corresponding to given temperature
+    """
+    voltage = 0.706 - (celsius - 27) * 0.001721
+    return round(voltage / 3.3 * 65535)
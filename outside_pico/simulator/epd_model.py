@@ -0,0 +1,155 @@
+from simulator.clock import VirtualClock
+from simulator.machine import board
+
+
+class Refresh:
+    """
+    Single activation of display update
+    """
+
+    def __init__(self, kind: str, start_us: int, duration_us: int, uploaded_bytes: int, toggled_pixels: int):
+        self.kind = kind
+        self.start_us = start_us
+        self.duration_us = duration_us
+        self.uploaded_bytes = uploaded_bytes
+        self.toggled_pixels = toggled_pixels
+
+
+class EPaperModel:
+    """
+    Model of SSD1680 controller of 2.9" e-paper display driven through SPI.
+    It interprets commands used by the project, keeps controller RAM, snapshots displayed frame on every update
+    activation and keeps the busy pin high for the time of the update (triggering falling edge interrupt when it is
+    released).
+    """
+    WIDTH = 128
+    HEIGHT = 296
+
+    # Approximate durations of update activations
+    FULL_REFRESH_US = 2000000
+    PARTIAL_REFRESH_US = 300000
+    POWER_ON_US = 100000
+    SOFTWARE_RESET_US = 10000
+
+    FULL_UPDATE_MODES = (0xF7, 0xFF, 0xC7)
+    PARTIAL_UPDATE_MODES = (0x0F, 0xCF)
+
+    def __init__(self, clock: VirtualClock, spi_id: int, dc_pin_id: int, cs_pin_id: int, busy_pin_id: int):
+        self.__clock = clock
+        self.__dc_pin_id = dc_pin_id
+        self.__cs_pin_id = cs_pin_id
+        self.__busy_pin_id = busy_pin_id
+        bytes_per_row = EPaperModel.WIDTH // 8
+
+        self.ram = bytearray([0xff] * (bytes_per_row * EPaperModel.HEIGHT))
+        self.previous_ram = bytearray(self.ram)
+        # Frame visible on the display
+        self.shown = bytes(self.ram)
+
+        self.__command = None
+        self.__parameters = bytearray()
+        self.__target = self.ram
+        self.__update_mode = 0xF7
+        self.__x_start, self.__x_end = 0, bytes_per_row - 1
+        self.__y_start, self.__y_end = 0, EPaperModel.HEIGHT - 1
+        self.__x = 0
+        self.__y = 0
+        self.__busy_until = 0
+        self.__uploaded_bytes = 0
+
+        self.refreshes: list[Refresh] = []
+        self.power_activations = 0
+        self.spi_transactions = 0
+        self.spi_bytes = 0
+
+        board.spi_devices[spi_id] = self
+        board.pin_inputs[busy_pin_id] = lambda: 1 if self.__clock.now_us < self.__busy_until else 0
+
+    def write(self, data: bytes):
+        self.spi_transactions += 1
+        self.spi_bytes += len(data)
+        if board.pins[self.__cs_pin_id].value() != 0:
+            return
+        if board.pins[self.__dc_pin_id].value() == 0:
+            for command in data:
+                self.__on_command(command)
+        else:
+            for value in data:
+                self.__on_data(value)
+
+    def __on_command(self, command: int):
+        self.__command = command
+        self.__parameters = bytearray()
+        if command == 0x24:
+            self.__target = self.ram
+        elif command == 0x26:
+            self.__target = self.previous_ram
+        elif command == 0x12:
+            self.__set_busy(EPaperModel.SOFTWARE_RESET_US)
+        elif command == 0x20:
+            self.__activate()
+
+    def __activate(self):
+        if self.__update_mode in EPaperModel.FULL_UPDATE_MODES:
+            kind, duration = 'full', EPaperModel.FULL_REFRESH_US
+        elif self.__update_mode in EPaperModel.PARTIAL_UPDATE_MODES:
+            kind, duration = 'partial', EPaperModel.PARTIAL_REFRESH_US
+        else:
+            self.power_activations += 1
+            self.__set_busy(EPaperModel.POWER_ON_US)
+            return
+
+        frame = bytes(self.ram)
+        toggled_pixels = sum(bin(a ^ b).count('1') for a, b in zip(frame, self.shown) if a != b)
+        self.refreshes.append(Refresh(kind, self.__clock.now_us, duration, self.__uploaded_bytes, toggled_pixels))
+        self.__uploaded_bytes = 0
+        self.shown = frame
+        self.__set_busy(duration)
+
+    def __set_busy(self, duration_us: int):
+        self.__busy_until = self.__clock.now_us + duration_us
+        self.__clock.call_at(self.__busy_until, self.__release_busy_pin)
+
+    def __release_busy_pin(self):
+        # Busy time could be extended by a later command
+        if self.__clock.now_us < self.__busy_until:
+            return
+        pin = board.pins.get(self.__busy_pin_id)
+        if pin is not None:
+            pin.trigger_irq(rising=False)
+
+    def __on_data(self, value: int):
+        command = self.__command
+        if command in (0x24, 0x26):
+            bytes_per_row = EPaperModel.WIDTH // 8
+            self.__target[(self.__y % EPaperModel.HEIGHT) * bytes_per_row + (self.__x % bytes_per_row)] = value
+            self.__uploaded_bytes += 1
+            if self.__x == self.__x_end:
+                self.__x = self.__x_start
+                self.__y = self.__y_start if self.__y == self.__y_end else self.__y + 1
+            else:
+                self.__x += 1
+            return
+
+        self.__parameters.append(value)
+        parameters = self.__parameters
+        if command == 0x44 and len(parameters) == 2:
+            self.__x_start, self.__x_end = parameters[0], parameters[1]
+        elif command == 0x45 and len(parameters) == 4:
+            self.__y_start = parameters[0] | parameters[1] << 8
+            self.__y_end = parameters[2] | parameters[3] << 8
+        elif command == 0x4E and len(parameters) == 1:
+            self.__x = parameters[0]
+        elif command == 0x4F and len(parameters) == 2:
+            self.__y = parameters[0] | parameters[1] << 8
+        elif command == 0x22 and len(parameters) == 1:
+            self.__update_mode = parameters[0]
+
+    def to_pbm(self, frame: bytes = None):
+        """
+        :return: given frame (displayed one by default) as binary PBM image in upright orientation
+        """
+        frame = self.shown if frame is None else frame
+        # Frame is stored rotated by 180 degrees and uses 1 for white pixels
+        pixels = bytes(0xff ^ int(f'{byte:08b}'[::-1], 2) for byte in reversed(frame))
+        return f'P4\n{EPaperModel.WIDTH} {EPaperModel.HEIGHT}\n'.encode('ascii') + pixels
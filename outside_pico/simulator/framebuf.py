@@ -0,0 +1,97 @@
+"""
+Stand-in for MicroPython framebuf module supporting MONO_HLSB frame buffers.
+
+NOTE: text is drawn with placeholder glyphs (deterministic patterns unique per character), since the built-in font of
+MicroPython is not available on the host.
+"""
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+def _placeholder_glyph(char: str):
+    code = ord(char)
+    rows = [0x00] * 8
+    if char == ' ':
+        return rows
+    for row in range(1, 7):
+        value = (code * 2654435761 + row * 40503) & 0xffffffff
+        rows[row] = (value >> 13) & 0x7e
+    return rows
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width: int, height: int, buffer_format: int, stride: int = None):
+        if buffer_format != MONO_HLSB:
+            raise ValueError("Only MONO_HLSB format is simulated")
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.__bytes_per_row = ((stride or width) + 7) // 8
+
+    def pixel(self, x: int, y: int, color: int = None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        index = y * self.__bytes_per_row + (x >> 3)
+        mask = 0x80 >> (x & 7)
+        if color is None:
+            return 1 if self.buffer[index] & mask else 0
+        if color & 1:
+            self.buffer[index] |= mask
+        else:
+            self.buffer[index] &= ~mask & 0xff
+
+    def fill(self, color: int):
+        value = 0xff if color & 1 else 0x00
+        for y in range(self.height):
+            start = y * self.__bytes_per_row
+            self.buffer[start:start + self.__bytes_per_row] = bytes([value]) * self.__bytes_per_row
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int):
+        left = max(0, x)
+        right = min(self.width, x + width)
+        top = max(0, y)
+        bottom = min(self.height, y + height)
+        if left >= right or top >= bottom:
+            return
+        for row in range(top, bottom):
+            column = left
+            while column < right:
+                index = row * self.__bytes_per_row + (column >> 3)
+                if column & 7 == 0 and column + 8 <= right:
+                    self.buffer[index] = 0xff if color & 1 else 0x00
+                    column += 8
+                    continue
+                self.pixel(column, row, color)
+                column += 1
+
+    def hline(self, x: int, y: int, width: int, color: int):
+        self.fill_rect(x, y, width, 1, color)
+
+    def vline(self, x: int, y: int, height: int, color: int):
+        self.fill_rect(x, y, 1, height, color)
+
+    def rect(self, x: int, y: int, width: int, height: int, color: int, fill=False):
+        if fill:
+            self.fill_rect(x, y, width, height, color)
+            return
+        self.hline(x, y, width, color)
+        self.hline(x, y + height - 1, width, color)
+        self.vline(x, y, height, color)
+        self.vline(x + width - 1, y, height, color)
+
+    def text(self, text: str, x: int, y: int, color=1):
+        for char in text:
+            for row, bits in enumerate(_placeholder_glyph(char)):
+                for column in range(8):
+                    if bits & (0x80 >> column):
+                        self.pixel(x + column, y + row, color)
+            x += 8
+
+    def blit(self, source: 'FrameBuffer', x: int, y: int, key=-1, palette=None):
+        for source_y in range(max(0, -y), min(source.height, self.height - y)):
+            for source_x in range(max(0, -x), min(source.width, self.width - x)):
+                color = source.pixel(source_x, source_y)
+                if color != key:
+                    self.pixel(x + source_x, y + source_y, color)
@@ -0,0 +1,139 @@
+"""
+Stand-in for MicroPython machine module. Peripherals are connected to simulated devices through the board.
+"""
+
+
+class Board:
+    """
+    Connections between peripherals used by the project and simulated devices
+    """
+
+    def __init__(self):
+        self.clock = None
+        # Pin id -> function returning level of input pin
+        self.pin_inputs: dict[int, callable] = {}
+        # Pin id -> function called with level written to output pin
+        self.pin_outputs: dict[int, callable] = {}
+        self.pins: dict[int, 'Pin'] = {}
+        # SPI bus id -> device with write(data: bytes) method
+        self.spi_devices: dict[int, any] = {}
+        # I2C address -> device with read_register(register: int, size: int) and write_register(register, data)
+        self.i2c_devices: dict[int, any] = {}
+        # UART id -> device with read(size), any() and write(data) methods
+        self.uart_devices: dict[int, any] = {}
+        # ADC channel -> function returning 16 bit reading
+        self.adc_inputs: dict[int, callable] = {}
+
+
+board = Board()
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, pin_id: int, mode=IN, pull=None, value=None):
+        self.id = pin_id
+        self.mode = mode
+        self.__value = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.__value = value
+        self.irq_handler = None
+        self.irq_trigger = 0
+        board.pins[pin_id] = self
+
+    def value(self, value=None):
+        if value is None:
+            if self.id in board.pin_inputs:
+                return board.pin_inputs[self.id]()
+            return self.__value
+        self.__value = 1 if value else 0
+        if self.id in board.pin_outputs:
+            board.pin_outputs[self.id](self.__value)
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self.irq_handler = handler
+        self.irq_trigger = trigger
+
+    def trigger_irq(self, rising: bool):
+        """
+        Called by simulated devices when level of input pin changes
+        """
+        if self.irq_handler is None:
+            return
+        if self.irq_trigger & (Pin.IRQ_RISING if rising else Pin.IRQ_FALLING):
+            self.irq_handler(self)
+
+
+class SPI:
+    def __init__(self, bus_id: int, baudrate=1000000, **_kwargs):
+        self.id = bus_id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=None, **_kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def write(self, data):
+        data = bytes(data)
+        # Transfer blocks the CPU for the time of sending all bits
+        board.clock.advance(len(data) * 8 * 1e6 / self.baudrate)
+        device = board.spi_devices.get(self.id)
+        if device is not None:
+            device.write(data)
+
+
+class I2C:
+    def __init__(self, bus_id: int, **_kwargs):
+        self.id = bus_id
+
+    def writeto_mem(self, address: int, register: int, data: bytes):
+        board.i2c_devices[address].write_register(register, bytes(data))
+
+    def readfrom_mem(self, address: int, register: int, size: int):
+        return board.i2c_devices[address].read_register(register, size)
+
+
+class UART:
+    def __init__(self, uart_id: int, baudrate=9600, **_kwargs):
+        self.id = uart_id
+        self.baudrate = baudrate
+
+    def any(self):
+        return board.uart_devices[self.id].any()
+
+    def read(self, size=None):
+        return board.uart_devices[self.id].read(size)
+
+    def readinto(self, buffer, size=None):
+        size = len(buffer) if size is None else min(size, len(buffer))
+        data = board.uart_devices[self.id].read(size)
+        if data is None:
+            return None
+        buffer[:len(data)] = data
+        return len(data)
+
+    def write(self, data):
+        return board.uart_devices[self.id].write(bytes(data))
+
+
+class ADC:
+    def __init__(self, channel: int):
+        self.channel = channel
+
+    def read_u16(self):
+        return board.adc_inputs[self.channel]()
@@ -0,0 +1,339 @@
+import _thread
+import cProfile
+import io
+import math
+import os
+import pstats
+import struct
+import sys
+import time
+import types
+
+from simulator import framebuf, machine
+from simulator.clock import VirtualClock
+from simulator.devices import WheelSensor, Phone, INA219Model, temperature_sensor_reading
+from simulator.epd_model import EPaperModel
+
+# Functions added to (or replaced in) the host time module
+TIME_FUNCTIONS = ('ticks_ms', 'ticks_us', 'ticks_cpu', 'ticks_diff', 'ticks_add', 'sleep', 'sleep_ms', 'sleep_us')
+
+# Directory containing src package of the project
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Hardware connections of the project
+WHEEL_SENSOR_PIN = 2
+BLE_UART = 0
+BLE_MODE_PIN = 15
+UPS_INA219_ADDRESS = 0x43
+TEMPERATURE_ADC_CHANNEL = 4
+EPD_SPI = 1
+
+
+# Stand-ins are created once, since project modules keep references to modules imported the first time
+utime = types.ModuleType('utime')
+thread = types.ModuleType('_thread')
+thread.__getattr__ = lambda name: getattr(_thread, name)
+
+
+def install_modules(clock: VirtualClock, thread_wrapper: callable = None):
+    """
+    Installs stand-ins of MicroPython modules (and time functions) using given clock. Project modules must be imported
+    after that.
+    :param thread_wrapper: optional function wrapping functions of started threads (e.g. to profile them)
+    :return: replaced modules and functions to be passed to uninstall_modules
+    """
+    machine.board.__init__()
+    machine.board.clock = clock
+
+    for name in TIME_FUNCTIONS:
+        setattr(utime, name, getattr(clock, name))
+    # Threads are scheduled by the virtual clock, other functions come from the host module
+    thread.start_new_thread = lambda function, args, kwargs=None: clock.start_thread(
+        thread_wrapper(function) if thread_wrapper is not None else function, args
+    )
+
+    original_modules: dict[str, any] = {}
+    for name, module in (('machine', machine), ('framebuf', framebuf), ('utime', utime), ('_thread', thread)):
+        original_modules[name] = sys.modules.get(name)
+        sys.modules[name] = module
+
+    original_time_functions: dict[str, any] = {}
+    for name in TIME_FUNCTIONS:
+        original_time_functions[name] = getattr(time, name, None)
+        setattr(time, name, getattr(clock, name))
+
+    if REPOSITORY_ROOT not in sys.path:
+        sys.path.insert(0, REPOSITORY_ROOT)
+    return original_modules, original_time_functions
+
+
+def uninstall_modules(installed: tuple[dict[str, any], dict[str, any]]):
+    """
+    Restores modules and functions replaced by install_modules
+    """
+    original_modules, original_time_functions = installed
+    for name, module in original_modules.items():
+        if module is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = module
+    for name, function in original_time_functions.items():
+        if function is None:
+            delattr(time, name)
+        else:
+            setattr(time, name, function)
+
+
+def synthetic_ride_profile(duration: float, cruise_speed=25., stop_interval=300., stop_duration=30.):
+    """
+    :return: speed profile (function of time in seconds returning km/h) of a ride with regular stops
+    (e.g. at traffic lights) and smooth speed changes in between
+    """
+
+    def speed(seconds: float):
+        if seconds < 5 or seconds > duration - 5:
+            return 0.
+        phase = seconds % stop_interval
+        if phase > stop_interval - stop_duration:
+            return 0.
+        # Accelerating for 10 seconds after a stop
+        acceleration = min(1., phase / 10.)
+        return acceleration * (cruise_speed + 5 * math.sin(seconds / 40.) + 2 * math.sin(seconds / 7.))
+
+    return speed
+
+
+class Simulation:
+    """
+    Runs unmodified Core of the project on the host with simulated peripherals and virtual time.
+    The phone connects shortly after start, answers requests of the device and periodically sends GPS statistics,
+    weather and map preview updates.
+    """
+    MAP_PREVIEW_SIZE = 128 * 128 // 8
+
+    def __init__(
+            self, duration: float, speed_profile: callable = None, min_sleep_us=2000, cpu_scale=0.,
+            profile_cpu=False, phone_connected=True, wheel_glitch_rate=0.
+    ):
+        """
+        :param duration: simulated time in seconds
+        :param speed_profile: function returning speed in km/h for given time in seconds (synthetic ride by default)
+        :param min_sleep_us: see VirtualClock; default matches main loop of the project counting 5000 iterations as
+        roughly 10 seconds
+        :param cpu_scale: see VirtualClock
+        :param profile_cpu: whether host execution of all simulated threads should be profiled
+        :param phone_connected: whether the phone connects to the device
+        :param wheel_glitch_rate: probability of a glitch of the wheel sensor on a magnet pass (see WheelSensor)
+        """
+        self.duration = duration
+        self.speed_profile = speed_profile if speed_profile is not None else synthetic_ride_profile(duration)
+        self.phone_connected = phone_connected
+        self.wheel_glitch_rate = wheel_glitch_rate
+        self.clock = VirtualClock(min_sleep_us=min_sleep_us, cpu_scale=cpu_scale)
+        self.profiles: list[cProfile.Profile] = [] if profile_cpu else None
+
+        self.epd = None
+        self.wheel = None
+        self.phone = None
+        self.battery = None
+        self.refresh_statistics: dict[str, dict[str, tuple]] = {}
+        self.wall_time = 0.
+
+    def run(self):
+        installed_modules = install_modules(self.clock, self.__profiled if self.profiles is not None else None)
+        try:
+            self.__connect_devices()
+            # Project modules are imported after installing stand-ins of MicroPython modules
+            from src.core import Core
+
+            start_time = time.perf_counter()
+            if self.profiles is not None:
+                self.__profiled(self.__run_core)(Core)
+            else:
+                self.__run_core(Core)
+            self.wall_time = time.perf_counter() - start_time
+        finally:
+            uninstall_modules(installed_modules)
+        return self
+
+    def __run_core(self, core_class: type):
+        core = core_class()
+        self.clock.stop_at(int(self.duration * 1e6))
+        try:
+            core.start()
+        except KeyboardInterrupt:
+            pass
+        core.close()
+        self.clock.join_threads()
+
+    def __profiled(self, function: callable):
+        def run(*args):
+            profile = cProfile.Profile()
+            self.profiles.append(profile)
+            profile.enable()
+            try:
+                function(*args)
+            finally:
+                profile.disable()
+
+        return run
+
+    # Simulated devices
+
+    def __connect_devices(self):
+        from src.epaper.epd_2in9 import EPD_2in9
+
+        self.epd = EPaperModel(self.clock, EPD_SPI, EPD_2in9.DC_PIN, EPD_2in9.CS_PIN, EPD_2in9.BUSY_PIN)
+        self.wheel = WheelSensor(
+            self.clock, WHEEL_SENSOR_PIN, self.speed_profile, glitch_rate=self.wheel_glitch_rate
+        )
+        self.battery = INA219Model(
+            self.clock, UPS_INA219_ADDRESS,
+            voltage_profile=lambda seconds: max(3., 4.1 - seconds / 36000),  # Discharging by 0.1V per hour
+            current_profile=lambda seconds: -300.
+        )
+        machine.board.adc_inputs[TEMPERATURE_ADC_CHANNEL] = lambda: temperature_sensor_reading(21.5)
+
+        self.phone = Phone(self.clock, BLE_UART, BLE_MODE_PIN)
+        if self.phone_connected:
+            self.__script_phone()
+
+    def __script_phone(self):
+        phone = self.phone
+        phone.connect(at_seconds=2)
+
+        phone.on_message(0x01, lambda _: self.__send_settings())  # REQUEST_SETTINGS
+        phone.on_message(0x03, lambda _: self.__send_ride_progress())  # REQUEST_PROGRESS_DATA
+        phone.on_message(0x04, self.__receive_refresh_statistics)  # REFRESH_STATISTICS
+
+        self.__every(3, 5, self.__send_gps_statistics)
+        self.__every(4, 600, self.__send_weather)
+        self.__every(6, 30, self.__send_map_preview)
+        # Refresh statistics are requested right before the end of simulation
+        phone.send(7, bytes(), at_seconds=max(0., self.duration - 1))  # REQUEST_REFRESH_STATISTICS
+
+    def __every(self, first_seconds: float, interval: float, action: callable):
+        def repeat():
+            action()
+            self.clock.call_at(self.clock.now_us + int(interval * 1e6), repeat)
+
+        self.clock.call_at(int(first_seconds * 1e6), repeat)
+
+    @property
+    def __seconds(self):
+        return self.clock.now_us / 1e6
+
+    def __send_settings(self):
+        # NOTE: weather is sent on its own schedule, since weather update makes the device request settings again
+        self.phone.send(1, struct.pack('f', 223.))  # SET_CIRCUMFERENCE
+
+    def __send_weather(self):
+        seconds = self.__seconds
+        wind_direction = (seconds / 20) % 360
+        wind_speed = 3 + 2 * math.sin(seconds / 1000)
+        self.phone.send(4, struct.pack('ff', wind_direction, wind_speed) + b'Simulated City')  # SET_WEATHER_DATA
+
+    def __send_gps_statistics(self):
+        seconds = self.__seconds
+        altitude = 200 + 30 * math.sin(seconds / 600)
+        slope = 5 * math.cos(seconds / 600)
+        heading = (seconds / 2) % 360
+        turn_distance = max(0., 300 - seconds % 400)
+        turn_angle = math.pi / 2
+        self.phone.send(3, struct.pack('5f', altitude, slope, heading, turn_distance, turn_angle))  # SET_GPS_STATISTICS
+
+    def __send_map_preview(self):
+        shift = int(self.__seconds // 30)
+        pixels = bytes(((index + shift) * 37 >> 3) & 0xff for index in range(Simulation.MAP_PREVIEW_SIZE))
+        self.phone.send(2, b'<MAP_PREVIEW>' + pixels + b'</MAP_PREVIEW>')  # SET_MAP_PREVIEW
+
+    def __send_ride_progress(self):
+        seconds = self.__seconds
+        time_in_motion = sum(1 for second in range(0, int(seconds), 5) if self.speed_profile(second) > 0) * 5
+        self.phone.send(5, struct.pack(
+            '5f', seconds * 1000, time_in_motion * 1000, self.wheel.distance, 40 * seconds / 3600, 35 * seconds / 3600
+        ))  # SET_PROGRESS_DATA
+
+    def __receive_refresh_statistics(self, data: bytes):
+        from src.epaper.refresh_statistics import RefreshStatistics
+
+        offset = 0
+        for kind in RefreshStatistics.KINDS:
+            self.refresh_statistics[kind] = {}
+            for phase in RefreshStatistics.PHASES:
+                self.refresh_statistics[kind][phase] = struct.unpack_from('I4f', data, offset)
+                offset += struct.calcsize('I4f')
+
+    # Results
+
+    def stop_delays(self, step=0.1):
+        """
+        :return: seconds between every stop of the wheel and the first speed update reporting 0 received by the phone
+        """
+        speed_updates = [
+            (time_us / 1e6, struct.unpack('f', data)[0]) for time_us, message, data in self.phone.received_messages
+            if message == 2  # UPDATE_SPEED
+        ]
+        delays: list[float] = []
+        previous_speed = 0.
+        for index in range(int(self.duration / step)):
+            seconds = index * step
+            speed = self.speed_profile(seconds)
+            if speed == 0 and previous_speed > 0:
+                shown = next((time for time, value in speed_updates if time >= seconds and round(value) == 0), None)
+                if shown is not None:
+                    delays.append(shown - seconds)
+            previous_speed = speed
+        return delays
+
+    def report(self, top_functions=20):
+        lines = [
+            f"Simulated time: {round(self.duration, 1)}s; wall time: {round(self.wall_time, 2)}s; "
+            f"speedup: {round(self.duration / max(self.wall_time, 1e-9), 1)}x",
+            f"Wheel passes: {self.wheel.passes}; sensor glitches: {self.wheel.glitches}; "
+            f"distance: {round(self.wheel.distance, 2)}km",
+            f"Messages received by the phone: {len(self.phone.received_messages)}; "
+            f"bytes sent by the phone: {self.phone.sent_bytes}",
+            f"SPI transactions: {self.epd.spi_transactions}; SPI bytes: {self.epd.spi_bytes}; "
+            f"power activations: {self.epd.power_activations}",
+        ]
+
+        stop_delays = self.stop_delays()
+        if len(stop_delays) > 0:
+            lines.append(
+                f"Stops: {len(stop_delays)}; shown after: average {round(sum(stop_delays) / len(stop_delays), 2)}s; "
+                f"max {round(max(stop_delays), 2)}s"
+            )
+
+        for kind in ('full', 'partial'):
+            refreshes = [refresh for refresh in self.epd.refreshes if refresh.kind == kind]
+            if len(refreshes) == 0:
+                lines.append(f"{kind} refreshes: 0")
+                continue
+            intervals = [b.start_us - a.start_us for a, b in zip(refreshes, refreshes[1:])]
+            toggled_pixels = sum(refresh.toggled_pixels for refresh in refreshes)
+            average_interval = sum(intervals) / len(intervals) / 1e6 if len(intervals) > 0 else 0.
+            lines.append(
+                f"{kind} refreshes: {len(refreshes)}; per hour: {round(len(refreshes) * 3600 / self.duration, 1)}; "
+                f"busy: {round(sum(refresh.duration_us for refresh in refreshes) / 1e6, 1)}s; "
+                f"average interval: {round(average_interval, 2)}s; "
+                f"average upload: {round(sum(refresh.uploaded_bytes for refresh in refreshes) / len(refreshes))}B; "
+                f"average toggled pixels: {round(toggled_pixels / len(refreshes))}"
+            )
+
+        for kind, phases in self.refresh_statistics.items():
+            for phase, (count, minimum, average, maximum, last) in phases.items():
+                lines.append(
+                    f"{kind} {phase}: count: {count}; min: {round(minimum, 2)}ms; avg: {round(average, 2)}ms; "
+                    f"max: {round(maximum, 2)}ms"
+                )
+
+        if self.profiles is not None and len(self.profiles) > 0:
+            output = io.StringIO()
+            statistics = pstats.Stats(self.profiles[0], stream=output)
+            for profile in self.profiles[1:]:
+                statistics.add(profile)
+            statistics.sort_stats('tottime').print_stats(top_functions)
+            lines.append(output.getvalue())
+
+        return '\n'.join(lines)
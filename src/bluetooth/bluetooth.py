@@ -2,19 +2,23 @@ import struct
 import time
 
 from src.bluetooth.base64 import b64encode
-from src.bluetooth.message import STAMP
+from src.bluetooth.frame_parser import FrameParser
+from src.bluetooth.message import STAMP, MAX_PAYLOAD_SIZE
 
 from src.bluetooth.pico_ble import PicoBLE
 
 
 class Bluetooth:
-    def __init__(self, connection_callback: callable, disconnect_callback: callable, data_callback: callable):
+    def __init__(self, connection_callback: callable, disconnect_callback: callable, message_callback: callable):
+        """
+        :param message_callback: called with message and memoryview of its payload (valid only during the call)
+        """
         self.__connected = False
         self.__paired = False
         self.__next_update_time = None
         self.__connection_callback = connection_callback
         self.__disconnect_callback = disconnect_callback
-        self.__data_callback = data_callback
+        self.__frame_parser = FrameParser(message_callback, MAX_PAYLOAD_SIZE)
 
         self.__pico_ble = PicoBLE()
 
@@ -42,6 +46,7 @@ class Bluetooth:
             if self.__pico_ble.ble_mode_pin.value() == 0:
                 self.__connected = False
                 self.__paired = False
+                self.__frame_parser.reset()
                 self.__disconnect_callback()
                 return
 
@@ -58,12 +63,15 @@ class Bluetooth:
 
             return
 
-        # Receiving data
-        if self.__pico_ble.uart.any() > 0:
-            data = self.__pico_ble.uart.read()
-            # print(rx_data)
-            self.__data_callback(data)
-            # self.__pico_ble.uart.write(data)  # ??
+        # Receiving data straight into the buffer of the frame parser
+        receive_buffer = self.__frame_parser.receive_buffer
+        available = self.__pico_ble.uart.any()
+        while available > 0:
+            received = self.__pico_ble.uart.readinto(receive_buffer, min(available, len(receive_buffer)))
+            if not received:
+                break
+            self.__frame_parser.parse(received)
+            available -= received
 
     def send_message(self, message: int, data=bytes()):
         if not self.__paired:
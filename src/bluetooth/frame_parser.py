@@ -0,0 +1,181 @@
+from src.bluetooth.message import STAMP
+
+# NOTE: payload bytes are copied by a viper kernel on the device (so no slices are allocated) and with slices on the host
+try:
+    import micropython
+
+    VIPER_KERNELS = True
+except ImportError:
+    VIPER_KERNELS = False
+
+if VIPER_KERNELS:
+    @micropython.viper
+    def __copy_kernel(target: ptr8, target_offset: int, source: ptr8, source_offset: int, length: int):
+        i = 0
+        while i < length:
+            target[target_offset + i] = source[source_offset + i]
+            i += 1
+
+
+def copy_bytes(target: bytearray, target_offset: int, source: bytearray, source_offset: int, length: int):
+    """
+    Copies given number of bytes between buffers without allocating on the device
+    """
+    if VIPER_KERNELS:
+        __copy_kernel(target, target_offset, source, source_offset, length)
+    else:
+        target[target_offset:target_offset + length] = source[source_offset:source_offset + length]
+
+
+def prefix_function(pattern: bytes):
+    """
+    :return: list with length of the longest proper prefix of the pattern which is also a suffix of its first n bytes
+    for every n (used to continue matching after a mismatch without going back in the stream)
+    """
+    fallback = [0] * (len(pattern) + 1)
+    matched = 0
+    for index in range(1, len(pattern)):
+        while matched > 0 and pattern[index] != pattern[matched]:
+            matched = fallback[matched]
+        if pattern[index] == pattern[matched]:
+            matched += 1
+        fallback[index + 1] = matched
+    return fallback
+
+
+class FrameParser:
+    """
+    Incremental parser of frames received from the mobile app: STAMP, message (1 byte), payload size (4 bytes, little
+    endian) and payload.
+    Bytes are received into a preallocated buffer and parsed in place: STAMP is matched byte by byte (also across
+    chunks), while the header and payload are gathered in preallocated buffers, so chunks of any size are parsed in
+    linear time without allocations. When a frame header is invalid, its bytes are scanned for the next STAMP instead
+    of dropping everything received.
+    """
+    RECEIVE_BUFFER_SIZE = 128
+    HEADER_SIZE = 5
+    __stamp_fallback = prefix_function(STAMP)
+
+    class STATE:
+        STAMP = 0
+        HEADER = 1
+        PAYLOAD = 2
+
+    def __init__(self, message_callback: callable, max_payload_size: int):
+        """
+        :param message_callback: called with message and memoryview of its payload (valid only during the call)
+        :param max_payload_size: larger payload sizes in frame headers are treated as corruption
+        """
+        self.__message_callback = message_callback
+        self.__receive_buffer = bytearray(FrameParser.RECEIVE_BUFFER_SIZE)
+        self.__header = bytearray(FrameParser.HEADER_SIZE)
+
+        self.__payload = bytearray(max_payload_size)
+        self.__payload_view = memoryview(self.__payload)
+
+        self.__state = FrameParser.STATE.STAMP
+        self.__stamp_matched = 0
+        self.__header_received = 0
+        self.__message = 0
+        self.__payload_size = 0
+        self.__payload_received = 0
+
+    @property
+    def receive_buffer(self):
+        """
+        Buffer to receive bytes into from its beginning (see parse)
+        """
+        return self.__receive_buffer
+
+    def reset(self):
+        """
+        Drops partially received frame (e.g. after the connection was lost)
+        """
+        self.__state = FrameParser.STATE.STAMP
+        self.__stamp_matched = 0
+
+    def parse(self, size: int):
+        """
+        Parses given number of bytes received at the beginning of receive_buffer
+        """
+        index = 0
+        while index < size:
+            if self.__state == FrameParser.STATE.STAMP:
+                index = self.__find_stamp(index, size)
+            elif self.__state == FrameParser.STATE.HEADER:
+                index = self.__receive_header(index, size)
+            else:
+                index = self.__receive_payload(index, size)
+
+    def __match_stamp(self, byte: int):
+        """
+        :return: True when the byte completes STAMP
+        """
+        while self.__stamp_matched > 0 and byte != STAMP[self.__stamp_matched]:
+            self.__stamp_matched = FrameParser.__stamp_fallback[self.__stamp_matched]
+        if byte == STAMP[self.__stamp_matched]:
+            self.__stamp_matched += 1
+            if self.__stamp_matched == len(STAMP):
+                self.__stamp_matched = 0
+                return True
+        return False
+
+    def __find_stamp(self, index: int, size: int):
+        """
+        :return: index of the first byte after STAMP or size if STAMP was not completed
+        """
+        buffer = self.__receive_buffer
+        while index < size:
+            if self.__match_stamp(buffer[index]):
+                self.__state = FrameParser.STATE.HEADER
+                self.__header_received = 0
+                return index + 1
+            index += 1
+        return size
+
+    def __receive_header(self, index: int, size: int):
+        """
+        :return: index of the first byte after the header or size if the header is not complete
+        """
+        while index < size and self.__header_received < FrameParser.HEADER_SIZE:
+            self.__header[self.__header_received] = self.__receive_buffer[index]
+            self.__header_received += 1
+            index += 1
+        if self.__header_received == FrameParser.HEADER_SIZE:
+            self.__parse_header()
+        return index
+
+    def __parse_header(self):
+        header = self.__header
+        message = header[0]
+        payload_size = header[1] | (header[2] << 8) | (header[3] << 16) | (header[4] << 24)
+        if payload_size > len(self.__payload):
+            print(f"Invalid frame header (message: {message}; payload size: {payload_size}); resynchronizing")
+            self.__state = FrameParser.STATE.STAMP
+            # Header bytes may start the next STAMP (they are shorter than STAMP, so they cannot complete it)
+            for index in range(FrameParser.HEADER_SIZE):
+                self.__match_stamp(header[index])
+            return
+
+        self.__message = message
+        self.__payload_size = payload_size
+        self.__payload_received = 0
+        self.__state = FrameParser.STATE.PAYLOAD
+        if payload_size == 0:
+            self.__finish_frame()
+
+    def __receive_payload(self, index: int, size: int):
+        """
+        :return: index of the first byte after the payload or size if the payload is not complete
+        """
+        count = min(self.__payload_size - self.__payload_received, size - index)
+        copy_bytes(self.__payload, self.__payload_received, self.__receive_buffer, index, count)
+        self.__payload_received += count
+        if self.__payload_received == self.__payload_size:
+            self.__finish_frame()
+        return index + count
+
+    def __finish_frame(self):
+        self.__state = FrameParser.STATE.STAMP
+        # NOTE: the only allocation per frame is the memoryview of the payload
+        self.__message_callback(self.__message, self.__payload_view[:self.__payload_size])
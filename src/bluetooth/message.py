@@ -1,15 +1,8 @@
 STAMP = bytes('mgdlnkczmr', 'ascii')
 IMAGE_DATA_PREFIX = bytes('<MAP_PREVIEW>', 'ascii')
 IMAGE_DATA_SUFFIX = bytes('</MAP_PREVIEW>', 'ascii')
-
-
-def is_stamp(data: bytes):
-    if len(data) != len(STAMP):
-        return False
-    for i in range(len(STAMP)):
-        if data[i] != STAMP[i]:
-            return False
-    return True
+# Map preview is the largest message received from the mobile app
+MAX_PAYLOAD_SIZE = len(IMAGE_DATA_PREFIX) + (128 * 128 // 8) + len(IMAGE_DATA_SUFFIX)
 
 
 def is_correct_map_preview_data(data: bytes):
@@ -29,3 +22,4 @@ class Message:
     REQUEST_SETTINGS = 0x01
     UPDATE_SPEED = 0x02
     REQUEST_PROGRESS_DATA = 0x03
+    REFRESH_STATISTICS = 0x04
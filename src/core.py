@@ -4,7 +4,7 @@ import time
 
 from src.battery.battery import Battery
 from src.bluetooth.bluetooth import Bluetooth
-from src.bluetooth.message import Message, STAMP, is_stamp, is_correct_map_preview_data, IMAGE_DATA_PREFIX
+from src.bluetooth.message import Message, is_correct_map_preview_data, IMAGE_DATA_PREFIX
 from src.common.utils import parse_time
 from src.epaper.epaper import Epaper
 from src.speedometer import Speedometer
@@ -18,23 +18,26 @@ class MODE:
 
 
 class Core:
+    # Wheel pulses are captured by interrupt, so the second thread only needs to keep up with UART receive buffer
+    __SECOND_THREAD_PERIOD_MS = 2
+    # Ride progress is counted on the device, the mobile app is asked for it (and for altitude changes) when the bike
+    # stops and rarely otherwise (5 minutes)
+    __RIDE_PROGRESS_UPDATE_INTERVAL_MS = 300000
+
     def __init__(self):
         self.__running = False
         self.__mode = MODE.WELCOME_SCREEN
         self.__refresh_main_view = False
-
-        self.__previous_realtime_data: dict[str, float] = {
-            'speed': 0,
-            'altitude': 0,
-            'slope': 0,
-            'heading': 0,
-            'turnDistance': 0,
-            'turnAngle': 0,
-            'map_preview_changed': False,
-            'ride_progress_changed': False,
-            'paired': False
-        }
-        self.__bluetooth_data_buffer = bytes()
+        self.__static_area_changed = False
+
+        # Speed at the time of the last realtime data redraw
+        self.__previous_speed = 0.
+        # Quantized values the displayed realtime data was drawn with (see Epaper.real_time_data_model)
+        self.__realtime_model: tuple = ()
+        # Rounded speed the realtime model was last built with
+        self.__realtime_model_speed = None
+        # Set by handlers of data displayed in realtime data area, so the model is rebuilt only after a change
+        self.__realtime_data_invalidated = True
         self.__map_preview_data = bytes([0xff] * (128 * 128 // 8))
         self.__gps_statistics = {
             'altitude': 0.,
@@ -66,13 +69,12 @@ class Core:
         self.__speedometer = Speedometer(circumference=223)
         self.__epaper = Epaper()
         self.__last_ride_progress_update_time = time.ticks_ms()
-        self.__last_epaper_restart_time = time.ticks_ms()
         self.__last_any_activity_time = time.ticks_ms()
 
         self.__bluetooth = Bluetooth(
             connection_callback=self.__on_bluetooth_connection,
-            disconnect_callback=lambda: print("Bluetooth connection lost"),
-            data_callback=self.__handle_bluetooth_data
+            disconnect_callback=self.__on_bluetooth_disconnection,
+            message_callback=self.__on_bluetooth_message
         )
 
     def close(self):
@@ -83,15 +85,16 @@ class Core:
         if not self.__bluetooth.paired:
             return False
 
-        if round(self.__speedometer.current_speed) == 0 and round(self.__previous_realtime_data['speed']) > 0:
+        if round(self.__speedometer.current_speed) == 0 and round(self.__previous_speed) > 0:
             return True
 
-        # 1e3 * 60 * 1 = 60000 milliseconds = 1 minute
-        return time.ticks_diff(time.ticks_ms(), self.__last_ride_progress_update_time) > 60000
+        return time.ticks_diff(
+            time.ticks_ms(), self.__last_ride_progress_update_time
+        ) > Core.__RIDE_PROGRESS_UPDATE_INTERVAL_MS
 
     def __time_for_epaper_restart(self):
-        # 1e3 * 60 * 7 = 420000 milliseconds = 7 minutes
-        return time.ticks_diff(time.ticks_ms(), self.__last_epaper_restart_time) > 420000
+        # Full refresh is less disturbing when bike is stopped
+        return self.__epaper.full_refresh_due(convenient=round(self.__speedometer.current_speed) == 0)
 
     def __time_for_sleep_mode(self):
         # 1e3 * 60 * 30 = 1800000 milliseconds = 30 minutes
@@ -104,7 +107,6 @@ class Core:
             self.__bluetooth.send_message(Message.REQUEST_PROGRESS_DATA)
 
     def __restart_epaper(self):
-        self.__last_epaper_restart_time = time.ticks_ms()
         print("Restarting epaper")
         self.__epaper.restart()
 
@@ -141,11 +143,7 @@ class Core:
 
         while self.__running:
             if self.__refresh_main_view:
-                # if self.__time_for_epaper_restart():
                 self.__restart_epaper()
-                # else:
-                #     self.__epaper.clear(init_only=True)
-
                 self.__draw_main_view()
                 self.__redraw_realtime_data(force=True)
                 try:
@@ -153,6 +151,7 @@ class Core:
                 except KeyboardInterrupt:
                     break
                 self.__refresh_main_view = False
+                self.__static_area_changed = False
                 continue
 
             if self.__mode == MODE.DATA_SCREEN:
@@ -165,16 +164,27 @@ class Core:
                         continue
 
                     if self.__time_for_epaper_restart():
-                        self.__restart_epaper()
-                        self.__draw_main_view()
-                        self.__redraw_realtime_data(force=True)
+                        self.__refresh_main_view = True
                         continue
 
+                    if not self.__epaper.busy:
+                        self.__epaper.draw_battery(self.__battery.level, self.__battery.charging)
+                    self.__update_ride_progress()
+
                     if self.__time_for_ride_progress_update():
                         self.__request_ride_progress_update()
                         continue
 
+                if self.__static_area_changed and not self.__epaper.busy:
+                    self.__static_area_changed = False
+                    if self.__time_for_epaper_restart():
+                        self.__refresh_main_view = True
+                    else:
+                        self.__draw_main_view(full_refresh=False)
+                    continue
+
                 self.__redraw_realtime_data()
+                self.__epaper.update()
 
                 try:
                     time.sleep_ms(1)
@@ -193,7 +203,7 @@ class Core:
             except KeyboardInterrupt:
                 break
 
-    def __draw_main_view(self):
+    def __draw_main_view(self, full_refresh=True):
         if self.__bluetooth.paired and self.__mobile_app_state == 0:
             print("Requesting settings data")
             self.__bluetooth.send_message(Message.REQUEST_SETTINGS)
@@ -202,51 +212,44 @@ class Core:
             f"Battery: {round(self.__battery.level * 100)}%; {'charging' if self.__battery.charging else 'discharging'}")
         self.__epaper.draw_static_area(
             self.__temperature.get_celsius(), self.__wind_direction, self.__wind_speed, self.__city_name,
-            self.__battery.level, self.__battery.charging
+            self.__battery.level, self.__battery.charging, full_refresh
         )
 
-    def __realtime_data_changed(self):
-        # NOTE the rounding. It should match rounding parameters during realtime data rendering on epaper
-
-        if round(self.__previous_realtime_data['speed']) != round(self.__speedometer.current_speed):
-            return True
-
-        if round(self.__previous_realtime_data['altitude']) != round(self.__gps_statistics['altitude']):
-            return True
-
-        if round(self.__previous_realtime_data['slope'], 1) != round(self.__gps_statistics['slope'], 1):
-            return True
-
-        if round(self.__previous_realtime_data['heading']) != round(self.__gps_statistics['heading']):
-            return True
-
-        if round(self.__previous_realtime_data['turnDistance']) != round(self.__gps_statistics['turnDistance']):
-            return True
-
-        # 57.2957795131 = 180 / pi
-        if round(self.__previous_realtime_data['turnAngle'] * 57.2957795131) != \
-                round(self.__gps_statistics['turnAngle'] * 57.2957795131):
-            return True
-
-        if self.__previous_realtime_data['map_preview_changed']:
-            return True
-
-        if round(self.__speedometer.current_speed) == 0 and self.__previous_realtime_data['ride_progress_changed']:
-            return True
+    def __realtime_data(self):
+        return (
+            self.__speedometer.current_speed,
+            self.__ride_progress,
+            self.__gps_statistics,
+            self.__map_preview_data,
+            self.__wind_direction,
+            self.__bluetooth.paired
+        )
 
-        if self.__previous_realtime_data['paired'] != self.__bluetooth.paired:
-            return True
+    def __update_ride_progress(self):
+        ride_statistics = self.__speedometer.ride_statistics
+        self.__ride_progress['rideDuration'] = ride_statistics.ride_duration
+        self.__ride_progress['timeInMotion'] = ride_statistics.time_in_motion
+        self.__ride_progress['traveledDistance'] = ride_statistics.traveled_distance
+        self.__invalidate_realtime_data()
 
-        return False
+    def __invalidate_realtime_data(self):
+        self.__realtime_data_invalidated = True
 
     def __redraw_realtime_data(self, force=False):
-        if self.__epaper.busy:
+        # NOTE: frame drawn while epaper is busy is displayed right after the current refresh finishes
+        # NOTE: speed is displayed rounded to km/h and other data changes are notified by their handlers, so the model
+        # is rebuilt only when rounded speed changes or after a notification
+        speed = round(self.__speedometer.current_speed)
+        if not force and not self.__realtime_data_invalidated and speed == self.__realtime_model_speed:
             return
+        self.__realtime_data_invalidated = False
+        self.__realtime_model_speed = speed
 
-        data_changed = self.__realtime_data_changed()
-
-        if not data_changed and not force:
+        realtime_data = self.__realtime_data()
+        model = self.__epaper.real_time_data_model(*realtime_data)
+        if not force and model == self.__realtime_model:
             return
+        self.__realtime_model = model
 
         try:
             if self.__mobile_app_state == 0:
@@ -257,31 +260,24 @@ class Core:
 
         self.__last_any_activity_time = time.ticks_ms()
 
-        self.__previous_realtime_data['speed'] = self.__speedometer.current_speed
-        self.__previous_realtime_data['altitude'] = self.__gps_statistics['altitude']
-        self.__previous_realtime_data['slope'] = self.__gps_statistics['slope']
-        self.__previous_realtime_data['heading'] = self.__gps_statistics['heading']
-        self.__previous_realtime_data['turnDistance'] = self.__gps_statistics['turnDistance']
-        self.__previous_realtime_data['turnAngle'] = self.__gps_statistics['turnAngle']
-        self.__previous_realtime_data['paired'] = self.__bluetooth.paired
-        self.__previous_realtime_data['map_preview_changed'] = False
-        self.__previous_realtime_data['ride_progress_changed'] = False
-        self.__epaper.draw_real_time_data(
-            self.__speedometer.current_speed,
-            self.__ride_progress,
-            self.__gps_statistics,
-            self.__map_preview_data,
-            self.__wind_direction,
-            self.__bluetooth.paired
-        )
+        self.__previous_speed = self.__speedometer.current_speed
+        self.__epaper.draw_real_time_data(*realtime_data)
 
     def __on_bluetooth_connection(self):
         print("Bluetooth connection established")
+        self.__invalidate_realtime_data()
         if self.__mode != MODE.DATA_SCREEN:
             self.__mode = MODE.DATA_SCREEN
             self.__refresh_main_view = True
 
-    def __handle_message(self, message: int, data: bytes):
+    def __on_bluetooth_disconnection(self):
+        print("Bluetooth connection lost")
+        self.__invalidate_realtime_data()
+
+    def __handle_message(self, message: int, data: memoryview):
+        """
+        :param data: payload of the message valid only during the call
+        """
         self.__last_any_activity_time = time.ticks_ms()
 
         if message == 1:  # SET_CIRCUMFERENCE
@@ -292,11 +288,11 @@ class Core:
             if is_correct_map_preview_data(data):
                 print("Updating map preview image")
                 del self.__map_preview_data
-                self.__map_preview_data = data[
-                                          len(IMAGE_DATA_PREFIX):
-                                          len(IMAGE_DATA_PREFIX) + (128 * 128 // 8)
-                                          ]
-                self.__previous_realtime_data['map_preview_changed'] = True
+                self.__map_preview_data = bytes(data[
+                                                len(IMAGE_DATA_PREFIX):
+                                                len(IMAGE_DATA_PREFIX) + (128 * 128 // 8)
+                                                ])
+                self.__invalidate_realtime_data()
             else:
                 print("Invalid map preview data")
         elif message == 3:  # SET GPS STATISTICS
@@ -308,14 +304,16 @@ class Core:
                 self.__gps_statistics['heading'] = struct.unpack('f', data[8:12])[0]
                 self.__gps_statistics['turnDistance'] = struct.unpack('f', data[12:16])[0]
                 self.__gps_statistics['turnAngle'] = struct.unpack('f', data[16:20])[0]
+                self.__invalidate_realtime_data()
         elif message == 4:  # SET WEATHER DATA
             self.__wind_direction = struct.unpack('f', data[:4])[0]  # degrees
             self.__wind_speed = struct.unpack('f', data[4:8])[0]  # m/s
-            self.__city_name = data[8:].decode('ascii')
+            self.__city_name = bytes(data[8:]).decode('ascii')
             print(
                 f"Updating weather data; wind direction: {self.__wind_direction}°; wind speed: {self.__wind_speed}m/s; city: {self.__city_name}")
             if self.__mode == MODE.DATA_SCREEN:
-                self.__refresh_main_view = True
+                self.__static_area_changed = True
+            self.__invalidate_realtime_data()
         elif message == 5:  # SET_PROGRESS_DATA
             if len(data) >= 20:
                 ride_duration = struct.unpack('f', data[:4])[0]
@@ -324,63 +322,31 @@ class Core:
                 up = struct.unpack('f', data[12:16])[0]
                 down = struct.unpack('f', data[16:20])[0]
 
-                changed = ride_duration != self.__ride_progress['rideDuration'] or \
-                          time_in_motion != self.__ride_progress['timeInMotion'] or \
-                          round(traveled_distance * 1000) != round(self.__ride_progress['traveledDistance'] * 1000) or \
-                          round(up) != round(self.__ride_progress['altitudeChange']['up']) or \
-                          round(down) != round(self.__ride_progress['altitudeChange']['down'])
+                print(
+                    f"Received ride progress data: duration: {parse_time(round(ride_duration))}; time in motion: {parse_time(round(time_in_motion))}; traveled distance: {traveled_distance}km; up: {up}m; down: {down}m")
 
+                ride_statistics = self.__speedometer.ride_statistics
                 print(
-                    f"Received ride progress data: duration: {parse_time(round(ride_duration))}; time in motion: {parse_time(round(time_in_motion))}; traveled distance: {traveled_distance}km; up: {up}m; down: {down}m; changed: {changed}")
+                    f"Ride statistics counted on the device: duration: {parse_time(round(ride_statistics.ride_duration))}; time in motion: {parse_time(round(ride_statistics.time_in_motion))}; traveled distance: {ride_statistics.traveled_distance}km; average speed: {ride_statistics.average_speed}km/h; max speed: {ride_statistics.max_speed}km/h")
+                ride_statistics.reconcile(ride_duration, time_in_motion, traveled_distance)
 
-                self.__ride_progress['rideDuration'] = ride_duration
-                self.__ride_progress['timeInMotion'] = time_in_motion
-                self.__ride_progress['traveledDistance'] = traveled_distance
                 self.__ride_progress['altitudeChange']['up'] = up
                 self.__ride_progress['altitudeChange']['down'] = down
-                self.__previous_realtime_data['ride_progress_changed'] = changed
+                self.__update_ride_progress()
         elif message == 6:  # SET_MOBILE_APP_STATE
             if len(data) >= 1:
                 state: int = struct.unpack('b', data[:1])[0]
                 print(f"Mobile app state changed: {state}")
                 self.__mobile_app_state = state
+        elif message == 7:  # REQUEST_REFRESH_STATISTICS
+            print(f"Epaper refresh statistics:\n{self.__epaper.refresh_statistics}")
+            print(self.__epaper.text_cache)
+            self.__bluetooth.send_message(Message.REFRESH_STATISTICS, self.__epaper.refresh_statistics.pack())
 
-    def __handle_bluetooth_data(self, data: bytes):
-        # print(f"Received {len(data)} bytes")
-        self.__bluetooth_data_buffer += data
-
-        metadata_size = 15
-
-        if len(self.__bluetooth_data_buffer) < len(STAMP):
-            return
-
-        if not is_stamp(self.__bluetooth_data_buffer[:len(STAMP)]):
-            del self.__bluetooth_data_buffer
-            self.__bluetooth_data_buffer = bytes()
-            return
-
-        if len(self.__bluetooth_data_buffer) < metadata_size:
-            return
-
+    def __on_bluetooth_message(self, message: int, data: memoryview):
+        print(f"Received message: {message}; raw data size: {len(data)};")
         try:
-            message = self.__bluetooth_data_buffer[len(STAMP)]
-            raw_data_size = (self.__bluetooth_data_buffer[len(STAMP) + 1] << 0) + \
-                            (self.__bluetooth_data_buffer[len(STAMP) + 2] << 8) + \
-                            (self.__bluetooth_data_buffer[len(STAMP) + 3] << 16) + \
-                            (self.__bluetooth_data_buffer[len(STAMP) + 4] << 24)
-            if len(self.__bluetooth_data_buffer) < raw_data_size + metadata_size:
-                # print(
-                #     f"Awaiting {raw_data_size + metadata_size - len(self.__bluetooth_data_buffer)} more bytes for message {message}")
-                return
-            raw_data = self.__bluetooth_data_buffer[metadata_size:metadata_size + raw_data_size]
-            print(f"Received message: {message}; raw data size: {raw_data_size};")
-            try:
-                self.__handle_message(message, raw_data)
-            except Exception as e:
-                print(f"Exception: {e}")
-            self.__bluetooth_data_buffer = self.__bluetooth_data_buffer[raw_data_size + metadata_size:]
-            if len(self.__bluetooth_data_buffer) >= metadata_size:
-                self.__handle_bluetooth_data(bytes())
+            self.__handle_message(message, data)
         except Exception as e:
             print(f"Exception: {e}")
 
@@ -391,9 +357,7 @@ class Core:
             self.__temperature.update()
 
             try:
-                time.sleep_us(1)
-            except AttributeError:
-                time.sleep(1e-6)
+                time.sleep_ms(Core.__SECOND_THREAD_PERIOD_MS)
             except KeyboardInterrupt:
                 break
         return
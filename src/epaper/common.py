@@ -1,4 +1,4 @@
-bits_order_reverse_lut = [0, 128, 64, 192, 32, 160, 96, 224, 16, 144, 80, 208, 48, 176, 112, 240,
+bits_order_reverse_lut = bytes([0, 128, 64, 192, 32, 160, 96, 224, 16, 144, 80, 208, 48, 176, 112, 240,
                           8, 136, 72, 200, 40, 168, 104, 232, 24, 152, 88, 216, 56, 184, 120,
                           248, 4, 132, 68, 196, 36, 164, 100, 228, 20, 148, 84, 212, 52, 180,
                           116, 244, 12, 140, 76, 204, 44, 172, 108, 236, 28, 156, 92, 220, 60,
@@ -14,11 +14,173 @@ bits_order_reverse_lut = [0, 128, 64, 192, 32, 160, 96, 224, 16, 144, 80, 208, 4
                           83, 211, 51, 179, 115, 243, 11, 139, 75, 203, 43, 171, 107, 235, 27,
                           155, 91, 219, 59, 187, 123, 251, 7, 135, 71, 199, 39, 167, 103, 231, 23,
                           151, 87, 215, 55, 183, 119, 247, 15, 143, 79, 207, 47, 175, 111, 239,
-                          31, 159, 95, 223, 63, 191, 127, 255]
+                          31, 159, 95, 223, 63, 191, 127, 255])
+
+# Number of set bits in every byte value
+bits_count_lut = bytes([bin(value).count('1') for value in range(256)])
+
+
+# NOTE: bulk transforms below use viper kernels on the device and translate tables with slices on the host
+try:
+    import micropython
+
+    VIPER_KERNELS = True
+except ImportError:
+    VIPER_KERNELS = False
+
+if VIPER_KERNELS:
+    @micropython.viper
+    def __translate_kernel(buffer: ptr8, length: int, lut: ptr8):
+        i = 0
+        while i < length:
+            buffer[i] = lut[buffer[i]]
+            i += 1
+
+    @micropython.viper
+    def __reverse_kernel(buffer: ptr8, length: int, lut: ptr8, translate: int):
+        i = 0
+        j = length - 1
+        while i < j:
+            swap = buffer[i]
+            if translate:
+                buffer[i] = lut[buffer[j]]
+                buffer[j] = lut[swap]
+            else:
+                buffer[i] = buffer[j]
+                buffer[j] = swap
+            i += 1
+            j -= 1
+        if translate and i == j:
+            buffer[i] = lut[buffer[i]]
+
+    @micropython.viper
+    def __xor_kernel(target: ptr8, buffer: ptr8, previous_buffer: ptr8, length: int):
+        i = 0
+        while i < length:
+            target[i] = buffer[i] ^ previous_buffer[i]
+            i += 1
+
+    @micropython.viper
+    def __count_toggled_kernel(buffer: ptr8, previous_buffer: ptr8, length: int, lut: ptr8) -> int:
+        count = 0
+        i = 0
+        while i < length:
+            count += lut[buffer[i] ^ previous_buffer[i]]
+            i += 1
+        return count
+
+
+def reverse_bits(buffer: bytearray, start=0, end=None):
+    """
+    Reverses order of bits within each byte of given range of buffer (in place)
+    :param start: index of the first byte
+    :param end: index after the last byte (end of buffer by default)
+    """
+    end = len(buffer) if end is None else end
+    if VIPER_KERNELS:
+        __translate_kernel(memoryview(buffer)[start:end], end - start, bits_order_reverse_lut)
+    else:
+        buffer[start:end] = buffer[start:end].translate(bits_order_reverse_lut)
+
+
+def reverse_bytes(buffer: bytearray, start=0, end=None):
+    """
+    Reverses order of bytes in given range of buffer (in place)
+    :param start: index of the first byte
+    :param end: index after the last byte (end of buffer by default)
+    """
+    end = len(buffer) if end is None else end
+    if VIPER_KERNELS:
+        __reverse_kernel(memoryview(buffer)[start:end], end - start, bits_order_reverse_lut, 0)
+    else:
+        buffer[start:end] = buffer[start:end][::-1]
+
+
+def rotate_180(buffer: bytearray, start=0, end=None):
+    """
+    Rotates given range of full width MONO_HLSB buffer by 180 degrees (in place).
+    It reverses order of bytes and order of bits within each byte in a single pass.
+    :param start: index of the first byte (should be at the beginning of a row)
+    :param end: index after the last byte (should be at the end of a row; end of buffer by default)
+    """
+    end = len(buffer) if end is None else end
+    if VIPER_KERNELS:
+        __reverse_kernel(memoryview(buffer)[start:end], end - start, bits_order_reverse_lut, 1)
+    else:
+        buffer[start:end] = buffer[start:end][::-1].translate(bits_order_reverse_lut)
+
+
+def xor_diff(buffer: bytearray, previous_buffer: bytearray, start: int, end: int, previous_offset=0, target=None):
+    """
+    Computes XOR of two buffers in given range of bytes. Set bits of result mark toggled pixels.
+    :param previous_offset: index in the buffer corresponding to the first byte of the previous_buffer
+    :param target: optional buffer (at least end - start bytes long) for the result to avoid allocation
+    :return: target buffer with XOR of given range stored from its beginning
+    """
+    length = end - start
+    if target is None:
+        target = bytearray(length)
+    if VIPER_KERNELS:
+        __xor_kernel(
+            target, memoryview(buffer)[start:end],
+            memoryview(previous_buffer)[start - previous_offset:end - previous_offset], length
+        )
+    else:
+        diff = int.from_bytes(buffer[start:end], 'big') ^ \
+            int.from_bytes(previous_buffer[start - previous_offset:end - previous_offset], 'big')
+        target[:length] = diff.to_bytes(length, 'big')
+    return target
+
+
+def copy_region(
+        source: bytearray, source_width: int, source_x: int, source_y: int,
+        target: bytearray, target_width: int, target_x: int, target_y: int,
+        width: int, height: int
+):
+    """
+    Copies rectangular region between MONO_HLSB buffers row by row with memoryview slices.
+    Horizontal positions and sizes are given in pixels and must be multiples of 8.
+    :param source_width: width of source image in pixels
+    :param target_width: width of target image in pixels
+    """
+    if (source_x | target_x | width | source_width | target_width) & 0x07:
+        raise ValueError("Region copy requires horizontal positions and sizes aligned to 8 pixels")
+
+    source_row_bytes = source_width // 8
+    target_row_bytes = target_width // 8
+    row_bytes = width // 8
+    source_view = memoryview(source)
+    target_view = memoryview(target)
+    if source_x == 0 and target_x == 0 and row_bytes == source_row_bytes == target_row_bytes:
+        # Rows are contiguous in both buffers
+        source_start = source_y * source_row_bytes
+        target_start = target_y * target_row_bytes
+        target_view[target_start:target_start + height * row_bytes] = \
+            source_view[source_start:source_start + height * row_bytes]
+        return
+
+    for row in range(height):
+        source_start = (source_y + row) * source_row_bytes + source_x // 8
+        target_start = (target_y + row) * target_row_bytes + target_x // 8
+        target_view[target_start:target_start + row_bytes] = source_view[source_start:source_start + row_bytes]
 
 
 def reverse_bytearray(array: bytearray):
-    _reversed = bytearray(len(array))
-    for i in range(len(array)):
-        _reversed[i] = bits_order_reverse_lut[array[len(array) - i - 1]]
+    _reversed = bytearray(array)
+    rotate_180(_reversed)
     return _reversed
+
+
+def count_toggled_pixels(buffer: bytearray, previous_buffer: bytearray, start: int, end: int, previous_offset=0):
+    """
+    Counts bits that differ between two buffers in given range of bytes
+    :param previous_offset: index in the buffer corresponding to the first byte of the previous_buffer
+    """
+    if VIPER_KERNELS:
+        return __count_toggled_kernel(
+            memoryview(buffer)[start:end],
+            memoryview(previous_buffer)[start - previous_offset:end - previous_offset], end - start, bits_count_lut
+        )
+    diff = int.from_bytes(buffer[start:end], 'big') ^ \
+        int.from_bytes(previous_buffer[start - previous_offset:end - previous_offset], 'big')
+    return bin(diff).count('1')
@@ -1,10 +1,17 @@
 import framebuf
+import time
+from binascii import crc32
 from math import pi
 
 from src.epaper.images import Images
 from src.epaper.epd_2in9 import EPD_2in9
-from src.epaper.font import Font
-from src.epaper.common import bits_order_reverse_lut, reverse_bytearray
+from src.epaper.font import Font, BuiltinFont
+from src.epaper.icons import BatteryIcon
+from src.epaper.layout import Layout, Widget
+from src.epaper.text_cache import TextCache
+from src.epaper.common import count_toggled_pixels
+from src.epaper.refresh_scheduler import RefreshScheduler
+from src.epaper.refresh_statistics import RefreshStatistics
 from src.common.utils import degrees_to_compass_direction, parse_time
 
 __arrows = ['⬆', '⬈', '➡', '⬊', '⬇', '⬋', '⬅', '⬉', '⬆']
@@ -25,20 +32,35 @@ class Epaper:
     __line_height = 10
     __char_width = 8
     __static_area_height = 40  # It leaves 256 px of screen height
+    __dirty_band_height = 8  # Granularity (in pixel rows) of real time data changes detection
+    __text_cache_size = 4096  # Memory limit (in bytes) of rendered text blocks
 
     def __init__(self):
-        self.__epd = EPD_2in9()
+        self.__refresh_statistics = RefreshStatistics()
+        self.__epd = EPD_2in9(statistics=self.__refresh_statistics)
 
         self.__buffers: dict[str, bytearray] = {}
         self.__frame_buffers: dict[str, framebuf.FrameBuffer] = {}
         self.__prepare()
 
+        real_time_area_height = self.__epd.height - Epaper.__static_area_height
+        # Parts of the screen (ranges of rows) with separately tracked ghosting
+        self.__refresh_regions = (
+            ('map_preview', 0, real_time_area_height // 2),
+            ('real_time_data', real_time_area_height // 2, real_time_area_height),
+            ('static_area', real_time_area_height, self.__epd.height)
+        )
+        self.__refresh_scheduler = RefreshScheduler(
+            {name: (end - start) * self.__epd.width for name, start, end in self.__refresh_regions}
+        )
+
     def close(self):
         self.__epd.sleep()
 
     def restart(self):
         self.__epd.sleep()
-        self.__epd = EPD_2in9()
+        self.__epd = EPD_2in9(statistics=self.__refresh_statistics)
+        self.__real_time_data_sent = False
 
     @property
     def width(self):
@@ -48,20 +70,46 @@ class Epaper:
     def height(self):
         return self.__epd.height
 
+    @property
+    def text_cache(self):
+        return self.__text_cache
+
+    @property
+    def refresh_statistics(self):
+        """
+        Durations of rendering and refresh phases for full and partial refreshes
+        """
+        return self.__refresh_statistics
+
+    def __record_render_time(self, kind: str, start_time: int):
+        self.__refresh_statistics.add(kind, 'render', time.ticks_diff(time.ticks_us(), start_time))
+
+    def full_refresh_due(self, convenient: bool):
+        """
+        Whether enough partial refreshes have been done to justify full refresh (restart and redraw) of the display
+        :param convenient: whether full refresh would not disturb the user at the moment (e.g. bike is stopped)
+        """
+        return self.__refresh_scheduler.full_refresh_due(convenient)
+
     @property
     def busy(self):
-        return self.__epd.is_busy()
+        """
+        Whether display is still refreshing after the last draw call. Drawing while busy is allowed, but it waits for
+        the refresh to finish.
+        """
+        return self.__epd.refreshing
 
     def __prepare(self):
-        self.__buffers['logo'] = bytearray([0xff] * (self.__epd.height * self.__epd.width // 8))
-        offset_top = (self.__epd.height // 2) * self.__epd.width // 8
-        for index in range(len(Images.AUTHOR_LOGO)):
-            bit = Images.AUTHOR_LOGO[len(Images.AUTHOR_LOGO) - 1 - index]
-            self.__buffers['logo'][index + offset_top] = bits_order_reverse_lut[bit]
+        self.__battery_icon = BatteryIcon()
+        # Whether static area is currently displayed (text, logo and clearing draw over it)
+        self.__static_area_shown = False
+        # State the static area was last rendered from
+        self.__static_area_state: dict[str, any] = {}
 
+        self.__text_cache = TextCache(BuiltinFont(), Epaper.__text_cache_size)
         self.__fonts = {
-            'common_24px': Font(Images.COMMON_24PX, 128, 128, Images.COMMON_24PX_GLYPHS, 24),
-            'digits_104px': Font(Images.DIGITS_104PX, 256, 256, Images.DIGITS_104PX_GLYPHS, 104),
+            'common_24px': Font(Images.COMMON_24PX),
+            'digits_104px': Font(Images.DIGITS_104PX),
         }
 
         self.__buffers['static_area'] = bytearray([0xff] * (self.__epd.height * self.__epd.width // 8))
@@ -69,188 +117,269 @@ class Epaper:
             self.__buffers['static_area'], self.__epd.width, self.__epd.height, framebuf.MONO_HLSB
         )
 
-        self.__buffers['real_time_data'] = bytearray(
-            [0xff] * ((self.__epd.height - Epaper.__static_area_height) * self.__epd.width // 8)
-        )
-        self.__frame_buffers['real_time_data'] = framebuf.FrameBuffer(
-            self.__buffers['real_time_data'],
-            self.__epd.width, self.__epd.height - Epaper.__static_area_height,
-            framebuf.MONO_HLSB
-        )
+        # Real time data is double buffered. Next frame is rendered into the back buffer ('real_time_data') while
+        # the front buffer ('real_time_data_front') holds the last frame transmitted to the display.
+        # Buffers are swapped after transmitting the back one.
+        for name in ('real_time_data', 'real_time_data_front'):
+            self.__buffers[name] = bytearray(
+                [0xff] * ((self.__epd.height - Epaper.__static_area_height) * self.__epd.width // 8)
+            )
+            self.__frame_buffers[name] = framebuf.FrameBuffer(
+                self.__buffers[name],
+                self.__epd.width, self.__epd.height - Epaper.__static_area_height,
+                framebuf.MONO_HLSB
+            )
+
+        # Fingerprint (crc32) of map preview is computed once per received image
+        self.__map_preview_source = None
+        self.__map_preview_fingerprint = 0
+
+        self.__static_area_layout = self.__create_static_area_layout()
+        self.__real_time_data_layout = self.__create_real_time_data_layout()
+
+        # Front buffer matches the display only as long as nothing else has been drawn over the real time data area
+        self.__real_time_data_sent = False
+        # Whether back buffer holds a frame that has not been transmitted yet
+        self.__real_time_data_pending = False
+
+        # Static area part of the last static area frame transmitted to the display
+        self.__buffers['static_area_sent'] = bytearray(Epaper.__static_area_height * self.__epd.width // 8)
 
     def clear(self, init_only=False):
         self.__epd.init()
         if not init_only:
             self.__epd.clear(0xff)
+            self.__real_time_data_sent = False
+            self.__static_area_shown = False
+            self.__refresh_scheduler.record_full_refresh()
 
     def draw_text(self, text: str, y: int):
-        lines = text.split('\n')
-        buffer_name = f'text_line_{len(lines)}'
-        if buffer_name not in self.__buffers:
-            height = Epaper.__line_height * len(lines)
-            self.__buffers[buffer_name] = bytearray([0xff] * (height * self.__epd.width // 8))
-            self.__frame_buffers[buffer_name] = framebuf.FrameBuffer(
-                self.__buffers[buffer_name], self.__epd.width, height, framebuf.MONO_HLSB
-            )
-
-        self.__frame_buffers[buffer_name].fill(0xff)
-        for line_index, line in enumerate(lines):
-            text_length = len(line) * Epaper.__char_width
-            self.__frame_buffers[buffer_name].text(
-                line, (self.__epd.width - text_length) // 2, line_index * Epaper.__line_height, 0x00
-            )
+        render_start_time = time.ticks_us()
+        lines_count = text.count('\n') + 1
+        height = Epaper.__line_height * lines_count
+        image = self.__text_cache.block(text, self.__epd.width, Epaper.__line_height)
+        self.__record_render_time('partial', render_start_time)
+
+        self.__real_time_data_sent = False
+        self.__static_area_shown = False
+        top = y - (lines_count - 1) * Epaper.__line_height
         self.__epd.display_partial(
-            reverse_bytearray(self.__buffers[buffer_name]),
-            0, y - (len(lines) - 1) * Epaper.__line_height,
-            self.__epd.width, Epaper.__line_height * len(lines)
+            image,
+            0, top,
+            self.__epd.width, height
         )
+        self.__record_partial_refresh([(0, top, self.__epd.width, height)])
 
     def draw_logo(self):
-        self.__epd.display_base(self.__buffers['logo'])
-
-    def draw_static_area(
-            self, temperature: float, wind_direction: float, wind_speed: float, city_name: str,
-            battery_level: float, is_battery_charging: bool
-    ):
-        self.__frame_buffers['static_area'].fill_rect(
-            0, (self.__epd.height - Epaper.__static_area_height),
-            self.__epd.width, Epaper.__static_area_height,
-            0xff
-        )
+        self.__real_time_data_sent = False
+        self.__static_area_shown = False
+        # Logo frame is needed only for the time of sending it, so it is not kept in memory
+        logo = bytearray([0xff] * (self.__epd.height * self.__epd.width // 8))
+        offset_top = (self.__epd.height // 2) * self.__epd.width // 8
+        Images.read_into(Images.AUTHOR_LOGO, memoryview(logo)[offset_top:offset_top + 128 * 128 // 8])
+        self.__epd.display_base(logo)
+        del logo
+        self.__refresh_scheduler.record_full_refresh()
+
+    def __create_static_area_layout(self):
+        width = self.__epd.width
+        height = self.__epd.height
+        start = height - Epaper.__static_area_height
+        end = start + Epaper.__line_height * 3
+        battery_right = width // 2
+        battery_width = BatteryIcon.WIDTH + BatteryIcon.CAP_WIDTH + BatteryIcon.CHARGING_PLUS_SIZE
+        battery_left = (battery_right - battery_width) // 8 * 8
+
+        return Layout([
+            Widget(
+                'city_name', Epaper.__text_line_box(start, end, start + Epaper.__line_height * 2, width),
+                self.__quantize_city_name, self.__render_city_name
+            ),
+            # Wind texts are at most 7 characters long (e.g. "12.3m/s")
+            Widget(
+                'wind_speed', Epaper.__text_line_box(start, end, start + Epaper.__line_height, 7 * Epaper.__char_width),
+                lambda state: round(state['wind_speed'], 1), self.__render_wind_speed
+            ),
+            Widget(
+                'wind_direction', Epaper.__text_line_box(start, end, start, 7 * Epaper.__char_width),
+                lambda state: degrees_to_compass_direction(state['wind_direction']), self.__render_wind_direction
+            ),
+            Widget(
+                'battery',
+                (battery_left, height - BatteryIcon.HEIGHT, battery_right - battery_left, BatteryIcon.HEIGHT),
+                lambda state: (BatteryIcon.fill_step(state['battery_level']), state['battery_charging']),
+                self.__render_battery
+            ),
+            # Bounding box of temperature texts measured from the font glyphs
+            Widget(
+                'temperature', (width - 72, height - 24, 72, 20),
+                lambda state: round(state['temperature']), self.__render_temperature
+            ),
+        ])
+
+    def __create_real_time_data_layout(self):
+        width = self.__epd.width
+        area_height = (self.__epd.height - Epaper.__static_area_height) // 2
+        text_end = area_height + Epaper.__line_height * 3  # line height multiplied by number of text lines
+
+        return Layout([
+            Widget(
+                'speed', (0, text_end, width, area_height * 2 - text_end),
+                self.__quantize_speed, self.__render_speed
+            ),
+            Widget(
+                'altitude', Epaper.__text_line_box(area_height, text_end, area_height, width),
+                lambda state: min(10000, max(-100, round(state['gps_statistics']['altitude']))),
+                self.__render_altitude
+            ),
+            Widget(
+                'slope', Epaper.__text_line_box(area_height, text_end, area_height + Epaper.__line_height, width),
+                lambda state: round(state['gps_statistics']['slope'], 1), self.__render_slope
+            ),
+            Widget(
+                'turn', Epaper.__text_line_box(area_height, text_end, area_height + Epaper.__line_height * 2, width),
+                self.__quantize_turn, self.__render_turn
+            ),
+            # Bounding box of arrows measured from the font glyphs
+            Widget(
+                'wind_arrow', (0, area_height, 32, 28),
+                lambda state: get_relative_wind_direction_arrow(
+                    state['gps_statistics']['heading'], state['wind_direction']
+                ),
+                self.__render_wind_arrow
+            ),
+            Widget(
+                'map_preview', (0, 0, width, area_height),
+                self.__quantize_map_preview, self.__render_map_preview, opaque=True
+            ),
+        ])
+
+    @staticmethod
+    def __text_line_box(band_start: int, band_end: int, y: int, width: int):
+        """
+        :return: bounding box of text line drawn with __draw_line at given vertical position and width
+        limited to given width (text right aligned in display orientation)
+        """
+        return 0, band_start + band_end - y - BuiltinFont.CHAR_SIZE, width, BuiltinFont.CHAR_SIZE
 
+    def __quantize_city_name(self, state: dict[str, any]):
         max_chars = self.__epd.width // Epaper.__char_width
+        city_name = state['city_name']
         if len(city_name) > max_chars:
-            city_name = city_name[:max_chars - 3] + '...'
-        self.__frame_buffers['static_area'].text(
-            city_name,
-            0, self.__epd.height - Epaper.__static_area_height + Epaper.__line_height * 2,
-            0x00
+            return city_name[:max_chars - 3] + '...'
+        return city_name
+
+    def __render_city_name(self, frame_buffer: framebuf.FrameBuffer, city_name: str):
+        start = self.__epd.height - Epaper.__static_area_height
+        self.__draw_line(
+            frame_buffer, city_name, 0, start + Epaper.__line_height * 2, start, start + Epaper.__line_height * 3
         )
 
-        wind_speed_text = f"{round(wind_speed, 1)}m/s"
+    def __render_wind_speed(self, frame_buffer: framebuf.FrameBuffer, wind_speed: float):
+        start = self.__epd.height - Epaper.__static_area_height
+        wind_speed_text = f"{wind_speed}m/s"
         text_length = len(wind_speed_text) * Epaper.__char_width
-        self.__frame_buffers['static_area'].text(
-            wind_speed_text,
-            self.__epd.width - text_length, self.__epd.height - Epaper.__static_area_height + Epaper.__line_height,
-            0x00
+        self.__draw_line(
+            frame_buffer, wind_speed_text, self.__epd.width - text_length, start + Epaper.__line_height,
+            start, start + Epaper.__line_height * 3
         )
 
-        wind_dir_text = degrees_to_compass_direction(wind_direction)
+    def __render_wind_direction(self, frame_buffer: framebuf.FrameBuffer, wind_dir_text: str):
+        start = self.__epd.height - Epaper.__static_area_height
         text_length = len(wind_dir_text) * Epaper.__char_width
-        self.__frame_buffers['static_area'].text(
-            wind_dir_text,
-            self.__epd.width - text_length, self.__epd.height - Epaper.__static_area_height,
-            0x00
+        self.__draw_line(
+            frame_buffer, wind_dir_text, self.__epd.width - text_length, start, start, start + Epaper.__line_height * 3
         )
 
-        start = self.__epd.height - Epaper.__static_area_height
-        end = start + Epaper.__line_height * 3
-        self.__reverse_part_of_buffer('static_area', start, end)
-
-        # Draw battery
-        battery_height = Epaper.__static_area_height - Epaper.__line_height * 3  # 10
-        battery_width = battery_height * 2  # 20
-        battery_cap_width = 2
-        fill_pixels_count = float((battery_height - 2) * (battery_width - 2))
-
-        for y in range(battery_height):
-            for x in range(battery_width + battery_cap_width):
-                xx = (self.__epd.width // 2) - x - 1
-                yy = self.__epd.height - 1 - y
-
-                # Battery cap
-                if x >= battery_width:
-                    if battery_height // 3 <= y <= battery_height // 3 * 2:
-                        self.__frame_buffers['static_area'].pixel(xx, yy, 0x00)
-                    continue
-
-                if x == 0 or x == battery_width - 1 or y == 0 or y == battery_height - 1:
-                    self.__frame_buffers['static_area'].pixel(xx, yy, 0x00)
-                    continue
-
-                b_i = float((x - 1) * (battery_height - 2) + ((battery_height - 1 - y) - 1))
-                if b_i < fill_pixels_count * battery_level:
-                    self.__frame_buffers['static_area'].pixel(xx, yy, 0x00)
-                    continue
-
-        if is_battery_charging:
-            charging_plus_size = 10
-            for y in range(charging_plus_size):
-                for x in range(charging_plus_size):
-                    if x == charging_plus_size // 2 or y == charging_plus_size // 2:
-                        xx = (self.__epd.width // 2) - x - 1 - (battery_width + battery_cap_width)
-                        yy = self.__epd.height - 1 - y
-                        self.__frame_buffers['static_area'].pixel(xx, yy, 0x00)
+    def __render_battery(self, frame_buffer: framebuf.FrameBuffer, battery: tuple[int, bool]):
+        fill_step, charging = battery
+        self.__battery_icon.draw(
+            frame_buffer, self.__epd.width // 2, self.__epd.height - 1, fill_step / BatteryIcon.FILL_STEPS, charging
+        )
 
-        # Draw static area frame buffer
+    def __render_temperature(self, frame_buffer: framebuf.FrameBuffer, temperature: int):
         self.__fonts['common_24px'].draw(
-            f'{round(temperature)}°C',
-            self.__frame_buffers['static_area'], self.__epd.width, self.__epd.height,
+            f'{temperature}°C',
+            frame_buffer, self.__epd.width, self.__epd.height,
             0, 24,
             align=Font.ALIGN.LEFT
         )
 
-        self.__epd.display_base(self.__buffers['static_area'])
-
-    def draw_real_time_data(
-            self, speed: float, ride_progress: dict[str, any], gps_statistics: dict[str, float], map_preview: bytes,
-            wind_direction: float, bluetooth_connection_status: bool
-    ):
-        area_height = (self.__epd.height - Epaper.__static_area_height) // 2
-        self.__frame_buffers['real_time_data'].fill_rect(
-            0, area_height,
-            self.__epd.width, area_height, 0xff
+    @staticmethod
+    def __quantize_speed(state: dict[str, any]):
+        speed = round(state['speed'])
+        ride_progress = state['ride_progress']
+        if speed > 0 or ride_progress['rideDuration'] == 0:
+            return speed
+
+        # Ride progress is displayed when bike is stopped. Times are displayed with precision of minutes.
+        return (
+            round(ride_progress['rideDuration']) // 60000,
+            round(ride_progress['timeInMotion']) // 60000,
+            round(ride_progress['traveledDistance'], 1),
+            round(ride_progress['altitudeChange']['up']),
+            round(ride_progress['altitudeChange']['down'])
         )
 
-        if round(speed) > 0 or ride_progress['rideDuration'] == 0:
+    def __render_speed(self, frame_buffer: framebuf.FrameBuffer, value: int | tuple):
+        if isinstance(value, int):
             self.__fonts['digits_104px'].draw(
-                f'{round(speed)}',
-                self.__frame_buffers['real_time_data'],
+                f'{value}',
+                frame_buffer,
                 self.__epd.width,
                 self.__epd.height - Epaper.__static_area_height,
                 0,
                 84 + 4  # 84 is roughly maximum char height + manual offset for vertical centering
             )
-        else:
-            progress_text = f"Ride duration:\n{parse_time(round(ride_progress['rideDuration']))}\n" + \
-                            f"Time in motion:\n{parse_time(round(ride_progress['timeInMotion']))}\n" + \
-                            f"Traveled:\n{round(ride_progress['traveledDistance'], 1)}km\n" + \
-                            f"Altitude change:\n+{round(ride_progress['altitudeChange']['up'])}m | -{round(ride_progress['altitudeChange']['down'])}m"
+            return
 
-            start = area_height + Epaper.__line_height * 4
+        ride_minutes, motion_minutes, traveled_distance, altitude_up, altitude_down = value
+        progress_text = f"Ride duration:\n{parse_time(ride_minutes * 60000)}\n" + \
+                        f"Time in motion:\n{parse_time(motion_minutes * 60000)}\n" + \
+                        f"Traveled:\n{traveled_distance}km\n" + \
+                        f"Altitude change:\n+{altitude_up}m | -{altitude_down}m"
 
-            lines = progress_text.split('\n')
-            for i, line in enumerate(lines):
-                text_length = len(line) * Epaper.__char_width
-                self.__frame_buffers['real_time_data'].text(
-                    line, (self.__epd.width - text_length) // 2, start + Epaper.__line_height * i, 0x00
-                )
+        area_height = (self.__epd.height - Epaper.__static_area_height) // 2
+        start = area_height + Epaper.__line_height * 4
 
-            self.__reverse_part_of_buffer('real_time_data', start, start + Epaper.__line_height * len(lines))
+        lines = progress_text.split('\n')
+        end = start + Epaper.__line_height * len(lines)
+        for i, line in enumerate(lines):
+            text_length = len(line) * Epaper.__char_width
+            self.__draw_line(
+                frame_buffer, line, (self.__epd.width - text_length) // 2, start + Epaper.__line_height * i,
+                start, end
+            )
+
+    def __draw_gps_statistics_line(self, frame_buffer: framebuf.FrameBuffer, text: str, line_index: int):
+        area_height = (self.__epd.height - Epaper.__static_area_height) // 2
+        text_end = area_height + Epaper.__line_height * 3
+        self.__draw_line(frame_buffer, text, 0, area_height + Epaper.__line_height * line_index, area_height, text_end)
 
+    def __render_altitude(self, frame_buffer: framebuf.FrameBuffer, altitude: int):
         # NOTE: spaces before label are needed to align them in vertical axis
-        gps_statistics_text = f"  Alt: {min(10000, max(-100, round(gps_statistics['altitude'])))}m"
-        self.__frame_buffers['real_time_data'].text(
-            gps_statistics_text, 0, area_height, 0x00
-        )
-        gps_statistics_text = f"Slope: {round(gps_statistics['slope'], 1)}%"
-        self.__frame_buffers['real_time_data'].text(
-            gps_statistics_text, 0, area_height + Epaper.__line_height, 0x00
-        )
-        # gps_statistics_text = f"  Dir: {degrees_to_compass_direction(gps_statistics['heading'])}"
-        if gps_statistics['turnDistance'] > 0:
-            gps_statistics_text = "Turn back" if gps_statistics['turnAngle'] >= pi else \
-                f"{round(gps_statistics['turnAngle'] * 180 / pi)}d | {round(gps_statistics['turnDistance'])}m"
-            self.__frame_buffers['real_time_data'].text(
-                gps_statistics_text, 0, area_height + Epaper.__line_height * 2, 0x00
-            )
+        self.__draw_gps_statistics_line(frame_buffer, f"  Alt: {altitude}m", 0)
+
+    def __render_slope(self, frame_buffer: framebuf.FrameBuffer, slope: float):
+        self.__draw_gps_statistics_line(frame_buffer, f"Slope: {slope}%", 1)
 
-        text_height = Epaper.__line_height * 3  # line height multiplied by number of text lines
-        self.__reverse_part_of_buffer('real_time_data', area_height, area_height + text_height)
+    @staticmethod
+    def __quantize_turn(state: dict[str, any]):
+        gps_statistics = state['gps_statistics']
+        if gps_statistics['turnDistance'] <= 0:
+            return None
+        return "Turn back" if gps_statistics['turnAngle'] >= pi else \
+            f"{round(gps_statistics['turnAngle'] * 180 / pi)}d | {round(gps_statistics['turnDistance'])}m"
 
+    def __render_turn(self, frame_buffer: framebuf.FrameBuffer, turn_text: str):
+        if turn_text is not None:
+            self.__draw_gps_statistics_line(frame_buffer, turn_text, 2)
+
+    def __render_wind_arrow(self, frame_buffer: framebuf.FrameBuffer, arrow: str):
+        area_height = (self.__epd.height - Epaper.__static_area_height) // 2
         self.__fonts['common_24px'].draw(
-            get_relative_wind_direction_arrow(gps_statistics['heading'], wind_direction),
-            self.__frame_buffers['real_time_data'],
+            arrow,
+            frame_buffer,
             self.__epd.width,
             self.__epd.height - Epaper.__static_area_height,
             self.__epd.width - 28,
@@ -258,37 +387,293 @@ class Epaper:
             align=Font.ALIGN.LEFT
         )
 
-        if bluetooth_connection_status is True:
-            for i in range(len(map_preview)):
-                self.__buffers['real_time_data'][i] = map_preview[i]
+    def __quantize_map_preview(self, state: dict[str, any]):
+        """
+        :return: None for bluetooth off image or (fingerprint, image) tuple; different images are told apart by their
+        fingerprints, while the same image is compared by identity
+        """
+        if state['bluetooth_connection_status'] is not True:
+            return None
+
+        map_preview = state['map_preview']
+        if map_preview is not self.__map_preview_source:
+            # Fingerprint of the last image is memoized (the value still depends on the state only)
+            self.__map_preview_source = map_preview
+            self.__map_preview_fingerprint = crc32(map_preview)
+        return self.__map_preview_fingerprint, map_preview
+
+    def __render_map_preview(self, frame_buffer: framebuf.FrameBuffer, value: tuple[int, bytes] | None):
+        # Image is copied with a single slice assignment (or read from flash) into the buffer the frame buffer is
+        # drawing into
+        target = memoryview(self.__buffer_of(frame_buffer))
+        if value is None:
+            Images.read_into(Images.BLUETOOTH_OFF, target[:128 * 128 // 8])
         else:
-            buffer_size = len(Images.BLUETOOTH_OFF)
-            for i in range(buffer_size):
-                self.__buffers['real_time_data'][i] = bits_order_reverse_lut[
-                    Images.BLUETOOTH_OFF[buffer_size - 1 - i]
-                ]
+            map_image = value[1]
+            target[:len(map_image)] = memoryview(map_image)
 
-        self.__epd.display_partial(
-            self.__buffers['real_time_data'],
-            0, 0,
-            self.__epd.width, self.__epd.height - Epaper.__static_area_height
+    def __buffer_of(self, frame_buffer: framebuf.FrameBuffer):
+        """
+        :return: bytearray given frame buffer is drawing into
+        """
+        for name, candidate in self.__frame_buffers.items():
+            if candidate is frame_buffer:
+                return self.__buffers[name]
+        raise ValueError("Unknown frame buffer")
+
+    def draw_static_area(
+            self, temperature: float, wind_direction: float, wind_speed: float, city_name: str,
+            battery_level: float, is_battery_charging: bool, full_refresh=True
+    ):
+        """
+        Renders widgets of the static area which changed since the last time
+        :param full_refresh: whether whole display should be refreshed (clearing ghosting) or only the static area
+        should be partially refreshed
+        """
+        render_start_time = time.ticks_us()
+        self.__static_area_state = {
+            'temperature': temperature,
+            'wind_direction': wind_direction,
+            'wind_speed': wind_speed,
+            'city_name': city_name,
+            'battery_level': battery_level,
+            'battery_charging': is_battery_charging
+        }
+        rendered = self.__static_area_layout.render(
+            self.__buffers['static_area'], self.__frame_buffers['static_area'], self.__static_area_state
+        )
+        self.__record_render_time('full' if full_refresh else 'partial', render_start_time)
+
+        if full_refresh:
+            self.__real_time_data_sent = False
+            self.__epd.display_base(self.__buffers['static_area'], reset_position=True, wait=False)
+            self.__refresh_scheduler.record_full_refresh()
+            self.__static_area_shown = True
+            self.__update_sent_static_area()
+        elif self.__static_area_shown:
+            self.__display_static_area_regions([widget.box for widget in rendered])
+        else:
+            self.__display_static_area_regions(
+                [(0, self.__epd.height - Epaper.__static_area_height, self.__epd.width, Epaper.__static_area_height)]
+            )
+
+    def draw_battery(self, battery_level: float, is_battery_charging: bool):
+        """
+        Updates battery icon of displayed static area with partial refresh of the icon alone.
+        Does nothing if the icon would not change or static area is not displayed.
+        """
+        if not self.__static_area_shown:
+            return
+
+        render_start_time = time.ticks_us()
+        self.__static_area_state['battery_level'] = battery_level
+        self.__static_area_state['battery_charging'] = is_battery_charging
+        rendered = self.__static_area_layout.render(
+            self.__buffers['static_area'], self.__frame_buffers['static_area'], self.__static_area_state
         )
+        if len(rendered) == 0:
+            return
+        self.__record_render_time('partial', render_start_time)
+        self.__display_static_area_regions([widget.box for widget in rendered])
+
+    def __display_static_area_regions(self, regions: list[tuple[int, int, int, int]]):
+        if len(regions) == 0:
+            return
+        start = (self.__epd.height - Epaper.__static_area_height) * (self.__epd.width // 8)
+        self.__epd.display_partial_regions(self.__buffers['static_area'], self.__epd.width, regions, wait=False)
+        self.__record_partial_refresh(regions, self.__buffers['static_area'], self.__buffers['static_area_sent'], start)
+        self.__static_area_shown = True
+        self.__update_sent_static_area()
+
+    def __update_sent_static_area(self):
+        start = (self.__epd.height - Epaper.__static_area_height) * (self.__epd.width // 8)
+        self.__buffers['static_area_sent'][:] = self.__buffers['static_area'][start:]
+
+    @staticmethod
+    def __real_time_data_state(
+            speed: float, ride_progress: dict[str, any], gps_statistics: dict[str, float], map_preview: bytes,
+            wind_direction: float, bluetooth_connection_status: bool
+    ):
+        return {
+            'speed': speed,
+            'ride_progress': ride_progress,
+            'gps_statistics': gps_statistics,
+            'map_preview': map_preview,
+            'wind_direction': wind_direction,
+            'bluetooth_connection_status': bluetooth_connection_status
+        }
 
-    def __reverse_part_of_buffer(self, buffer_name: str, start: int, end: int):
+    def real_time_data_model(
+            self, speed: float, ride_progress: dict[str, any], gps_statistics: dict[str, float], map_preview: bytes,
+            wind_direction: float, bluetooth_connection_status: bool
+    ):
         """
-        Reversing part of buffer.
-        :param buffer_name: name of buffer to reverse its part (must have 100% width)
-        :param start: vertical start position in pixels from top
-        :param end: vertical end position in pixels from top
+        :return: tuple of values real time data is displayed with (quantized with the same rounding widgets are
+        rendered with); data giving equal models is displayed identically
         """
-        start = start * (self.__epd.width // 8)
-        end = end * (self.__epd.width // 8)
-
-        size = (end - start) // 2
-        for i in range(size):
-            swap_index = end - 1 - i
-            swap = self.__buffers[buffer_name][start + i]
-            self.__buffers[buffer_name][start + i] = bits_order_reverse_lut[
-                self.__buffers[buffer_name][swap_index]
-            ]
-            self.__buffers[buffer_name][swap_index] = bits_order_reverse_lut[swap]
+        return self.__real_time_data_layout.model(Epaper.__real_time_data_state(
+            speed, ride_progress, gps_statistics, map_preview, wind_direction, bluetooth_connection_status
+        ))
+
+    def draw_real_time_data(
+            self, speed: float, ride_progress: dict[str, any], gps_statistics: dict[str, float], map_preview: bytes,
+            wind_direction: float, bluetooth_connection_status: bool
+    ):
+        render_start_time = time.ticks_us()
+        self.__real_time_data_layout.render(
+            self.__buffers['real_time_data'], self.__frame_buffers['real_time_data'],
+            Epaper.__real_time_data_state(
+                speed, ride_progress, gps_statistics, map_preview, wind_direction, bluetooth_connection_status
+            )
+        )
+        self.__record_render_time('partial', render_start_time)
+
+        # Frame rendered during display refresh is transmitted as soon as the refresh is finished
+        self.__real_time_data_pending = True
+        self.update()
+
+    def update(self):
+        """
+        Transmits pending real time data frame once display is not busy. It should be called periodically.
+        """
+        if self.__real_time_data_pending and not self.__epd.refreshing:
+            self.__display_real_time_data_changes()
+
+    def __display_real_time_data_changes(self):
+        """
+        Compares real time data back buffer with the last transmitted frame and sends only changed regions within
+        a single partial refresh. Does nothing if the frame did not change.
+        """
+        self.__real_time_data_pending = False
+        buffer = self.__buffers['real_time_data']
+        sent_buffer = self.__buffers['real_time_data_front']
+        bytes_per_row = self.__epd.width // 8
+        rows_count = len(buffer) // bytes_per_row
+
+        if self.__real_time_data_sent:
+            # Only rows of widgets rendered with different values in both buffers are compared
+            regions: list[tuple[int, int, int, int]] = []
+            widgets = self.__real_time_data_layout.differing_widgets(buffer, sent_buffer)
+            for first_row, end_row in Epaper.__merge_rows_of_widgets(widgets):
+                regions += self.__find_changed_regions(buffer, sent_buffer, first_row, end_row)
+            if len(regions) == 0:
+                return
+            self.__record_partial_refresh(regions, buffer, sent_buffer)
+        else:
+            regions = [(0, 0, self.__epd.width, rows_count)]
+            self.__record_partial_refresh(regions)
+
+        self.__epd.display_partial_regions(buffer, self.__epd.width, regions, wait=False)
+        self.__real_time_data_sent = True
+
+        # Previous front buffer becomes the target for the next frame. The layout remembers values rendered into each
+        # buffer, so only widgets whose values differ from the ones this buffer was last rendered with are re-rendered.
+        self.__buffers['real_time_data'], self.__buffers['real_time_data_front'] = sent_buffer, buffer
+        self.__frame_buffers['real_time_data'], self.__frame_buffers['real_time_data_front'] = \
+            self.__frame_buffers['real_time_data_front'], self.__frame_buffers['real_time_data']
+
+    @staticmethod
+    def __merge_rows_of_widgets(widgets: list[Widget]):
+        """
+        :return: sorted list of non overlapping (first_row, end_row) ranges covering bounding boxes of given widgets
+        """
+        ranges: list[tuple[int, int]] = []
+        for first_row, end_row in sorted((widget.box[1], widget.box[1] + widget.box[3]) for widget in widgets):
+            if len(ranges) > 0 and first_row <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end_row))
+            else:
+                ranges.append((first_row, end_row))
+        return ranges
+
+    def __record_partial_refresh(
+            self, regions: list[tuple[int, int, int, int]],
+            buffer: bytearray = None, previous_buffer: bytearray = None, previous_buffer_offset=0
+    ):
+        """
+        Registers partially refreshed rectangles in the refresh scheduler
+        :param regions: list of (x, y, width, height) rectangles in display coordinates
+        :param buffer: new content, full width buffer starting at the top of the display
+        :param previous_buffer: content sent before; toggled pixels are not counted if it is not known
+        :param previous_buffer_offset: index in the buffer corresponding to the first byte of the previous_buffer
+        """
+        bytes_per_row = self.__epd.width // 8
+        toggled_pixels: dict[str, int] = {}
+        for _, y, _, height in regions:
+            for name, region_start, region_end in self.__refresh_regions:
+                start = max(y, region_start)
+                end = min(y + height, region_end)
+                if start >= end:
+                    continue
+                count = toggled_pixels.get(name, 0)
+                if previous_buffer is not None:
+                    count += count_toggled_pixels(
+                        buffer, previous_buffer, start * bytes_per_row, end * bytes_per_row, previous_buffer_offset
+                    )
+                toggled_pixels[name] = count
+
+        for name, count in toggled_pixels.items():
+            self.__refresh_scheduler.record_partial_refresh(name, count)
+
+    def __find_changed_regions(self, buffer: bytearray, previous_buffer: bytearray, first_row: int, end_row: int):
+        """
+        Finds byte aligned rectangles covering differences between two buffers of the same size.
+        Adjacent changed row bands are merged into single rectangle narrowed to the changed columns.
+        :param first_row: first compared row
+        :param end_row: row after the last compared row
+        :return: list of (x, y, width, height) rectangles
+        """
+        bytes_per_row = self.__epd.width // 8
+        band_height = Epaper.__dirty_band_height
+
+        regions: list[tuple[int, int, int, int]] = []
+        region_start = None
+        first_column = bytes_per_row
+        last_column = -1
+        for band_start in range(first_row, end_row + band_height, band_height):
+            band_end = min(band_start + band_height, end_row)
+            band_changed = False
+            for row in range(band_start, band_end):
+                start = row * bytes_per_row
+                end = start + bytes_per_row
+                if buffer[start:end] == previous_buffer[start:end]:
+                    continue
+                band_changed = True
+                column = 0
+                while buffer[start + column] == previous_buffer[start + column]:
+                    column += 1
+                first_column = min(first_column, column)
+                column = bytes_per_row - 1
+                while buffer[start + column] == previous_buffer[start + column]:
+                    column -= 1
+                last_column = max(last_column, column)
+
+            if band_changed:
+                if region_start is None:
+                    region_start = band_start
+            elif region_start is not None:
+                regions.append((
+                    first_column * 8, region_start,
+                    (last_column - first_column + 1) * 8, min(band_start, end_row) - region_start
+                ))
+                region_start = None
+                first_column = bytes_per_row
+                last_column = -1
+        return regions
+
+    def __draw_line(
+            self, frame_buffer: framebuf.FrameBuffer, text: str, x: int, y: int, band_start: int, band_end: int
+    ):
+        """
+        Draws line of built-in font text in display orientation.
+        Text is positioned as if the band between band_start and band_end was drawn upright and then rotated
+        by 180 degrees.
+        :param frame_buffer: frame buffer to draw into (must have 100% width)
+        :param x: horizontal position of text in upright band
+        :param y: vertical position of text in upright band
+        :param band_start: vertical start position of band in pixels from top
+        :param band_end: vertical end position of band in pixels from top
+        """
+        line_frame_buffer, width = self.__text_cache.line(text)
+        frame_buffer.blit(
+            line_frame_buffer, self.__epd.width - x - width, band_start + band_end - y - BuiltinFont.CHAR_SIZE, 1
+        )
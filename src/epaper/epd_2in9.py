@@ -5,6 +5,8 @@ from machine import Pin, SPI
 # noinspection PyPackageRequirements
 import utime
 
+from src.epaper.refresh_statistics import RefreshStatistics
+
 # Display resolution
 EPD_WIDTH = 128
 EPD_HEIGHT = 296
@@ -17,7 +19,7 @@ class EPD_2in9:
     CS_PIN = 9
     BUSY_PIN = 13
 
-    WF_PARTIAL_2IN9 = [
+    WF_PARTIAL_2IN9 = bytes([
         0x0, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
         0x80, 0x80, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
         0x40, 0x40, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
@@ -37,9 +39,13 @@ class EPD_2in9:
         0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0,
         0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x0, 0x0, 0x0,
         0x22, 0x17, 0x41, 0xB0, 0x32, 0x36,
-    ]
+    ])
 
-    def __init__(self):
+    def __init__(self, refresh_callback: callable = None, statistics: RefreshStatistics = None):
+        """
+        :param refresh_callback: called without arguments once a refresh is finished
+        :param statistics: collects durations of refresh phases if given
+        """
         self.reset_pin = Pin(EPD_2in9.RST_PIN, Pin.OUT)
 
         self.busy_pin = Pin(EPD_2in9.BUSY_PIN, Pin.IN, Pin.PULL_UP)
@@ -49,10 +55,30 @@ class EPD_2in9:
 
         self.lut = EPD_2in9.WF_PARTIAL_2IN9
 
+        # Reused for single byte transfers so sending commands and parameters does not allocate
+        self.__single_byte_buffer = bytearray(1)
+
+        self.__refresh_pending = False
+        self.__refresh_callback = refresh_callback
+        self.__refresh_kind = 'full'
+        self.__refresh_start_time = 0
+        # ticks_us timestamp of the last release of the busy pin (written by interrupt handler)
+        self.__busy_release_time = 0
+        self.__statistics = statistics
+
+        # Cached controller state used to skip commands that would not change anything
+        self.__partial_mode = False
+        self.__loaded_lut = None
+        self.__window = None
+        self.__cursor = None
+
         self.spi = SPI(1)
         self.spi.init(baudrate=4000_000)
         self.dc_pin = Pin(EPD_2in9.DC_PIN, Pin.OUT)
 
+        # Refresh finishes when the busy pin is released, which can be long before it is checked
+        self.busy_pin.irq(handler=self.__on_busy_release, trigger=Pin.IRQ_FALLING, hard=True)
+
         self.init()
 
     @staticmethod
@@ -75,23 +101,48 @@ class EPD_2in9:
 
     # Hardware reset
     def reset(self):
+        self.__wait_for_pending_refresh()
         self.__digital_write(self.reset_pin, 1)
         self.__delay_ms(50)
         self.__digital_write(self.reset_pin, 0)
         self.__delay_ms(2)
         self.__digital_write(self.reset_pin, 1)
         self.__delay_ms(50)
+        self.__invalidate_state()
+
+    def __invalidate_state(self):
+        self.__partial_mode = False
+        self.__loaded_lut = None
+        self.__window = None
+        self.__cursor = None
 
     def send_command(self, command: int):
+        # Controller does not accept commands until refresh is finished
+        self.__wait_for_pending_refresh()
+
+        self.__single_byte_buffer[0] = command
         self.__digital_write(self.dc_pin, 0)
         self.__digital_write(self.cs_pin, 0)
-        self.spi_write_byte([command])
+        self.spi.write(self.__single_byte_buffer)
         self.__digital_write(self.cs_pin, 1)
 
     def send_data(self, data: int):
+        self.__single_byte_buffer[0] = data
         self.__digital_write(self.dc_pin, 1)
         self.__digital_write(self.cs_pin, 0)
-        self.spi_write_byte([data])
+        self.spi.write(self.__single_byte_buffer)
+        self.__digital_write(self.cs_pin, 1)
+
+    def send_data_buffer(self, buffer, repeat=1):
+        """
+        Streams whole buffer as data in a single SPI transaction (CS is held low for all bytes)
+        :param buffer: bytes, bytearray or memoryview (slice) to send
+        :param repeat: number of times the buffer should be sent within the same transaction
+        """
+        self.__digital_write(self.dc_pin, 1)
+        self.__digital_write(self.cs_pin, 0)
+        for _ in range(repeat):
+            self.spi.write(buffer)
         self.__digital_write(self.cs_pin, 1)
 
     def is_busy(self):
@@ -103,25 +154,77 @@ class EPD_2in9:
             self.__delay_ms(10)
         # print("e-Paper busy release")
 
-    def turn_on_display(self):
+    def __on_busy_release(self, _pin: Pin):
+        # NOTE: runs in hard interrupt context, so it must not allocate memory
+        self.__busy_release_time = utime.ticks_us()
+
+    @property
+    def refreshing(self):
+        """
+        Whether refresh started with wait=False is still in progress.
+        Checking it after the busy pin is released completes the refresh and calls refresh callback.
+        """
+        if self.__refresh_pending and not self.is_busy():
+            self.__finish_refresh()
+        return self.__refresh_pending
+
+    def __wait_for_pending_refresh(self):
+        if self.__refresh_pending:
+            self.read_busy()
+            self.__finish_refresh()
+
+    def __finish_refresh(self):
+        self.__refresh_pending = False
+        end_time = self.__busy_release_time
+        if utime.ticks_diff(end_time, self.__refresh_start_time) <= 0:
+            # Release of the busy pin was not captured
+            end_time = utime.ticks_us()
+        self.__record_duration(self.__refresh_kind, 'busy_wait', self.__refresh_start_time, end_time)
+        if self.__refresh_callback is not None:
+            self.__refresh_callback()
+
+    def __activate(self, kind: str, wait: bool):
+        self.send_command(0x20)  # MASTER_ACTIVATION
+        self.__refresh_pending = True
+        self.__refresh_kind = kind
+        self.__refresh_start_time = utime.ticks_us()
+        self.__busy_release_time = self.__refresh_start_time
+        if wait:
+            self.__wait_for_pending_refresh()
+
+    def __record_duration(self, kind: str, phase: str, start_time: int, end_time: int = None):
+        if self.__statistics is not None:
+            self.__statistics.add(
+                kind, phase, utime.ticks_diff(utime.ticks_us() if end_time is None else end_time, start_time)
+            )
+
+    def turn_on_display(self, wait=True):
         self.send_command(0x22)  # DISPLAY_UPDATE_CONTROL_2
         self.send_data(0xF7)
-        self.send_command(0x20)  # MASTER_ACTIVATION
-        self.read_busy()
+        self.__activate('full', wait)
+        # Full update reloads waveform from OTP, so partial mode has to be set up again before next partial refresh
+        self.__partial_mode = False
+        self.__loaded_lut = None
 
-    def turn_on_partial_display(self):
+    def turn_on_partial_display(self, wait=True):
         self.send_command(0x22)  # DISPLAY_UPDATE_CONTROL_2
-        self.send_data(0x0F)
-        self.send_command(0x20)  # MASTER_ACTIVATION
-        self.read_busy()
+        # Enable clock and analog, display with mode 2, then disable them again.
+        # Enabling is part of every activation since partial mode is kept between refreshes.
+        self.send_data(0xCF)
+        self.__activate('partial', wait)
 
     def send_lut(self):
         self.send_command(0x32)
-        for i in range(0, 153):
-            self.send_data(self.lut[i])
+        self.send_data_buffer(memoryview(self.lut)[:153])
         self.read_busy()
+        self.__loaded_lut = self.lut
 
     def set_window(self, x_start: int, y_start: int, x_end: int, y_end: int):
+        window = (x_start >> 3, y_start, x_end >> 3, y_end)
+        if window == self.__window:
+            return
+        self.__window = window
+
         self.send_command(0x44)  # SET_RAM_X_ADDRESS_START_END_POSITION
         # x point must be the multiple of 8 or the last 3 bits will be ignored
         self.send_data((x_start >> 3) & 0xFF)
@@ -133,8 +236,14 @@ class EPD_2in9:
         self.send_data((y_end >> 8) & 0xFF)
 
     def set_cursor(self, x: int, y: int):
+        cursor = (x >> 3, y)
+        if cursor == self.__cursor:
+            return
+        self.__cursor = cursor
+
         self.send_command(0x4E)  # SET_RAM_X_ADDRESS_COUNTER
-        self.send_data(x & 0xFF)
+        # same as for the window, x counter is expressed in bytes (multiples of 8 pixels)
+        self.send_data((x >> 3) & 0xFF)
 
         self.send_command(0x4F)  # SET_RAM_Y_ADDRESS_COUNTER
         self.send_data(y & 0xFF)
@@ -168,52 +277,99 @@ class EPD_2in9:
         # EPD hardware init end
         return 0
 
+    def __start_ram_write(self, command: int):
+        self.send_command(command)
+        # Address counter advances with every written byte
+        self.__cursor = None
+
     def display(self, image: bytearray):
         if image is None:
             return
-        self.send_command(0x24)  # WRITE_RAM
-        for j in range(0, self.height):
-            for i in range(0, int(self.width / 8)):
-                self.send_data(image[i + j * int(self.width / 8)])
+        self.__wait_for_pending_refresh()
+        upload_start_time = utime.ticks_us()
+        self.__start_ram_write(0x24)  # WRITE_RAM
+        self.send_data_buffer(memoryview(image)[:self.height * (self.width // 8)])
+        self.__record_duration('full', 'spi_upload', upload_start_time)
         self.turn_on_display()
 
-    def display_base(self, image: bytearray, reset_position=False):
+    def display_base(self, image: bytearray, reset_position=False, wait=True):
         if image is None:
             return
+        self.__wait_for_pending_refresh()
+        upload_start_time = utime.ticks_us()
         if reset_position:
             self.set_window(0, 0, self.width - 1, self.height - 1)
             self.set_cursor(0, 0)
 
-        self.send_command(0x24)  # WRITE_RAM
-        for j in range(0, self.height):
-            for i in range(0, int(self.width / 8)):
-                self.send_data(image[i + j * int(self.width / 8)])
+        frame = memoryview(image)[:self.height * (self.width // 8)]
+        self.__start_ram_write(0x24)  # WRITE_RAM
+        self.send_data_buffer(frame)
 
-        self.send_command(0x26)  # WRITE_RAM
-        for j in range(0, self.height):
-            for i in range(0, int(self.width / 8)):
-                self.send_data(image[i + j * int(self.width / 8)])
+        self.__start_ram_write(0x26)  # WRITE_RAM
+        self.send_data_buffer(frame)
+        self.__record_duration('full', 'spi_upload', upload_start_time)
 
-        self.turn_on_display()
+        self.turn_on_display(wait)
 
-    def display_partial(self, image: bytearray, x=0, y=0, width=EPD_WIDTH, height=EPD_HEIGHT):
+    def display_partial(self, image: bytearray, x=0, y=0, width=EPD_WIDTH, height=EPD_HEIGHT, wait=True):
         """
         :param image: bytebuffer to display
-        :param x: horizontal starting position for drawing (works only for 1 pixel height)
+        :param x: horizontal starting position for drawing (IT MUST BE A MULTIPLE OF 8)
         :param y: vertical starting position for drawing
         :param width: should equal to image width (IT MUST BE A MULTIPLE OF 8)
         :param height: should equal to image height
+        :param wait: if False, returns right after starting the refresh (see refreshing property)
         :return:
         """
         if image is None:
             return
 
+        self.__begin_partial_refresh()
+        upload_start_time = utime.ticks_us()
+        self.__write_region(image, width, 0, 0, x, y, width, height)
+        self.__record_duration('partial', 'spi_upload', upload_start_time)
+        self.turn_on_partial_display(wait)
+
+    def display_partial_regions(
+            self, image: bytearray, image_width: int, regions: list[tuple[int, int, int, int]], wait=True
+    ):
+        """
+        Writes multiple rectangular parts of the image within a single partial refresh.
+        Image is placed at the top left corner of the display.
+        :param image: bytebuffer to display parts of
+        :param image_width: width of the image in pixels (IT MUST BE A MULTIPLE OF 8)
+        :param regions: list of (x, y, width, height) rectangles; x and width must be multiples of 8
+        :param wait: if False, returns right after starting the refresh (see refreshing property)
+        :return:
+        """
+        if image is None or len(regions) == 0:
+            return
+
+        for x, _, width, _ in regions:
+            if x % 8 != 0 or width % 8 != 0:
+                raise ValueError(f"Region is not byte aligned: x={x}, width={width}")
+
+        self.__begin_partial_refresh()
+        upload_start_time = utime.ticks_us()
+        for x, y, width, height in regions:
+            self.__write_region(image, image_width, x, y, x, y, width, height)
+        self.__record_duration('partial', 'spi_upload', upload_start_time)
+        self.turn_on_partial_display(wait)
+
+    def __begin_partial_refresh(self):
+        self.__wait_for_pending_refresh()
+        if self.__partial_mode and self.__loaded_lut is self.lut:
+            return
+
         self.__digital_write(self.reset_pin, 0)
         self.__delay_ms(2)
         self.__digital_write(self.reset_pin, 1)
         self.__delay_ms(2)
+        self.__invalidate_state()
 
+        lut_start_time = utime.ticks_us()
         self.send_lut()
+        self.__record_duration('partial', 'lut_upload', lut_start_time)
         self.send_command(0x37)
         self.send_data(0x00)
         self.send_data(0x00)
@@ -234,21 +390,47 @@ class EPD_2in9:
         self.send_command(0x20)
         self.read_busy()
 
-        self.set_window(x, y, width - 1, height - 1)
+        self.__partial_mode = True
+
+    def __write_region(
+            self, image: bytearray, image_width: int,
+            image_x: int, image_y: int, x: int, y: int, width: int, height: int
+    ):
+        """
+        Writes rectangle of the image into display RAM
+        :param image_width: width of the whole image in pixels (row stride)
+        :param image_x: horizontal position of the rectangle inside the image
+        :param image_y: vertical position of the rectangle inside the image
+        :param x: horizontal position of the rectangle on the display
+        :param y: vertical position of the rectangle on the display
+        """
+        self.set_window(x, y, x + width - 1, y + height - 1)
         self.set_cursor(x, y)
 
-        self.send_command(0x24)  # WRITE_RAM
-        for j in range(height):
-            for i in range(int(width / 8)):
-                self.send_data(image[i + j * int(width / 8)])
-        self.turn_on_partial_display()
-
-    def clear(self, color: int):
-        self.send_command(0x24)  # WRITE_RAM
-        for j in range(self.height):
-            for i in range(int(self.width / 8)):
-                self.send_data(color)
-        self.turn_on_display()
+        self.__start_ram_write(0x24)  # WRITE_RAM
+        image = memoryview(image)
+        stride = image_width // 8
+        start = image_y * stride + image_x // 8
+        if width == image_width:
+            self.send_data_buffer(image[start:start + height * stride])
+            return
+
+        # Rows of the rectangle are not contiguous in the image, but they still go out in a single transaction
+        row_size = width // 8
+        self.__digital_write(self.dc_pin, 1)
+        self.__digital_write(self.cs_pin, 0)
+        for row_start in range(start, start + height * stride, stride):
+            self.spi.write(image[row_start:row_start + row_size])
+        self.__digital_write(self.cs_pin, 1)
+
+    def clear(self, color: int, wait=True):
+        row = bytearray([color] * (self.width // 8))
+        self.__wait_for_pending_refresh()
+        upload_start_time = utime.ticks_us()
+        self.__start_ram_write(0x24)  # WRITE_RAM
+        self.send_data_buffer(row, repeat=self.height)
+        self.__record_duration('full', 'spi_upload', upload_start_time)
+        self.turn_on_display(wait)
 
     def sleep(self):
         self.send_command(0x10)  # DEEP_SLEEP_MODE
@@ -257,3 +439,4 @@ class EPD_2in9:
         # self.__delay_ms(2000)
         self.__delay_ms(100)
         self.module_exit()
+        self.__invalidate_state()
@@ -1,4 +1,7 @@
 import framebuf
+import struct
+
+from src.epaper.images import Images
 
 
 class Font:
@@ -7,40 +10,67 @@ class Font:
         CENTER = 1
         RIGHT = 2
 
-    def __init__(self, buffer: bytearray, buffer_width: int, buffer_height: int, glyphs: dict[str, dict[str, int]],
-                 size: int):
-        self.__frame_buffer = framebuf.FrameBuffer(
-            buffer, buffer_width, buffer_height, framebuf.MONO_HLSB
+    # Compiled font file (see outside_pico/compile_assets.py) starts with a header followed by a table of fixed-width
+    # glyph records and bitmaps of glyphs rotated by 180 degrees
+    HEADER_FORMAT = '<HB'  # glyphs count, font size
+    GLYPH_FORMAT = '<HBBbbBI'  # code point, width, height, x offset, y offset, x advance, bitmap offset in file
+    __header_size = struct.calcsize(HEADER_FORMAT)
+    __glyph_size = struct.calcsize(GLYPH_FORMAT)
+
+    def __init__(self, name: str):
+        """
+        :param name: name of the compiled font (one of Images constants); only its glyph table is kept in memory
+        """
+        self.__name = name
+        with Images.file(name) as file:
+            glyphs_count, self.__size = struct.unpack(Font.HEADER_FORMAT, file.read(Font.__header_size))
+            self.__glyph_table = file.read(glyphs_count * Font.__glyph_size)
+        # Characters of glyph records in order of the table
+        self.__chars = ''.join(
+            chr(struct.unpack_from('<H', self.__glyph_table, index * Font.__glyph_size)[0])
+            for index in range(glyphs_count)
+        )
+
+        # Glyph bitmaps read on first use
+        self.__glyph_frame_buffers: dict[str, framebuf.FrameBuffer] = {}
+
+    def __glyph(self, char: str):
+        """
+        :return: (code point, width, height, x offset, y offset, x advance, bitmap offset) or None for unknown char
+        """
+        index = self.__chars.find(char)
+        if index < 0:
+            return None
+        return struct.unpack_from(Font.GLYPH_FORMAT, self.__glyph_table, index * Font.__glyph_size)
+
+    def __get_glyph_frame_buffer(self, char: str, glyph: tuple):
+        if char in self.__glyph_frame_buffers:
+            return self.__glyph_frame_buffers[char]
+
+        _, width, height, _, _, _, bitmap_offset = glyph
+        bitmap = bytearray(((width + 7) // 8) * height)
+        Images.read_into(self.__name, bitmap, bitmap_offset)
+        glyph_frame_buffer = framebuf.FrameBuffer(bitmap, width, height, framebuf.MONO_HLSB)
+
+        self.__glyph_frame_buffers[char] = glyph_frame_buffer
+        return glyph_frame_buffer
+
+    def __draw_glyph(self, target: framebuf.FrameBuffer, char: str, glyph: tuple, start_x: int, start_y: int):
+        _, width, height, _, y_offset, _, _ = glyph
+        if width == 0 or height == 0:
+            return
+
+        target.blit(
+            self.__get_glyph_frame_buffer(char, glyph),
+            start_x, start_y + self.__size - y_offset - (height - 1)
         )
-        self.__buffer_width = buffer_width
-        self.__buffer_height = buffer_height
-        self.__glyphs = glyphs
-        self.__size = size
-
-    def __draw_glyph(
-            self,
-            target: framebuf.FrameBuffer, target_size: tuple[int, int],
-            glyph: dict[str, int], start_x: int, start_y: int
-    ):
-        # Example glyph value: { 'x': 0, 'y': 34, 'width': 25, 'height': 31, 'xoffset': 0, 'yoffset': 10, 'xadvance': 25 }
-
-        for y in range(glyph['height']):
-            for x in range(glyph['width']):
-                target_x = start_x + (glyph['width'] - 1 - x)
-                target_y = start_y - y + self.__size - glyph['yoffset']
-                if target_x >= target_size[0] or target_y >= target_size[1]:
-                    continue
-                pixel = self.__frame_buffer.pixel(
-                    x + glyph['x'],
-                    y + glyph['y']
-                )
-                target.pixel(target_x, target_y, pixel)
 
     def __measure_text(self, text: str):
         width = 0
         for char in text:
-            if char in self.__glyphs:
-                width += self.__glyphs[char]['xadvance']
+            glyph = self.__glyph(char)
+            if glyph is not None:
+                width += glyph[5]
         return width
 
     def draw(self, text: str,
@@ -57,9 +87,47 @@ class Font:
             pivot_x = (target_width + text_width) // 2 - offset_x
 
         for char in text:
-            if char in self.__glyphs:
-                glyph = self.__glyphs[char]
-                pivot_x -= glyph['xadvance']
-                self.__draw_glyph(target, (target_width, target_height), glyph, pivot_x, pivot_y)
+            glyph = self.__glyph(char)
+            if glyph is not None:
+                pivot_x -= glyph[5]
+                self.__draw_glyph(target, char, glyph, pivot_x, pivot_y)
             else:
                 print("Unknown character:", char)
+
+
+class BuiltinFont:
+    """
+    Built-in 8x8 frame buffer font with glyphs rotated by 180 degrees, so text can be drawn directly in display
+    orientation (upside down in frame buffers)
+    """
+    CHAR_SIZE = 8
+
+    def __init__(self):
+        self.__glyph_frame_buffers: dict[str, framebuf.FrameBuffer] = {}
+
+    def __get_glyph_frame_buffer(self, char: str):
+        if char in self.__glyph_frame_buffers:
+            return self.__glyph_frame_buffers[char]
+
+        size = BuiltinFont.CHAR_SIZE
+        upright = framebuf.FrameBuffer(bytearray([0xff] * (size * size // 8)), size, size, framebuf.MONO_HLSB)
+        upright.text(char, 0, 0, 0x00)
+        glyph_frame_buffer = framebuf.FrameBuffer(
+            bytearray(size * size // 8), size, size, framebuf.MONO_HLSB
+        )
+        for y in range(size):
+            for x in range(size):
+                glyph_frame_buffer.pixel(size - 1 - x, size - 1 - y, upright.pixel(x, y))
+
+        self.__glyph_frame_buffers[char] = glyph_frame_buffer
+        return glyph_frame_buffer
+
+    def draw(self, text: str, target: framebuf.FrameBuffer, right: int, bottom: int):
+        """
+        Draws rotated text in black. Only black pixels are drawn.
+        :param right: x coordinate right after the first character (text continues to the left)
+        :param bottom: y coordinate right below the text
+        """
+        for char in text:
+            right -= BuiltinFont.CHAR_SIZE
+            target.blit(self.__get_glyph_frame_buffer(char), right, bottom - BuiltinFont.CHAR_SIZE, 1)
@@ -0,0 +1,76 @@
+import framebuf
+
+
+class BatteryIcon:
+    HEIGHT = 10
+    WIDTH = 20
+    CAP_WIDTH = 2
+    CHARGING_PLUS_SIZE = 10
+    # Number of distinguishable battery fill levels (one per column of battery interior)
+    FILL_STEPS = WIDTH - 2
+
+    def __init__(self):
+        self.__sprites = [BatteryIcon.__create_battery_sprite(step) for step in range(BatteryIcon.FILL_STEPS + 1)]
+        self.__charging_sprite = BatteryIcon.__create_charging_sprite()
+
+    @staticmethod
+    def fill_step(level: float):
+        """
+        Quantizes battery level to one of the drawn fill steps
+        :param level: battery level in range [0, 1]
+        """
+        return min(BatteryIcon.FILL_STEPS, max(0, round(level * BatteryIcon.FILL_STEPS)))
+
+    @staticmethod
+    def __create_battery_sprite(step: int):
+        # Sprites are drawn upside down, the same way as everything else in frame buffers
+        width = BatteryIcon.WIDTH + BatteryIcon.CAP_WIDTH
+        height = BatteryIcon.HEIGHT
+        sprite = framebuf.FrameBuffer(
+            bytearray([0xff] * (((width + 7) // 8) * height)), width, height, framebuf.MONO_HLSB
+        )
+
+        fill_pixels_count = float((height - 2) * (BatteryIcon.WIDTH - 2))
+        level = step / BatteryIcon.FILL_STEPS
+        for y in range(height):
+            for x in range(width):
+                xx = width - 1 - x
+                yy = height - 1 - y
+
+                # Battery cap
+                if x >= BatteryIcon.WIDTH:
+                    if height // 3 <= y <= height // 3 * 2:
+                        sprite.pixel(xx, yy, 0x00)
+                    continue
+
+                if x == 0 or x == BatteryIcon.WIDTH - 1 or y == 0 or y == height - 1:
+                    sprite.pixel(xx, yy, 0x00)
+                    continue
+
+                b_i = float((x - 1) * (height - 2) + ((height - 1 - y) - 1))
+                if b_i < fill_pixels_count * level:
+                    sprite.pixel(xx, yy, 0x00)
+        return sprite
+
+    @staticmethod
+    def __create_charging_sprite():
+        size = BatteryIcon.CHARGING_PLUS_SIZE
+        sprite = framebuf.FrameBuffer(bytearray([0xff] * (((size + 7) // 8) * size)), size, size, framebuf.MONO_HLSB)
+        for y in range(size):
+            for x in range(size):
+                if x == size // 2 or y == size // 2:
+                    sprite.pixel(size - 1 - x, size - 1 - y, 0x00)
+        return sprite
+
+    def draw(self, target: framebuf.FrameBuffer, right: int, bottom: int, level: float, charging: bool):
+        """
+        Draws battery with charging indicator on its left side. Only black pixels are drawn.
+        :param right: x coordinate of the first column after the battery cap
+        :param bottom: y coordinate of the bottom row of the battery
+        :param level: battery level in range [0, 1]
+        """
+        width = BatteryIcon.WIDTH + BatteryIcon.CAP_WIDTH
+        top = bottom - BatteryIcon.HEIGHT + 1
+        target.blit(self.__sprites[BatteryIcon.fill_step(level)], right - width, top, 1)
+        if charging:
+            target.blit(self.__charging_sprite, right - width - BatteryIcon.CHARGING_PLUS_SIZE, top, 1)
@@ -1,65 +1,36 @@
-# NOTE: Images should be mirrored horizontally
+# NOTE: Images are stored rotated by 180 degrees, the way they are sent to the display. Fonts are stored as tables of
+# glyph metrics followed by rotated glyph bitmaps (see src/epaper/font.py).
+# Assets are kept in flash as binary files of the assets directory (see outside_pico/compile_assets.py) and are
+# read on demand, so they do not occupy heap memory.
 class Images:
-    # 128x128
-    AUTHOR_LOGO = bytearray(
-        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xef\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x8f\xff\xff\xff\xff\xff\xff\xff\xff\xbf\xff\xff\xff\xff\xff\xfe\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x8f\xff\xff\xff\xff\xff\xfc\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x83\xff\xff\xff\xff\xff\xf0\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x81\xff\xff\xff\xff\xff\xc0\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x7f\xff\xff\xff\xff\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x1f\xff\xff\xff\xfe\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x07\xff\xff\xff\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x03\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xff\xff\xc0\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xe0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00>\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1e\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xfc\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xff\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x07\xff\xff\xff\xf8\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x1f\xff\xff\xff\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xfe\x00?\xff\xff\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x00\xff\xff\xff\xff\xff\xc0\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xfe\x1f\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xf0\xff\xfc\x07\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xe0?\xf0\x01\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\x80\x1f\xe0\x00\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xfe\x00\x07\xe0\x00?\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xf8\x00\x0f\xf8\x00\x0f\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xf0\x00\x1f\xfe\x00\x03\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xc0\x00\x7f\xff\x00\x01\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\x00\x01\xff\xff\xc0\x00~\x03\xff\xff\xff\xff\xff\xfe\x01\xfc\x00\x07\xff\xff\xf0\x00\x1e\x03\xff\xff\xff\xff\xff\xfe\x01\xf8\x00\x1f\xff\xff\xfc\x00\x0e\x03\xff\xff\xff\xff\xff\xfe\x01\xe0\x00?\xff\xff\xfe\x00\x00\x03\xff\xff\xff\xff\xff\xfe\x01\x80\x00\xff\xff\xff\xff\x80\x00\x03\xff\xff\xff\xff\xff\xfe\x01\x00\x03\xff\xff\xff\xff\xe0\x00\x03\xff\xff\xff\xff\xff\xfe\x00\x00\x07\xff\xff\xff\xff\xf8\x00\x03\xff\xff\xff\xff\xff\xfe\x00\x00\x1f\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xff\xff\xff\xff\xff\x00\x01\xff\xff\xff\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xc0\x00\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x01\xff\xff\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xff\xff\xfc\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x1f\xff\xff\xf0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x07\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\x00\x03\xff\xff\x80\x00\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\x80\x00\xff\xfe\x00\x02\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xe0\x00?\xfc\x00\x0e\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xf8\x00\x1f\xf0\x00\x1e\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xfc\x00\x07\xc0\x00~\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\x00\x01\x00\x01\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xc0\x00\x00\x07\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xf0\x00\x00\x0f\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xf8\x00\x00?\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xfe\x00\x00\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\x80\x01\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xe0\x07\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xf0\x1f\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xfc\x7f\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xfe\x0f\xff\xff\xff\xff\xff\xff\x01\xff\xff\xff\xff\xff\xff\xff\xfe?\xff\xff\xff\xff\xff\xff\x01\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\x81\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff')
+    try:
+        __directory = __file__.rsplit('/', 1)[0] + '/assets'
+    except NameError:
+        __directory = 'src/epaper/assets'
+
+    @staticmethod
+    def file(name: str):
+        """
+        :param name: image name (one of Images constants)
+        :return: opened binary file of the image
+        """
+        return open(f'{Images.__directory}/{name}.bin', 'rb')
 
-    BLUETOOTH_OFF = bytearray(
-        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xff\xff\xff\xe0\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe1\xff\xff\xff\xe0\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\xff\xff\xff\xe0\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x7f\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00?\xff\xff\xe0\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x1f\xff\xff\xe0\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x0f\xff\xff\xe0\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xe0\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xe0\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\xe0\x04\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xff\xe0\x06\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xe0\x07\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xe0\x07\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xff\xe0\x07\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xe0\x07\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xe0\x07\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xf0\x07\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xf8\x07\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xfc\x07\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xfe\x07\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\x07\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xff\x87\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xc7\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xe7\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xf7\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xff\x80\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xc0\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xe0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xf0\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xf8\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xfd\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00 \x04\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00`\x06\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xe0\x07\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xe0\x07\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xe0\x07\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xe0\x07\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xe0\x07\xf0\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xe0\x07\xf8\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xe0\x07\xfc\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x7f\xe0\x07\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xe0\x07\xfe\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xe0\x07\xfc\x00\x00\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xe0\x07\xf8\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xe0\x07\xf0\x00\x00?\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xe0\x07\xe0\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xf0\x00\x1f\xff\xe0\x07\xc0\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xe0\x07\x80\x00\x00\x07\xff\xff\xff\xff\xff\xff\xf0\x00\x7f\xff\xe0\x07\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xf8\x00\xff\xff\xe0\x06\x00\x07\x00\x01\xff\xff\xff\xff\xff\xff\xfc\x01\xff\xff\xe0\x04\x00\x0f\x80\x00\xff\xff\xff\xff\xff\xff\xfe\x03\xff\xff\xe0\x00\x00\x1f\xc0\x00\x7f\xff\xff\xff\xff\xff\xff\x07\xff\xff\xe0\x00\x00?\xe0\x00?\xff\xff\xff\xff\xff\xff\x8f\xff\xff\xe0\x00\x00\x7f\xf0\x00?\xff\xff\xff\xff\xff\xff\xdf\xff\xff\xe0\x00\x00\xff\xf8\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x01\xff\xfc\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x03\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x07\xff\xff\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x0f\xff\xff\x87\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x1f\xff\xff\xcf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff')
+    @staticmethod
+    def read_into(name: str, target, offset=0):
+        """
+        Reads part of the image starting at given byte offset into given buffer (or memoryview of it)
+        """
+        with Images.file(name) as file:
+            file.seek(offset)
+            file.readinto(target)
 
     # 128x128
-    COMMON_24PX = bytearray(
-        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0?\xff\xff\xff\xc1\xff\xe0\xff\xff\xff\xff\xff\xfe\xff\xff\xc0?\xff\x80?\x00\xff\x80?\xff\xff\xff\xff\xfe\x7f\xff\xc0?\xff\xc0\x7f\x00\x7f\x00\x1f\xff\xff\xff\xff\xfe?\xff\xc0?\xff\xc0~\x1c?\x1e\x1f\xff\xff\xff\xff\xfe\x1f\xff\xc0?\xff\xc0~>>\x1f\x0f\xff\xff\xff\xc0\x00\x0f\xff\xc0?\xff\x80|>>?\x0f\xff\xff\xff\xc0\x00\x07\xff\xc0?\xff\x00|>??\x0f\xff\xff\xff\xc0\x00\x03\xff\xc0?\xfe\x00|>\x1f\xfe\x1f\xff\xff\xff\xc0\x00\x00\xff\xc0?\xfc\x03|>\x1f\xfc?\xff\xff\xff\xc0\x00\x00\xff\xc0?\xf8\x07\xfc>\x1f\xf0\x7f\xff\xff\xff\xc0\x00\x01\xff\xc0?\xf0\x0f\xfc>\x1f\xe0\xff\xff\xff\xff\xc0\x00\x07\xff\xc0?\xf0\x1f\xfc>\x1f\x83\xff\xff\xff\xff\xc0\x00\x0f\xff\xc0?\xf8?\xfe>?\x0f\xff\xff\xff\xff\xff\xfe\x1f\xfe\x00\x07\xfc\x7f\xfe<?\x1f\xff\xff\xff\xff\xff\xfe?\xfe\x00\x07\xfe\xff\xfe\x08~\x00\x1f\xff\xff\xff\xff\xfe\x7f\xff\x00\x0f\xff\xff\xff\x00~\x00\x0f\xff\xff\xff\xff\xfe\xff\xff\x80\x1f\xff\xff\xff\x81\xff\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xc0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xff\xfc\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x7f\xff\xff\xff\x80?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0?\xff\xc1\xff\x00?\xff\xff\xff\xff\xef\xff\xff\xff\xff\xe0\x1f\xff\x00\xff\x00?\xff\xff\xff\xff\xcf\xff\xff\xff\xff\xf0\x0f\xfe\x00\x7f\x1f\xff\xff\xff\xff\xff\x8f\xff\xff\xff\xff\xf8\x07~<?\x1f\xff\xff\xff\xff\xff\x0f\xff\xff\xe0\x7f\xfc\x02~<>?\xff\xff\xff\xff\xfe\x00\x00\x7f\x80\x1f\xfe\x00\x7f\xfc>\x00\x7f\xff\xff\xff\xfc\x00\x00\x7f\x1f\x8f\xff\x00\x7f\xf8~\x00?\xff\xff\xff\xf8\x00\x00~?\xc7\xff\x80\x7f\xe0\xff\x1c\x1f\xff\xff\xff\xe0\x00\x00|\x7f\xe3\xff\xc0\x7f\xe0\x7f\xfe\x1f\xff\xff\xff\xe0\x00\x00|\xff\xf3\xff\xc0\x7f\xe0?\xff\x1f\xff\xff\xff\xf0\x00\x00}\xff\xfb\xff\x80?\xfc?\xff\x1f\xff\xff\xff\xfc\x00\x00y\xff\xf9\xff\xfc?\xfe??\x1f\xff\xff\xff\xfe\x00\x00y\xf9\xf9\xff\xff\xfc~>>\x1f\xff\xff\xff\xff\x0f\xff\xf9\xf9\xf9\xff\xff\xfc<>\x00?\xff\xff\xff\xff\x8f\xff\xf9\xf9\xf9\xff\xff\xfc\x00?\x00\x7f\xff\xff\xff\xff\xcf\xff\xf9\xff\xf9\xff\xff\xfe\x00\x7f\xc0\xff\xff\xff\xff\xff\xef\xff\xfc\xff\xf3\xff\xff\xff\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xff\xf3\xff\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x7f\xe7\xff\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x1f\x8f\xff\xe0\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x1f\xff\xc0\x7f\xff\xfe\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xe0\x7f\xff\x80\x7f\xff\xfe\x00\x0f\xff\xff\xff\xe7\xe3\xf9\xff\xff\xff\xf7\x00\xff\xc0\xfe\x00\x1f\xff\xff\xff\xc3\xe1\xf0\xff\xff\xff\xf2\x01\xff\x80\x7f\xff\x1f\xff\xff\xff\xc3\xe1\xf0\xff\xff\xff\xf0\x03\xff\x00?\xfe?\xff\xff\xff\xc3\xc1\xf1\xff\xff\xff\xf0\x07\xfe\x1e?\xfc\x7f\xff\xff\xff\xe3\xc0\xe1\xff\xe0\xff\xf0\x0f\xfe?\x7f\xfc\x7f\xff\xff\xff\xe1\xc0\xe1\xff\x80?\xf0\x1f\xfc?\xff\xf8\xff\xff\xff\xff\xe1\xc0\xe1\xff\x00\x1f\xe0\x1f\xfc \xff\xf0\xff\xff\xff\xff\xe1\x88\xe3\xfe\x0e\x0f\xe0\x0f\xfc@\x7f\xf1\xff\xff\xff\xff\xf1\x8cc\xfc\x1f\x0f\xe1\xff\xfc\x00?\xe1\xff\xff\xff\xff\xf1\x8cC\xfc?\x8f\xff\xff\xfc>\x1f\xe1\xff\xff\xff\xff\xf0\x8cC\xf8\x7f\xff\xff\xff\xfc>\x1f\xe3\xff\xff\xff\xff\xf0\x1cG\xf8\x7f\xff\xff\xff\xfc>\x1f\xc3\xff\xff\xff\xff\xf8\x1e\x07\xf8\x7f\xff\xff\xff\xfc>\x1f\xc3\xff\xff\xff\xff\xf8\x1e\x07\xf8\x7f\xff\xff\xff\xfe>?\xc7\xff\xff\xff\xff\xf8\x1e\x07\xf8\x7f\xff\xe0\x0f\xfe\x08?\xe7\xff\xff\xff\xff\xf8>\x0f\xf8\x7f\xff\xe0\x1f\xff\x00\x7f\xff\xff\xff\xff\xff\xfc?\x0f\xf8?\x8f\xf0\x1f\xff\x80\xff\xff\xff\xff\xff\xff\xfc\x7f\x1f\xfc?\x0f\xf0\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x1f\x0f\xf0\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x1f\xf0\x07\xff\xff\xff\xf9\xff\xff\xff\xff\xff\xff\xff\xff\x80?\xf0\x03\xff\xff\xff\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x7f\xf6\x01\xff\xff\xff\xf1\xff\xff\xff\xff\xe6\x1e\x1f\xff\xff\xff\xff\x00\xff\xc1\xff\xf1\xff\xff\xff\xff\xc4\x0c\x0f\xff\xff\xff\xff\x80\x7f\x00\x7f\xf3\xff\xff\xff\xff\xc0\x00\x07\xff\xff\xff\xff\xc0~\x08?\xe3\xff\xff\xff\xff\xc3\xc3\xc7\xff\xff\xff\xff\xe0\xfe<?\xe3\xff\xff\xff\xff\xc3\xc3\xc7\xfc\x7f\x8f\xff\xf1\xfe>?\xe7\xff\xff\xff\xff\xc7\xc7\xc7\xf8?\x8f\xff\xfb\xfe>?\xc7\xff\xff\xff\xff\xc7\xc7\xc7\xf8?\x8f\xff\xff\xfe<?\xcf\xff\xff\xff\xff\xc7\xc7\xc7\xf8\x1f\x8f\xff\xff\xff\x00\x7f\x8f\xff\xff\xff\xff\xc7\xc7\xc7\xf8\x0f\x8f\xff\xff\xff\x00\x7f\x8f\xff\xff\xff\xff\xc7\xc7\xc7\xf8\x0f\x8f\xff\xff\xfe\x1c?\x9f\xff\xff\xff\xff\xc7\xc7\xc7\xf8\x07\x8f\xff\xe3\xfc>?\x1f\xff\xff\xff\xff\xc7\xc7\xc7\xf8G\x8f\xff\xc3\xfc>\x1f?\xff\xff\xff\xff\xc7\xc7\xc7\xf8C\x8f\xff\x83\xfc>\x1e?\xff\xff\xff\xff\xff\xff\xff\xf8a\x8f\xff\x83\xfc>>?\xff\xff\xff\xff\xff\xff\xff\xf8q\x8f\xff\x03\xfe\x1c>\x7f\xff\xff\xff\xff\xff\xff\xff\xf8p\x8f\xfe#\xfe\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xf8x\x0f\xfcc\xff\x80\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8|\x0f\xfc\xe3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8|\x0f\xf8\xe3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcf\xff\xf8~\x0f\xf1\xe3\xff\xff\xff\xf9\xff\xff\xff\xff\xff\x87\xff\xf8\xff\x0f\xe3\xe3\xff\xff\xff\xf1\xff\xff\xff\xff\xff\x03\xff\xfc\xff\x1f\xe0\x00\x7f\xff\xff\xe1\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xe0\x00\x7f\x81\xff\x81\xff\xff\xff\xff\xfc\x00\xff\xff\xff\xff\xff\xe3\xff\x00\xfe\x01\xff\xff\xff\xff\xf8\x00\x7f\xff\xff\xff\xff\xe3\xfe\x00~\x01\xff\xff\xff\xff\xf0\x00?\xff\xff\xff\xff\xe3\xfc<?\xe1\xff\xff\xff\xff\xf0\x00?\xff\x81\xff\xff\xe3\xfc>?\xe1\xff\xff\xff\xff\xfe\x01\xff\xfe\x00\x7f\xff\xff\xfc>\x1f\xe1\xff\xff\xff\xff\xfe\x01\xff\xfc\x00?\xff\xff\xfc>\x1f\xe1\xff\xff\xff\xff\xfe\x01\xff\xfc|\x1f\xff\xff\xfc>\x1f\xe1\xff\xff\xff\xff\xfe\x01\xff\xf8~?\xff\xff\xfe\x1c\x1f\xe1\xff\xff\xff\xff\xfe\x01\xff\xf8\x7f\xff\xff\xff\xfe\x00\x1f\xe1\xff\xff\xff\xff\xfe\x01\xff\xf8?\xff\xf0\x00\xff\x82?\xe1\xff\xff\xff\xff\xfe\x01\xff\xfc\x03\xff\xe0\x00\xff\xfe?\xe1\xff\xff\xff\xff\xfe\x01\xff\xfc\x00\x7f\xe0\x00\xff\xfe?\xe1\xff\xff\xff\xff\xfe\x01\xff\xff\x00?\xe1\xff\xfe<?\xf1\xff\xff\xff\xff\xfe\x01\xff\xff\xe0\x1f\xe1\xff\xfe\x18\x7f\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xfc\x1f\xe1\xff\xfe\x00\x7f\xff\xff\xff\xff\xff\xfe\x01\xff\xfc\xfe\x1f\xe1\xff\xff\x01\xff\xff\xff\xff\xff\xff\xfe\x01\xff\xf8~\x1f\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8>\x1f\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00?\xe0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x7f\xe1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\xff\xe1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8?\xff\xff\xff\xff\xe1\xff\xff\x0f\xff\xff\xff\xff\xff\xff\xe0\x0f\xff\xff\xff\xff\xe1\xff\xfe\x07\xff\xff\xff\xff\xff\xff\xc1\x0f\xff\xff\xff\xff\xe0\x00\xfcs\xff\xff\xff\xff\xff\xff\xc3\xcf\xff\xff\xff\xff\xe0\x00|s\xff\xff\xff\xff\xff\xff\xc3\xff\xff\xfc\xfe\x7f\xf0\x00\xfcs\xff\xff\xff\xff\xff\xff\xc0\x7f\xff\xf8|?\xff\xff\xfcs\xff\xff\xff\xff\xff\xff\xe0\x0f\xff\xf8|?\xff\xff\xfe\x03\xff\xff\xff\xff\xff\xff\xfc\x07\xff\xfd~\x7f\xff\xff\xff\x0f\xff\xff\xff\xff\xff\xff\xff\x87\xff\xfe\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc7\xc7\xff\xfc\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc3\x07\xff\xf9\xff\xff\xf0?\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x0f\xff\xff\xff\xff\xe0\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x1f\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff')
+    AUTHOR_LOGO = 'author_logo'
 
-    COMMON_24PX_GLYPHS = {
-        ' ': {'x': 0, 'y': 0, 'width': 0, 'height': 0, 'xoffset': 0, 'yoffset': 0, 'xadvance': 8},
-        ',': {'x': 27, 'y': 114, 'width': 9, 'height': 12, 'xoffset': 0, 'yoffset': 18, 'xadvance': 8},
-        '-': {'x': 49, 'y': 120, 'width': 12, 'height': 8, 'xoffset': -1, 'yoffset': 14, 'xadvance': 10},
-        '.': {'x': 36, 'y': 114, 'width': 8, 'height': 8, 'xoffset': 0, 'yoffset': 18, 'xadvance': 8},
-        '/': {'x': 85, 'y': 63, 'width': 13, 'height': 22, 'xoffset': -2, 'yoffset': 4, 'xadvance': 9},
-        '0': {'x': 68, 'y': 0, 'width': 17, 'height': 22, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '1': {'x': 85, 'y': 85, 'width': 12, 'height': 22, 'xoffset': -2, 'yoffset': 5, 'xadvance': 10},
-        '2': {'x': 85, 'y': 0, 'width': 17, 'height': 21, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '3': {'x': 68, 'y': 22, 'width': 17, 'height': 22, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '4': {'x': 49, 'y': 76, 'width': 18, 'height': 22, 'xoffset': -2, 'yoffset': 5, 'xadvance': 15},
-        '5': {'x': 85, 'y': 21, 'width': 17, 'height': 21, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '6': {'x': 68, 'y': 44, 'width': 17, 'height': 22, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '7': {'x': 85, 'y': 42, 'width': 17, 'height': 21, 'xoffset': -2, 'yoffset': 5, 'xadvance': 14},
-        '8': {'x': 68, 'y': 66, 'width': 17, 'height': 22, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        '9': {'x': 68, 'y': 88, 'width': 17, 'height': 22, 'xoffset': -1, 'yoffset': 5, 'xadvance': 15},
-        'C': {'x': 27, 'y': 48, 'width': 20, 'height': 22, 'xoffset': -1, 'yoffset': 4, 'xadvance': 18},
-        'E': {'x': 49, 'y': 98, 'width': 18, 'height': 22, 'xoffset': 0, 'yoffset': 5, 'xadvance': 17},
-        'N': {'x': 27, 'y': 70, 'width': 20, 'height': 22, 'xoffset': 0, 'yoffset': 4, 'xadvance': 19},
-        'S': {'x': 27, 'y': 92, 'width': 19, 'height': 22, 'xoffset': -1, 'yoffset': 4, 'xadvance': 17},
-        'W': {'x': 0, 'y': 44, 'width': 26, 'height': 22, 'xoffset': -2, 'yoffset': 4, 'xadvance': 23},
-        'm': {'x': 0, 'y': 66, 'width': 24, 'height': 18, 'xoffset': -1, 'yoffset': 9, 'xadvance': 23},
-        's': {'x': 0, 'y': 110, 'width': 16, 'height': 18, 'xoffset': -1, 'yoffset': 9, 'xadvance': 13},
-        '°': {'x': 68, 'y': 110, 'width': 13, 'height': 12, 'xoffset': -1, 'yoffset': 5, 'xadvance': 10},
-        '⊙': {'x': 27, 'y': 26, 'width': 22, 'height': 22, 'xoffset': 1, 'yoffset': -1, 'xadvance': 24},
-        '➡': {'x': 0, 'y': 0, 'width': 27, 'height': 22, 'xoffset': -1, 'yoffset': -1, 'xadvance': 24},
-        '⬅': {'x': 0, 'y': 22, 'width': 27, 'height': 22, 'xoffset': -2, 'yoffset': -1, 'xadvance': 24},
-        '⬆': {'x': 0, 'y': 84, 'width': 22, 'height': 26, 'xoffset': 1, 'yoffset': -3, 'xadvance': 24},
-        '⬇': {'x': 27, 'y': 0, 'width': 22, 'height': 26, 'xoffset': 1, 'yoffset': -3, 'xadvance': 24},
-        '⬈': {'x': 49, 'y': 0, 'width': 19, 'height': 19, 'xoffset': -1, 'yoffset': 2, 'xadvance': 17},
-        '⬉': {'x': 49, 'y': 57, 'width': 19, 'height': 19, 'xoffset': -1, 'yoffset': 2, 'xadvance': 17},
-        '⬊': {'x': 49, 'y': 19, 'width': 19, 'height': 19, 'xoffset': -1, 'yoffset': 2, 'xadvance': 17},
-        '⬋': {'x': 49, 'y': 38, 'width': 19, 'height': 19, 'xoffset': -1, 'yoffset': 2, 'xadvance': 17},
-    }
+    BLUETOOTH_OFF = 'bluetooth_off'
 
-    # 256x256
-    DIGITS_104PX = bytearray(
-        b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x03\xff\xff\xff\xff\xff\xff\xfc\x1f\xff\xff\xff\xf8\x00\xff\xff\xff\xff\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xff\xff\xff\xff\xff\xf8\x07\xff\xff\xff\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\x80\x1f\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x0f\xff\xff\xff\xff\xff\xf0\x03\xff\xff\xf8\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\x00\x0f\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x03\xff\xff\xff\xff\xff\xe0\x03\xff\xff\xe0\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xfe\x00\x07\xff\xff\xff\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xff\xff\xc0\x01\xff\xff\x80\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xc0\x01\xff\xff\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xf8\x00\x03\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\xff\xff\x80\x01\xff\xfe\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xf0\x00\x03\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xff\xff\x00\x01\xff\xfc\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xf0\x00\x03\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xff\xff\x00\x01\xff\xf8\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xe0\x00\x03\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x0f\xff\xff\xff\xfe\x00\x01\xff\xf0\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xc0\x00\x03\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\xff\xfc\x00\x01\xff\xe0\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\x80\x00\x03\xff\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\xff\xf8\x00\x01\xff\xe0\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\x00\x00\x03\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x03\xff\xff\xff\xe0\x00\x01\xff\xc0\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\x00\x00\x03\xff\xff\xff\xff\xff\x80\x00\x0f\xf0\x00\x01\xff\xff\xff\x80\x00\x01\xff\xc0\x00\x03\xfc\x00\x00?\xff\xff\xff\xfe\x00\x00\x03\xff\xff\xff\xff\xff\x00\x00?\xfc\x00\x00\xff\xff\xfc\x00\x00\x01\xff\x80\x00\x1f\xff\x00\x00?\xff\xff\xff\xfc\x00\x00\x03\xff\xff\xff\xff\xff\x00\x00\x7f\xfe\x00\x00\xff\xff\xc0\x00\x00\x01\xff\x80\x00?\xff\xc0\x00?\xff\xff\xff\xf8\x00\x00\x03\xff\xff\xff\xff\xfe\x00\x00\xff\xff\x00\x00\xff\xfe\x00\x00\x00\x01\xff\x80\x00\x7f\xff\xe0\x00\x1f\xff\xff\xff\xf8\x00\x00\x03\xff\xff\xff\xff\xfe\x00\x01\xff\xff\x00\x00\x7f\xf8\x00\x00\x00\x01\xff\x80\x00\xff\xff\xe0\x00\x1f\xff\xff\xff\xf0\x00\x00\x03\xff\xff\xff\xff\xfe\x00\x01\xff\xff\x80\x00\x7f\xf8\x00\x00\x00\x01\xff\x80\x01\xff\xff\xe0\x00\x1f\xff\xff\xff\xe0\x00\x00\x03\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xc0\x00?\xf0\x00\x00\x00\x01\xff\x80\x03\xff\xff\xf0\x00\x1f\xff\xff\xff\xc0\x00\x00\x03\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xc0\x00?\xf0\x00\x00\x00\x01\xff\x80\x03\xff\xff\xf0\x00\x1f\xff\xff\xff\x80\x02\x00\x03\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xc0\x00?\xf0\x00\x00\x00\x01\xff\xc0\x07\xff\xff\xf0\x00\x1f\xff\xff\xff\x80\x06\x00\x03\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xc0\x00?\xf0\x00\x00\x00\x01\xff\xe0\x0f\xff\xff\xf0\x00\x1f\xff\xff\xff\x00\x0e\x00\x03\xff\xff\xff\xff\xf8\x00\x07\xff\xff\xe0\x00\x1f\xf0\x00\x00\x00\x01\xff\xf0?\xff\xff\xf0\x00?\xff\xff\xfe\x00\x0e\x00\x03\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xf8\x00\x00\x00\x01\xff\xff\xff\xff\xff\xf0\x00?\xff\xff\xfc\x00\x1e\x00\x03\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xf8\x00\x00\x00\x01\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xfc\x00>\x00\x03\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xfe\x00\x00\x00\x01\xff\xff\xff\xff\xff\xc0\x00?\xff\xff\xf8\x00~\x00\x03\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xff\xf0\x00~\x00\x03\xff\xff\xff\xff\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\x00\x00\x7f\xff\xff\xe0\x00\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xfc\x00\x00\xff\xff\xff\xc0\x01\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xfe\x00\x00\x01\xff\xff\xff\xc0\x03\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xf8\x00\x00\x03\xff\xff\xff\x80\x03\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xf0\x00\x00\x07\xff\xff\xff\x00\x07\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x0f\xff\xff\xfe\x00\x0f\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x1f\xff\xff\xfc\x00\x0f\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x1f\xff\xff\xfc\x00\x1f\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x03\xff\xff\xf8\x00?\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x01\xff\xff\xf0\x00\x7f\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xe0\x00\x00\x00\x7f\xff\xe0\x00\x7f\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xf0\x00\x00\x00\x7f\xff\xe0\x00\xff\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xfc\x00\x00\x00?\xff\xc0\x01\xff\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\x00\x00\x00\x1f\xff\x80\x03\xff\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xfc\x00\x00\x1f\xff\x00\x03\xff\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\x80\x00\x0f\xfe\x00\x07\xff\xfe\x00\x03\xff\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xc0\x00\x0f\xfe\x00\x0f\xff\xfe\x00\x03\xff\xff\xff\xff\xf8\x00\x1f\xff\xff\xf0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xe0\x00\x0f\xfc\x00\x1f\xff\xfe\x00\x03\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xf0\x00\x0f\xfc\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xf0\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xf8\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xf8\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xff\xfe\x00\x01\xff\xf0?\xff\xff\xf8\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfc\x00\x0f\xff\xff\xe0\x00?\xff\xff\xfe\x00\x01\xff\xc0\x1f\xff\xff\xf8\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfc\x00\x07\xff\xff\xe0\x00?\xff\xff\xfe\x00\x01\xff\x80\x0f\xff\xff\xf8\x00\x07\xf8\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfc\x00\x07\xff\xff\xc0\x00?\xff\xff\xfe\x00\x01\xff\x00\x07\xff\xff\xf8\x00\x07\xfc\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfc\x00\x07\xff\xff\xc0\x00\x7f\xff\xff\xfe\x00\x01\xfe\x00\x07\xff\xff\xf8\x00\x07\xfe\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xfe\x00\x03\xff\xff\xc0\x00\x7f\xff\xff\xfe\x00\x01\xfe\x00\x03\xff\xff\xf0\x00\x0f\xff\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xfe\x00\x03\xff\xff\x80\x00\x7f\xff\xff\xfe\x00\x01\xfe\x00\x03\xff\xff\xf0\x00\x0f\xff\xc0\x00\x00\x00\x00\x00\x03\xff\xff\xff\xfe\x00\x01\xff\xff\x80\x00\x7f\xff\xff\xfe\x00\x01\xfe\x00\x01\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\x00\x01\xff\xff\x00\x00\xff\xff\xff\xfe\x00\x01\xfe\x00\x01\xff\xff\xe0\x00\x0f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\x00\x00\xff\xfe\x00\x00\xff\xff\xff\xfe\x00\x01\xfe\x00\x00\xff\xff\xc0\x00\x1f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\x80\x00\x7f\xfe\x00\x01\xff\xff\xff\xfe\x00\x01\xff\x00\x00\x7f\xff\x80\x00\x1f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\x80\x00?\xf8\x00\x01\xff\xff\xff\xfe\x00\x01\xff\x00\x00?\xfe\x00\x00\x1f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xc0\x00\x0f\xe0\x00\x03\xff\xff\xff\xfe\x00\x01\xff\x00\x00\x0f\xf8\x00\x00?\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\xff\xfe\x00\x01\xff\x80\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\xff\xfe\x00\x01\xff\x80\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xff\xfe\x00\x01\xff\xc0\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xff\xfe\x00\x01\xff\xe0\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xff\xfe\x00\x01\xff\xf0\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\xff\xfe\x00\x01\xff\xf8\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\xfe\x00\x01\xff\xfc\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xff\xff\x00\x03\xff\xfe\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x03\xff\xff\xff\xff\xff\x00\x03\xff\xff\x80\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\x00\x07\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x0f\xff\xff\xff\xff\xff\x80\x07\xff\xff\xe0\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\x00\x07\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xff\xff\xff\xff\xff\xc0\x0f\xff\xff\xfc\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xc0\x1f\xff\xff\xff\xff\xff\xff\xff\xc0\x03\xff\xff\xff\xff\xff\xff\xe0\x1f\xff\xff\xff\xc0\x00\xff\xff\xff\xff\xff\xff\xff\xff\xe0?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x7f\xff\xff\xff\xff\xff\x80\x01\xff\xff\xff\xff\xff\xff\xc0\x07\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x80\x00\x0f\xff\xff\xff\xff\xf8\x00\x00\x1f\xff\xff\xff\xff\xfc\x00\x00\x7f\xff\xff\xfc\x00\x00\x00\x00\x00\x00?\xff\xff\xfc\x00\x00\x01\xff\xff\xff\xff\xe0\x00\x00\x07\xff\xff\xff\xff\xe0\x00\x00\x0f\xff\xff\xf8\x00\x00\x00\x00\x00\x00?\xff\xff\xf0\x00\x00\x00\x7f\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x03\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xc0\x00\x00\x00\x1f\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xff\xfe\x00\x00\x00\x01\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xff\x00\x00\x00\x00\x0f\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xf8\x00\x00\x00\x00\x7f\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xfe\x00\x00\x00\x00\x07\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xf0\x00\x00\x00\x00?\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xfc\x00\x00\x00\x00\x03\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\xe0\x00\x00\x00\x00\x1f\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xf8\x00\x00\x00\x00\x03\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\xc0\x00\x00\x00\x00\x0f\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xf0\x00\x00\x00\x00\x01\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\x80\x00\x00\x00\x00\x07\xff\xf0\x00\x00\x00\x00\x00\x00\x0f\xff\xf0\x00\x00\x00\x00\x00\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x03\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xe0\x00\x03\xf8\x00\x00\xff\xff\x00\x00\x07\xe0\x00\x00\xff\xff\x00\x00\x00\x00\x00\x03\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xc0\x00\x0f\xfe\x00\x00\xff\xff\x00\x00?\xfc\x00\x00\xff\xfe\x00\x00\x1f\xe0\x00\x01\xff\xfc\x00\x00\x00\x00\x00\x00?\xff\xc0\x00?\xff\x00\x00\xff\xfe\x00\x00\x7f\xfe\x00\x00\x7f\xfe\x00\x00\x7f\xf8\x00\x01\xff\xff\x00\x00\x00\x00\x00\x00\x7f\xff\x80\x00\x7f\xff\x80\x00\xff\xfe\x00\x01\xff\xff\x80\x00\x7f\xfc\x00\x00\xff\xfe\x00\x00\xff\xff\xff\xff\xff\xff\xe0\x00\x7f\xff\x80\x00\xff\xff\xc0\x00\xff\xfe\x00\x01\xff\xff\x80\x00\x7f\xfc\x00\x03\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xc0\x00\xff\xff\x00\x01\xff\xff\xe0\x01\xff\xfc\x00\x03\xff\xff\xc0\x00?\xf8\x00\x03\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\x80\x01\xff\xff\x00\x01\xff\xff\xf0\x01\xff\xfc\x00\x03\xff\xff\xc0\x00?\xf8\x00\x07\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\x80\x03\xff\xff\x00\x03\xff\xff\xf8\x03\xff\xfc\x00\x07\xff\xff\xe0\x00?\xf8\x00\x0f\xff\xff\xc0\x00\x7f\xff\xff\xff\xff\xff\x00\x07\xff\xfe\x00\x03\xff\xff\xfe\x0f\xff\xfc\x00\x07\xff\xff\xe0\x00?\xf8\x00\x0f\xff\xff\xc0\x00?\xff\xff\xff\xff\xfe\x00\x07\xff\xfe\x00\x07\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xe0\x00?\xf0\x00\x0f\xff\xff\xe0\x00?\xff\xff\xff\xff\xfc\x00\x0f\xff\xfe\x00\x07\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xe0\x00?\xf0\x00\x1f\xff\xff\xe0\x00?\xff\xff\xff\xff\xf8\x00\x1f\xff\xfc\x00\x0f\xff\xff\xff\xff\xff\xfc\x00\x07\xff\xff\xe0\x00?\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xf8\x00?\xff\xfc\x00\x0f\xff\xff\xff\xff\xff\xfe\x00\x07\xff\xff\xe0\x00\x7f\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xf0\x00\x7f\xff\xfc\x00\x0f\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xc0\x00\x7f\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xe0\x00\x7f\xff\xfc\x00\x0f\xff\xff\xff\xff\xff\xfe\x00\x03\xff\xff\xc0\x00\x7f\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xc0\x00\xff\xff\xf8\x00\x1f\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\x80\x00\xff\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\xc0\x00\xff\xff\xf8\x00\x1f\xfc\x00?\xff\xff\xff\x00\x00\xff\xff\x00\x00\xff\xf0\x00\x1f\xff\xff\xe0\x00\x1f\xff\xff\xff\xff\x80\x01\xff\xff\xf8\x00\x1f\xc0\x00\x07\xff\xff\xff\x80\x00?\xfc\x00\x01\xff\xf0\x00\x1f\xff\xff\xe0\x00\x0f\xff\xff\xff\xff\x80\x03\xff\xff\xf8\x00\x1f\x00\x00\x01\xff\xff\xff\x80\x00\x0f\xf0\x00\x01\xff\xf0\x00\x0f\xff\xff\xc0\x00\x0f\xff\xff\xff\xff\x00\x03\xff\xff\xf8\x00\x1c\x00\x00\x00\x7f\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xf8\x00\x0f\xff\xff\xc0\x00\x0f\xff\xff\xff\xfe\x00\x07\xff\xff\xf0\x00\x18\x00\x00\x00\x1f\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xf8\x00\x0f\xff\xff\xc0\x00\x0f\xff\xff\xff\xfe\x00\x07\xff\xff\xf0\x00\x10\x00\x00\x00\x0f\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xf8\x00\x07\xff\xff\x80\x00\x0f\xff\xff\xff\xfc\x00\x0f\xff\xff\xf0\x00\x00\x00\x00\x00\x07\xff\xff\xfc\x00\x00\x00\x00?\xff\xf8\x00\x07\xff\xff\x00\x00\x0f\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x00\x00\x00\x00\x03\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xfc\x00\x03\xff\xff\x00\x00\x0f\xff\xff\xff\xf8\x00\x1f\xff\xff\xf0\x00\x00\x00\x00\x00\x01\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xfc\x00\x01\xff\xfe\x00\x00\x0f\xff\xff\xff\xf0\x00\x1f\xff\xff\xf0\x00\x00\x00\x00\x00\x00\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xfe\x00\x00\x7f\xf8\x00\x00\x0f\xff\xff\xff\xf0\x00?\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x7f\xff\xe0\x00\x00\x00\x00\x07\xff\xfe\x00\x00\x1f\xc0\x00\x00\x0f\xff\xff\xff\xe0\x00?\xff\xff\xf0\x00\x00\x0f\xf0\x00\x00\x7f\xff\xc0\x00\x00\x00\x00\x03\xff\xff\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xe0\x00\x7f\xff\xff\xf0\x00\x00?\xfe\x00\x00?\xff\x80\x00\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xc0\x00\x7f\xff\xff\xf0\x00\x00\x7f\xff\x00\x00?\xff\x00\x00\x0f\xe0\x00\x00\xff\xff\x80\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xc0\x00\x7f\xff\xff\xf0\x00\x01\xff\xff\x80\x00?\xfe\x00\x00\x7f\xfc\x00\x00\x7f\xff\xc0\x00\x00\x00\x00\x00\x1f\xff\xff\xff\x80\x00\xff\xff\xff\xf0\x00\x01\xff\xff\xc0\x00\x1f\xfe\x00\x00\xff\xfe\x00\x00\x7f\xff\xe0\x00\x00\x00\x10\x00\x1f\xff\xff\xff\x80\x00\xff\xff\xff\xf0\x00\x03\xff\xff\xc0\x00\x1f\xfc\x00\x01\xff\xff\x80\x00?\xff\xf0\x00\x00\x000\x00\x1f\xff\xff\xff\x00\x00\xff\xff\xff\xf0\x00\x07\xff\xff\xe0\x00\x1f\xfc\x00\x03\xff\xff\xc0\x00?\xff\xf8\x00\x00\x00p\x00\x1f\xff\xff\xff\x00\x01\xff\xff\xff\xf0\x00\x07\xff\xff\xe0\x00\x0f\xf8\x00\x07\xff\xff\xc0\x00\x1f\xff\xfe\x00\x00\x00\xf0\x00\x1f\xff\xff\xff\x00\x01\xff\xff\xff\xf0\x00\x07\xff\xff\xf0\x00\x0f\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xff\x80\x00\x03\xf0\x00\x1f\xff\xff\xfe\x00\x03\xff\xff\xff\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xff\xf0\x00\x0f\xf0\x00\x1f\xff\xff\xfe\x00\x03\xff\xff\xff\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xff\xff\xfe\x00\x7f\xf0\x00?\xff\xff\xfc\x00\x03\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xf0\x00?\xff\xff\xfc\x00\x07\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xf8\x00\x07\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xf8\x00\x07\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xf8\x00\x0f\xff\xff\xff\xf8\x00\x0f\xff\xff\xf0\x00\x0f\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xe0\x00?\xff\xff\xf0\x00\x0f\xff\xff\xff\xfc\x00\x0f\xff\xff\xf0\x00\x1f\xf0\x00\x1f\xff\xff\xf0\x00\x0f\xff\xff\xff\xff\xff\xc0\x00\x7f\xff\xff\xf0\x00\x0f\xff\xff\xff\xfc\x00\x07\xff\xff\xf0\x00\x1f\xf0\x00\x0f\xff\xff\xf0\x00\x0f\xff\xe0\xff\xff\xff\xc0\x00\x7f\xff\xff\xe0\x00\x1f\xff\xff\xff\xfc\x00\x07\xff\xff\xe0\x00\x1f\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\xc0?\xff\xff\x80\x00\xff\xff\xff\xe0\x00\x1f\xff\xff\xff\xfe\x00\x03\xff\xff\xe0\x00\x1f\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xff\x80\x1f\xff\xff\x80\x00\xff\xff\xff\xe0\x00\x1f\xff\xff\xff\xfe\x00\x03\xff\xff\xc0\x00?\xf8\x00\x07\xff\xff\xc0\x00\x1f\xff\x00\x0f\xff\xff\x00\x00\xff\xff\xff\xe0\x00\x1f\xff\xff\xff\xfe\x00\x01\xff\xff\x80\x00?\xf8\x00\x03\xff\xff\x80\x00\x1f\xfe\x00\x07\xff\xfe\x00\x01\xff\xff\xff\xc0\x00?\xff\xff\xff\xff\x00\x00\xff\xff\x00\x00?\xfc\x00\x01\xff\xff\x00\x00?\xfe\x00\x03\xff\xfe\x00\x01\xff\xff\xff\xc0\x00?\xff\xff\xff\xff\x00\x00?\xfe\x00\x00\x7f\xfc\x00\x00\xff\xfe\x00\x00?\xfe\x00\x01\xff\xf8\x00\x03\xff\xff\xff\xc0\x00?\xff\xff\xff\xff\x80\x00\x0f\xf0\x00\x00\x7f\xfc\x00\x00\x1f\xf0\x00\x00?\xfe\x00\x00\x7f\xf0\x00\x03\xff\xff\xff\xc0\x00?\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x00\xff\xfe\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\x1f\xc0\x00\x07\xff\xff\xff\x80\x00?\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x00\xff\xfe\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x0f\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x0f\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x03\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\x80\x00\x00\x00\x00\x1f\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x07\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\x80\x00\x00\x00\x00?\xff\xff\xff\x80\x00\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x0f\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\xc0\x00\x00\x00\x00\x7f\xff\xff\xff\x80\x00\xff\xff\xff\xff\xff\xfe\x00\x00\x00\x00\x1f\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xf0\x00\x00\x00\x01\xff\xff\xff\xff\xc0\x00\xff\xff\xff\xff\xff\xff\x80\x00\x00\x00\x7f\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\xf8\x00\x00\x00\x03\xff\xff\xff\xff\xc0\x01\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xfc\x00\x00\x00\x0f\xff\xff\xff\xff\xe0\x01\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x03\xff\xff\xff\xff\xc0\x00\x00\x03\xff\xff\xff\xff\x00\x00\x00?\xff\xff\xff\xff\xf0\x07\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x1f\xff\xff\xff\xff\xf0\x00\x00\x1f\xff\xff\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\xf8\x0f\xff\xff\xff\xff\xff\xff\xff\xe0\x00\xff\xff\xff\xff\xff\xff\x80\x01\xff\xff\xff\xff\xff\xfe\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x03\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x1f\xff\xff\xff\xe0\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x07\xff\xff\xff\xc0\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x01\xff\xff\xff\xc0\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x7f\xff\xff\x80\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\x80\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x0f\xff\xff\x80\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x07\xff\xff\x80\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x1f\xf0\x00\x00\x7f\xff\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x7f\xfc\x00\x00?\xfe\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x01\xff\xff\x00\x00?\xfe\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x03\xff\xff\x80\x00?\xfe\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x03\xff\xff\x80\x00\x1f\xfe\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x07\xff\xff\xc0\x00\x1f\xfe\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xc0\x00\x1f\xfe\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xfc\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x0f\xff\xff\xe0\x00\x1f\xfc\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x1f\xff\xff\xe0\x00\x1f\xfc\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x1f\xff\xff\xe0\x00\x1f\xfc\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x1f\xff\xff\xe0\x00\x1f\xfc\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00?\xff\xff\xe0\x00\x1f\xfc\x00?\x80\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00?\xff\xff\xe0\x00?\xf8\x00|\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x7f\xff\xff\xc0\x00?\xf8\x00p\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x81\xff\xff\xff\xc0\x00?\xf8\x00`\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00?\xf8\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xf8\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x7f\xf8\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x7f\xf0\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\xff\xf0\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x01\xff\xf0\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x01\xff\xf0\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x03\xff\xf0\x00\x01\xfe\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x07\xff\xf8\x00\x0f\xff\xc0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x0f\xff\xf8\x00?\xff\xf0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x1f\xff\xfc\x00\x7f\xff\xf8\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00?\xff\xff\x03\xff\xff\xfc\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x00\x7f\xff\xff\xff\xff\xff\xfe\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\x01\xff\xff\xff\xff\xff\x07\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x07\xff\xff\xff\xff\xfc\x03\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\x0f\xff\xff\xff\xff\xf8\x01\xff\xff\xff\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x1f\xff\xff\xff\xff\xf0\x00\xff\xff\xfe\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x7f\xff\xff\xff\xff\xf0\x00\x7f\xff\xfe\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\xff\xff\xff\xff\xff\xe0\x00?\xff\xfc\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x01\xff\xff\xff\xff\xff\xe0\x00\x1f\xff\xf8\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x03\xff\xff\xff\xff\xff\xe0\x00\x0f\xff\xf0\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x07\xff\xff\xff\xff\xff\xe0\x00\x07\xff\xc0\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x00\x00\xff\xe0\x00\x00\xff\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00?\xf0\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x1f\xf0\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x1f\xfc\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x1f\xff\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x00\x00\x00\x00\x00\x00\x1f\xff\x80\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xc0\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xf0\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x00?\xff\xfc\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x7f\xff\xff\x80\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x00\x00\x00\x01\xff\xff\xff\xfc\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff')
+    # Fonts
+    COMMON_24PX = 'common_24px'
+    DIGITS_104PX = 'digits_104px'
 
-    DIGITS_104PX_GLYPHS = {
-        ' ': {'x': 0, 'y': 0, 'width': 0, 'height': 0, 'xoffset': 0, 'yoffset': 0, 'xadvance': 32},
-        '0': {'x': 0, 'y': 0, 'width': 64, 'height': 83, 'xoffset': 0, 'yoffset': 23, 'xadvance': 64},
-        '1': {'x': 64, 'y': 0, 'width': 43, 'height': 83, 'xoffset': -5, 'yoffset': 23, 'xadvance': 43},
-        '2': {'x': 0, 'y': 166, 'width': 63, 'height': 82, 'xoffset': -1, 'yoffset': 23, 'xadvance': 62},
-        '3': {'x': 107, 'y': 0, 'width': 62, 'height': 83, 'xoffset': -1, 'yoffset': 23, 'xadvance': 62},
-        '4': {'x': 169, 'y': 0, 'width': 68, 'height': 83, 'xoffset': -3, 'yoffset': 23, 'xadvance': 64},
-        '5': {'x': 63, 'y': 166, 'width': 62, 'height': 82, 'xoffset': -1, 'yoffset': 24, 'xadvance': 62},
-        '6': {'x': 0, 'y': 83, 'width': 64, 'height': 83, 'xoffset': 0, 'yoffset': 23, 'xadvance': 64},
-        '7': {'x': 192, 'y': 83, 'width': 64, 'height': 82, 'xoffset': -3, 'yoffset': 24, 'xadvance': 60},
-        '8': {'x': 64, 'y': 83, 'width': 64, 'height': 83, 'xoffset': 0, 'yoffset': 23, 'xadvance': 64},
-        '9': {'x': 128, 'y': 83, 'width': 64, 'height': 83, 'xoffset': 0, 'yoffset': 23, 'xadvance': 64}
-    }
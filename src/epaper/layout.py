@@ -0,0 +1,95 @@
+import framebuf
+
+
+class Widget:
+    """
+    Rectangular part of the screen rendered from a quantized value.
+    The value should describe rendered content completely, so widget is re-rendered only when it changes.
+    """
+
+    def __init__(self, name: str, box: tuple[int, int, int, int], quantize: callable, render: callable, opaque=False):
+        """
+        :param box: (x, y, width, height) bounding box in buffer coordinates; x and width must be multiples of 8
+        :param quantize: function returning comparable value of the widget for given state dictionary
+        :param render: function drawing the widget for given value into given frame buffer
+        :param opaque: whether rendering covers the whole box (otherwise box is cleared before rendering)
+        """
+        if box[0] % 8 != 0 or box[2] % 8 != 0:
+            raise ValueError("Widget bounding box must be byte aligned")
+        self.name = name
+        self.box = box
+        self.quantize = quantize
+        self.render = render
+        self.opaque = opaque
+
+    def overlaps(self, other: 'Widget'):
+        x, y, width, height = self.box
+        other_x, other_y, other_width, other_height = other.box
+        return x < other_x + other_width and other_x < x + width and \
+            y < other_y + other_height and other_y < y + height
+
+
+class Layout:
+    """
+    Retained mode set of widgets. Values rendered into each buffer are remembered, so rendering a frame touches only
+    widgets whose values changed since that buffer was rendered (and widgets overlapping them).
+    """
+
+    def __init__(self, widgets: list[Widget]):
+        self.__widgets = widgets
+        # Values of widgets rendered into each buffer (by buffer id)
+        self.__rendered_values: dict[int, dict[str, any]] = {}
+
+    def model(self, state: dict[str, any]):
+        """
+        :return: tuple of quantized values of all widgets (in order of widgets); equal models are rendered identically
+        """
+        return tuple(widget.quantize(state) for widget in self.__widgets)
+
+    def render(self, buffer: bytearray, frame_buffer: framebuf.FrameBuffer, state: dict[str, any], force=False):
+        """
+        Renders invalidated widgets into given buffer
+        :param force: whether all widgets should be rendered regardless of values held by the buffer
+        :return: list of rendered widgets
+        """
+        values = {widget.name: value for widget, value in zip(self.__widgets, self.model(state))}
+        rendered_values = self.__rendered_values.setdefault(id(buffer), {})
+
+        invalidated = [
+            widget for widget in self.__widgets
+            if force or widget.name not in rendered_values or rendered_values[widget.name] != values[widget.name]
+        ]
+        # Clearing a widget's box erases overlapping widgets as well
+        expanded = True
+        while expanded:
+            expanded = False
+            for widget in self.__widgets:
+                if widget not in invalidated and any(widget.overlaps(other) for other in invalidated):
+                    invalidated.append(widget)
+                    expanded = True
+
+        rendered: list[Widget] = []
+        for widget in self.__widgets:
+            if widget not in invalidated:
+                continue
+            if not widget.opaque:
+                x, y, width, height = widget.box
+                frame_buffer.fill_rect(x, y, width, height, 0xff)
+        for widget in self.__widgets:
+            if widget in invalidated:
+                widget.render(frame_buffer, values[widget.name])
+                rendered_values[widget.name] = values[widget.name]
+                rendered.append(widget)
+        return rendered
+
+    def differing_widgets(self, buffer: bytearray, other_buffer: bytearray):
+        """
+        :return: list of widgets which may look different in the two buffers
+        """
+        values = self.__rendered_values.get(id(buffer), {})
+        other_values = self.__rendered_values.get(id(other_buffer), {})
+        return [
+            widget for widget in self.__widgets
+            if widget.name not in values or widget.name not in other_values or
+            values[widget.name] != other_values[widget.name]
+        ]
@@ -0,0 +1,62 @@
+class RefreshScheduler:
+    """
+    Keeps track of partial refreshes done since the last full refresh and decides when the full one is needed
+    to clear ghosting.
+    Each region has its own budget of toggled pixels and partial refreshes. Only a used up toggled pixels budget makes
+    full refresh due at any moment; the number of partial refreshes is considered only when full refresh is convenient.
+    """
+
+    # Realtime data is partially refreshed every couple of seconds while riding, so it is a limit for refreshes toggling
+    # few pixels rather than for a ride
+    PARTIAL_REFRESHES_BUDGET = 1000
+    # How many times (on average) every pixel of a region can be toggled before ghosting becomes visible (realtime data
+    # of a ride without stops uses it up in about 7 minutes, like the fixed timer used before)
+    TOGGLED_PIXELS_BUDGET_FACTOR = 12
+    # Part of the budget after which full refresh is done if it does not disturb the rider (e.g. bike is stopped)
+    CONVENIENT_BUDGET_USAGE = 0.5
+
+    def __init__(self, regions: dict[str, int]):
+        """
+        :param regions: area in pixels of each region that is partially refreshed
+        """
+        self.__regions_area = regions
+        self.__partial_refreshes: dict[str, int] = {}
+        self.__toggled_pixels: dict[str, int] = {}
+        self.record_full_refresh()
+
+    def record_full_refresh(self):
+        for name in self.__regions_area:
+            self.__partial_refreshes[name] = 0
+            self.__toggled_pixels[name] = 0
+
+    def record_partial_refresh(self, region: str, toggled_pixels: int):
+        self.__partial_refreshes[region] += 1
+        self.__toggled_pixels[region] += toggled_pixels
+
+    @property
+    def toggled_pixels_usage(self):
+        """
+        Returns usage of the most used up toggled pixels budget (1.0 means that the budget is used up).
+        """
+        usage = 0.
+        for name, area in self.__regions_area.items():
+            usage = max(usage, self.__toggled_pixels[name] / (area * RefreshScheduler.TOGGLED_PIXELS_BUDGET_FACTOR))
+        return usage
+
+    @property
+    def budget_usage(self):
+        """
+        Returns usage of the most used up budget (1.0 means that the budget is used up).
+        """
+        usage = self.toggled_pixels_usage
+        for partial_refreshes in self.__partial_refreshes.values():
+            usage = max(usage, partial_refreshes / RefreshScheduler.PARTIAL_REFRESHES_BUDGET)
+        return usage
+
+    def full_refresh_due(self, convenient: bool):
+        """
+        :param convenient: whether full refresh would not disturb the user at the moment
+        """
+        if convenient:
+            return self.budget_usage >= RefreshScheduler.CONVENIENT_BUDGET_USAGE
+        return self.toggled_pixels_usage >= 1.
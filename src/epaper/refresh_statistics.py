@@ -0,0 +1,80 @@
+import struct
+
+
+class TimingStatistics:
+    """
+    Minimum, average, maximum and last value of measured durations (in microseconds)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.last = 0
+
+    def add(self, duration: int):
+        if self.count == 0 or duration < self.min:
+            self.min = duration
+        if self.count == 0 or duration > self.max:
+            self.max = duration
+        self.count += 1
+        self.total += duration
+        self.last = duration
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count > 0 else 0.
+
+
+class RefreshStatistics:
+    KINDS = ('full', 'partial')
+    # render: drawing frame into buffers; spi_upload: writing display RAM; lut_upload: partial waveform setup;
+    # busy_wait: time from refresh activation until display is no longer busy
+    PHASES = ('render', 'spi_upload', 'lut_upload', 'busy_wait')
+
+    def __init__(self):
+        self.__timings: dict[str, dict[str, TimingStatistics]] = {}
+        self.reset()
+
+    def reset(self):
+        for kind in RefreshStatistics.KINDS:
+            self.__timings[kind] = {phase: TimingStatistics() for phase in RefreshStatistics.PHASES}
+
+    def add(self, kind: str, phase: str, duration: int):
+        """
+        :param kind: one of KINDS
+        :param phase: one of PHASES
+        :param duration: measured time in microseconds
+        """
+        self.__timings[kind][phase].add(duration)
+
+    def get(self, kind: str, phase: str):
+        return self.__timings[kind][phase]
+
+    def pack(self):
+        """
+        Packs statistics for sending over bluetooth.
+        For every kind and phase (in order of KINDS and PHASES) there is unsigned int count followed by
+        min, average, max and last duration as floats in milliseconds.
+        """
+        data = bytes()
+        for kind in RefreshStatistics.KINDS:
+            for phase in RefreshStatistics.PHASES:
+                timing = self.__timings[kind][phase]
+                data += struct.pack(
+                    'I4f', timing.count, timing.min / 1000, timing.average / 1000, timing.max / 1000, timing.last / 1000
+                )
+        return data
+
+    def __str__(self):
+        lines = []
+        for kind in RefreshStatistics.KINDS:
+            for phase in RefreshStatistics.PHASES:
+                timing = self.__timings[kind][phase]
+                lines.append(
+                    f"{kind} {phase}: count: {timing.count}; min: {timing.min / 1000}ms; " +
+                    f"avg: {round(timing.average / 1000, 3)}ms; max: {timing.max / 1000}ms; " +
+                    f"last: {timing.last / 1000}ms"
+                )
+        return '\n'.join(lines)
@@ -0,0 +1,91 @@
+import framebuf
+
+from src.epaper.font import BuiltinFont
+
+
+class TextCache:
+    """
+    Least recently used cache of text rendered with built-in font (rotated the way it is sent to the display).
+    Total size of cached bitmaps is limited; least recently used blocks are evicted first.
+    """
+
+    def __init__(self, font: BuiltinFont, max_bytes=4096):
+        """
+        :param max_bytes: limit of total size of cached bitmaps
+        """
+        self.__font = font
+        self.__max_bytes = max_bytes
+        # key: [buffer, frame buffer, width, height, last use]
+        self.__entries: dict[any, list] = {}
+        self.__use_counter = 0
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self):
+        return f"text cache: blocks: {len(self.__entries)}; size: {self.bytes}/{self.__max_bytes}B; " + \
+            f"hits: {self.hits}; misses: {self.misses}; evictions: {self.evictions}"
+
+    def __get(self, key):
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__use_counter += 1
+        entry[4] = self.__use_counter
+        return entry
+
+    def __put(self, key, width: int, height: int):
+        buffer = bytearray([0xff] * ((width + 7) // 8 * height))
+        self.__use_counter += 1
+        entry = [buffer, framebuf.FrameBuffer(buffer, width, height, framebuf.MONO_HLSB), width, height,
+                 self.__use_counter]
+        if len(buffer) > self.__max_bytes:
+            # Too big to be cached at all
+            return entry
+
+        while self.bytes + len(buffer) > self.__max_bytes:
+            least_recently_used = min(self.__entries, key=lambda k: self.__entries[k][4])
+            self.bytes -= len(self.__entries.pop(least_recently_used)[0])
+            self.evictions += 1
+        self.__entries[key] = entry
+        self.bytes += len(buffer)
+        return entry
+
+    def line(self, text: str):
+        """
+        :return: (frame buffer, width) of rendered line of text; height equals BuiltinFont.CHAR_SIZE
+        """
+        entry = self.__get(text)
+        if entry is None:
+            width = len(text) * BuiltinFont.CHAR_SIZE
+            entry = self.__put(text, width, BuiltinFont.CHAR_SIZE)
+            self.__font.draw(text, entry[1], width, BuiltinFont.CHAR_SIZE)
+        return entry[1], entry[2]
+
+    def block(self, text: str, width: int, line_height: int):
+        """
+        Multiple lines of text centered horizontally in a block of given width
+        :return: buffer of rendered block with height of line_height times number of lines
+        """
+        key = (text, width, line_height)
+        entry = self.__get(key)
+        if entry is None:
+            lines = text.split('\n')
+            height = line_height * len(lines)
+            entry = self.__put(key, width, height)
+            for line_index, line in enumerate(lines):
+                if len(line) == 0:
+                    continue
+                line_frame_buffer, line_width = self.line(line)
+                # Block is rotated by 180 degrees so the first line is at the bottom
+                entry[1].blit(
+                    line_frame_buffer,
+                    (width - line_width) - (width - line_width) // 2,
+                    height - line_index * line_height - BuiltinFont.CHAR_SIZE,
+                    1
+                )
+        return entry[0]
@@ -0,0 +1,86 @@
+import time
+
+
+class RideStatistics:
+    """
+    Ride statistics updated with every wheel revolution, so they stay current without the mobile app.
+    Values received from the mobile app replace the ones counted so far and are continued from there.
+    """
+
+    def __init__(self):
+        # Values received from the mobile app (or zeros)
+        self.__base_ride_duration = 0.
+        self.__base_time_in_motion = 0.
+        self.__base_distance = 0.
+        # ticks_ms timestamp since which ride duration is counted or None before the ride started
+        self.__counting_since = None
+
+        # Counted since the values were received (in milliseconds and kilometers)
+        self.__time_in_motion = 0.
+        self.__distance = 0.
+        self.__max_speed = 0.
+
+    @property
+    def ride_duration(self):
+        """
+        Ride duration in milliseconds
+        """
+        if self.__counting_since is None:
+            return self.__base_ride_duration
+        return self.__base_ride_duration + time.ticks_diff(time.ticks_ms(), self.__counting_since)
+
+    @property
+    def time_in_motion(self):
+        """
+        Time in motion in milliseconds
+        """
+        return self.__base_time_in_motion + self.__time_in_motion
+
+    @property
+    def traveled_distance(self):
+        """
+        Traveled distance in kilometers
+        """
+        return self.__base_distance + self.__distance
+
+    @property
+    def average_speed(self):
+        """
+        Average speed in motion in km/h
+        """
+        time_in_motion = self.time_in_motion
+        return self.traveled_distance / (time_in_motion / 3600000) if time_in_motion > 0 else 0.
+
+    @property
+    def max_speed(self):
+        """
+        Max speed in km/h
+        """
+        return self.__max_speed
+
+    def add_revolution(self, interval: int, speed: float):
+        """
+        :param interval: time of the revolution in microseconds
+        :param speed: estimated speed (in km/h) the revolution was made with
+        """
+        if self.__counting_since is None:
+            self.__counting_since = time.ticks_ms()
+        self.__time_in_motion += interval / 1000
+        # Estimated speed is integrated rather than revolutions counted, so glitches of the sensor do not add up
+        self.__distance += speed * interval / 3.6e9
+        if speed > self.__max_speed:
+            self.__max_speed = speed
+
+    def reconcile(self, ride_duration: float, time_in_motion: float, traveled_distance: float):
+        """
+        Continues counting from values received from the mobile app
+        :param ride_duration: ride duration in milliseconds
+        :param time_in_motion: time in motion in milliseconds
+        :param traveled_distance: traveled distance in kilometers
+        """
+        self.__base_ride_duration = ride_duration
+        self.__base_time_in_motion = time_in_motion
+        self.__base_distance = traveled_distance
+        self.__time_in_motion = 0.
+        self.__distance = 0.
+        self.__counting_since = time.ticks_ms() if ride_duration > 0 or self.__counting_since is not None else None
@@ -0,0 +1,203 @@
+import array
+import time
+
+
+class SpeedEstimator:
+    """
+    Estimates speed from intervals between recent wheel sensor pulses.
+    Intervals far from the median of the window (caused by spurious pulses) are ignored and an isolated interval of
+    two revolutions is counted as a missed pulse, so a single glitch does not show up as a spike or a drop of speed.
+    Consecutive long intervals mean slowing down, so the window starts over from the newest one. Intervals are kept in
+    fixed-size storage.
+    """
+    WINDOW_SIZE = 8
+    # Intervals used for the estimate cover at most this time (the newest one is always used), so speed changes show
+    # up quickly
+    WINDOW_DURATION_US = 3000000
+    # Shorter intervals are repeated triggers of the sensor by the same magnet pass (2m wheel at 180km/h)
+    MIN_INTERVAL_US = 40000
+    # Longer intervals mean the wheel was stopped, so older intervals are not related to the current speed
+    MAX_INTERVAL_US = 8000000
+    # Intervals differing from the median (or from the expected interval) by more than this part of it are outliers
+    OUTLIER_TOLERANCE = 0.2
+    # Speedometer already shows decaying speed during intervals of more revolutions, so they are taken as slowing down
+    MAX_MISSED_PULSES = 1
+
+    def __init__(self, circumference: float):
+        """
+        :param circumference: The circumference of the wheel in cm.
+        """
+        self.__circumference = circumference
+        # Ring buffer of intervals in microseconds
+        self.__intervals = array.array('L', [0] * SpeedEstimator.WINDOW_SIZE)
+        # Preallocated storage for finding the median
+        self.__sorted_intervals = array.array('L', [0] * SpeedEstimator.WINDOW_SIZE)
+        self.__count = 0
+        self.__next_index = 0
+        self.__last_timestamp = None
+        # Long interval waiting for the next one to tell a missed pulse from slowing down (0 if none)
+        self.__pending_interval = 0
+        # Whether the previous interval was longer than expected
+        self.__slowing_down = False
+
+        # Interval of a revolution at the estimated speed
+        self.__estimated_interval = 0.
+        self.__speed = 0.
+        self.__acceleration = 0.
+
+    @property
+    def speed(self):
+        """
+        Speed in km/h
+        """
+        return self.__speed
+
+    @property
+    def acceleration(self):
+        """
+        Acceleration in km/h per second
+        """
+        return self.__acceleration
+
+    @property
+    def last_timestamp(self):
+        """
+        ticks_us timestamp of the last accepted pulse or None
+        """
+        return self.__last_timestamp
+
+    def set_circumference(self, circumference: float):
+        self.__circumference = circumference
+        if self.__count > 0:
+            self.__update_estimate()
+
+    def reset(self):
+        self.__count = 0
+        self.__last_timestamp = None
+        self.__pending_interval = 0
+        self.__slowing_down = False
+        self.__speed = 0.
+        self.__acceleration = 0.
+
+    def add_pulse(self, timestamp: int):
+        """
+        :param timestamp: ticks_us timestamp of the sensor pulse
+        :return: True if the pulse was accepted
+        """
+        if self.__last_timestamp is None:
+            self.__last_timestamp = timestamp
+            return True
+
+        interval = time.ticks_diff(timestamp, self.__last_timestamp)
+        if interval < SpeedEstimator.MIN_INTERVAL_US:
+            return False
+        if interval > SpeedEstimator.MAX_INTERVAL_US:
+            self.reset()
+            self.__last_timestamp = timestamp
+            return True
+
+        self.__last_timestamp = timestamp
+        if self.__count == 0:
+            self.__add_interval(interval)
+            self.__update_estimate()
+            return True
+
+        expected = self.__estimated_interval
+        tolerance = expected * SpeedEstimator.OUTLIER_TOLERANCE
+        pending = self.__pending_interval
+        self.__pending_interval = 0
+        slowing_down = self.__slowing_down
+        self.__slowing_down = interval > expected + tolerance
+        if self.__slowing_down:
+            revolutions = int(interval / expected + 0.5)
+            if not slowing_down and revolutions <= SpeedEstimator.MAX_MISSED_PULSES + 1 and \
+                    abs(interval - revolutions * expected) <= tolerance:
+                # The estimate is kept until the next interval tells whether a pulse was missed
+                self.__pending_interval = interval
+                return True
+            # Consecutive long intervals (or one that missed pulses do not explain) mean the wheel slows down, so older
+            # intervals no longer describe the speed
+            self.__count = 0
+            self.__add_interval(interval)
+            self.__update_estimate()
+            return True
+
+        if pending > 0:
+            # The long interval was followed by a usual one, so it was made of revolutions with missed pulses
+            revolutions = int(pending / expected + 0.5)
+            for _ in range(revolutions):
+                self.__add_interval(pending // revolutions)
+        self.__add_interval(interval)
+        self.__update_estimate()
+        return True
+
+    def __add_interval(self, interval: int):
+        self.__intervals[self.__next_index] = interval
+        self.__next_index = (self.__next_index + 1) % SpeedEstimator.WINDOW_SIZE
+        if self.__count < SpeedEstimator.WINDOW_SIZE:
+            self.__count += 1
+
+    def __interval(self, age: int):
+        """
+        :param age: 0 for the newest interval
+        """
+        return self.__intervals[(self.__next_index - 1 - age) % SpeedEstimator.WINDOW_SIZE]
+
+    def __interval_speed(self, interval: float):
+        # Centimeters per microsecond multiplied by number of microseconds in hour divided by centimeters in kilometer
+        return self.__circumference / interval * ((1e6 * 3600) / 100000)
+
+    def __median(self, count: int):
+        """
+        :return: median of given number of the newest intervals
+        """
+        values = self.__sorted_intervals
+        # Insertion sort of a few values without allocations
+        for age in range(count):
+            value = self.__interval(age)
+            index = age
+            while index > 0 and values[index - 1] > value:
+                values[index] = values[index - 1]
+                index -= 1
+            values[index] = value
+        if count % 2 == 1:
+            return values[count // 2]
+        return (values[count // 2 - 1] + values[count // 2]) / 2
+
+    def __update_estimate(self):
+        count = 1
+        duration = self.__interval(0)
+        while count < self.__count and duration + self.__interval(count) <= SpeedEstimator.WINDOW_DURATION_US:
+            duration += self.__interval(count)
+            count += 1
+        median = self.__median(count)
+        tolerance = median * SpeedEstimator.OUTLIER_TOLERANCE
+
+        # Durations and numbers of valid intervals in the newer and the older half of the window
+        newer_count = older_count = 0
+        newer_duration = older_duration = 0
+        for age in range(count):
+            interval = self.__interval(age)
+            if abs(interval - median) > tolerance:
+                continue
+            if age < count // 2:
+                newer_count += 1
+                newer_duration += interval
+            else:
+                older_count += 1
+                older_duration += interval
+
+        if newer_count + older_count == 0:
+            self.__estimated_interval = median
+        else:
+            self.__estimated_interval = (newer_duration + older_duration) / (newer_count + older_count)
+        self.__speed = self.__interval_speed(self.__estimated_interval)
+
+        if newer_count == 0 or older_count == 0:
+            self.__acceleration = 0.
+            return
+        # Difference between speeds of the newer and the older half of the window divided by time between their middles
+        self.__acceleration = (
+            self.__interval_speed(newer_duration / newer_count) -
+            self.__interval_speed(older_duration / older_count)
+        ) / ((newer_duration + older_duration) / 2e6)
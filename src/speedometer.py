@@ -1,43 +1,58 @@
 import time
 
-# noinspection PyPackageRequirements
-from machine import Pin
+from src.ride_statistics import RideStatistics
+from src.speed_estimator import SpeedEstimator
+from src.wheel_capture import WheelPulseCapture
 
 
 class Speedometer:
     __IDLE_DURATION = 8
+    __SENSOR_PIN = 2
+    # Speed starts to decay when the next pulse is late by more than this number of revolutions at the current speed
+    # (so a single missed pulse does not change displayed speed) and then it is limited to the speed at which the wheel
+    # would have made this number of revolutions since the last pulse
+    __DECAY_REVOLUTIONS = 2.5
+    # Lower speed (in km/h) shown while decaying means the bike stopped (riding slower is hardly possible)
+    __MIN_DECAYED_SPEED = 4
 
     def __init__(self, circumference: float):
         """
         :param circumference: The circumference of the wheel in cm.
         """
         self.__circumference = circumference
-        self.__active = False
+        self.__estimator = SpeedEstimator(circumference)
+        self.__ride_statistics = RideStatistics()
         self.__current_speed = 0.0
-        self.__last_active_timestamp = None
-        self.__magnetic_sensor = Pin(2, Pin.IN, Pin.PULL_UP)
+        self.__wheel_pulses = WheelPulseCapture(Speedometer.__SENSOR_PIN)
 
     def update(self):
-        val = self.__magnetic_sensor.value()
-        if val == 0 and not self.__active:
-            self.__active = True
-            self.__on_sensor_active()
-        elif val == 1 and self.__active:
-            self.__active = False
-        elif self.__last_active_timestamp is not None and \
-                time.ticks_diff(time.ticks_us(), self.__last_active_timestamp) > \
-                Speedometer.__IDLE_DURATION * 1e6:
-            self.__current_speed = 0
-
-    def __on_sensor_active(self):
-        timestamp = time.ticks_us()
-        time_diff = 0 if self.__last_active_timestamp is None else \
-            time.ticks_diff(timestamp, self.__last_active_timestamp)
-        if time_diff > 0:
-            centimeters_per_nanosecond = self.__circumference / float(time_diff)
-            # Multiply by number of microseconds in hour divided by number of centimeters in kilometer
-            self.__current_speed = centimeters_per_nanosecond * ((1e6 * 3600) / 100000)
-        self.__last_active_timestamp = timestamp
+        """
+        Processes wheel pulses captured since the previous update
+        """
+        for timestamp in self.__wheel_pulses.read():
+            previous_timestamp = self.__estimator.last_timestamp
+            # Speed is 0 when the interval is too long to be a revolution made in motion
+            if self.__estimator.add_pulse(timestamp) and previous_timestamp is not None and self.__estimator.speed > 0:
+                self.__ride_statistics.add_revolution(
+                    time.ticks_diff(timestamp, previous_timestamp), self.__estimator.speed
+                )
+
+        speed = self.__estimator.speed
+        last_active_timestamp = self.__estimator.last_timestamp
+        if last_active_timestamp is not None:
+            elapsed = time.ticks_diff(time.ticks_us(), last_active_timestamp)
+            # NOTE: speed in km/h equals circumference in cm multiplied by 36000 and divided by revolution time in us
+            if elapsed > Speedometer.__IDLE_DURATION * 1e6:
+                self.__estimator.reset()
+                speed = 0
+            elif speed * elapsed > Speedometer.__DECAY_REVOLUTIONS * self.__circumference * 36000:
+                # A faster wheel would have made that many revolutions since the last pulse, so speed is limited by
+                # elapsed time. The limit equals the current speed when decay starts and is rounded down to whole km/h
+                # (the way speed is displayed), so it decays continuously in visible steps.
+                speed = min(speed, int(Speedometer.__DECAY_REVOLUTIONS * self.__circumference * 36000 / elapsed))
+                if speed < Speedometer.__MIN_DECAYED_SPEED:
+                    speed = 0
+        self.__current_speed = speed
 
     @property
     def current_speed(self):
@@ -46,5 +61,17 @@ class Speedometer:
         """
         return self.__current_speed
 
+    @property
+    def ride_statistics(self):
+        return self.__ride_statistics
+
+    @property
+    def acceleration(self):
+        """
+        Returns the current acceleration in km/h per second.
+        """
+        return self.__estimator.acceleration
+
     def set_circumference(self, circumference: float):
         self.__circumference = circumference
+        self.__estimator.set_circumference(circumference)
@@ -0,0 +1,60 @@
+import array
+import time
+
+# noinspection PyPackageRequirements
+from machine import Pin
+
+
+class WheelPulseCapture:
+    """
+    Records timestamps of wheel sensor activations from pin interrupt into preallocated ring buffer, so magnet passes are
+    not missed regardless of how often the buffer is read
+    """
+    CAPACITY = 32
+    # Falling edges closer to the previous pulse are contact bounces of the sensor
+    # (a revolution of 223cm wheel at 100km/h takes 80ms)
+    LOCKOUT_US = 5000
+
+    def __init__(self, pin_id: int):
+        """
+        :param pin_id: input pin pulled down by the sensor while the magnet passes by
+        """
+        self.__timestamps = array.array('L', [0] * WheelPulseCapture.CAPACITY)
+        # Index of the next timestamp to write (modified only by the interrupt handler)
+        self.__head = 0
+        # Index of the next timestamp to read (modified only by the reader)
+        self.__tail = 0
+        self.__last_timestamp = time.ticks_us()
+        # Pulses rejected because the buffer was full
+        self.__dropped = 0
+
+        self.__pin = Pin(pin_id, Pin.IN, Pin.PULL_UP)
+        self.__pin.irq(handler=self.__on_falling_edge, trigger=Pin.IRQ_FALLING, hard=True)
+
+    def __on_falling_edge(self, _pin: Pin):
+        # NOTE: runs in hard interrupt context, so it must not allocate memory
+        timestamp = time.ticks_us()
+        if 0 <= time.ticks_diff(timestamp, self.__last_timestamp) < WheelPulseCapture.LOCKOUT_US:
+            return
+        self.__last_timestamp = timestamp
+
+        head = self.__head
+        next_head = (head + 1) % WheelPulseCapture.CAPACITY
+        if next_head == self.__tail:
+            self.__dropped += 1
+            return
+        self.__timestamps[head] = timestamp
+        self.__head = next_head
+
+    def read(self):
+        """
+        Yields ticks_us timestamps of captured pulses in order of arrival, releasing their slots of the buffer
+        """
+        if self.__dropped > 0:
+            print(f"Wheel pulse buffer overflow; dropped pulses: {self.__dropped}")
+            self.__dropped = 0
+
+        while self.__tail != self.__head:
+            timestamp = self.__timestamps[self.__tail]
+            self.__tail = (self.__tail + 1) % WheelPulseCapture.CAPACITY
+            yield timestamp